@@ -8,6 +8,14 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5  # Connections kept open per engine (sync and async each have one)
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed under burst load
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Reconnect before managed Postgres drops idle connections
+    DB_POOL_TIMEOUT_SECONDS: int = 30  # Wait for a free connection before erroring
+    DB_AUTO_MIGRATE: bool = False  # Run `alembic upgrade head` on startup instead of failing when behind
+
+    # Projection stat storage (migrations keep DECIMAL; apply with `python -m app.services.projection_storage`)
+    PROJECTION_FLOAT_STATS: bool = False  # Double precision instead of DECIMAL: faster loads, not exact decimals
 
     # Razzball API
     RAZZBALL_API_KEY: str
@@ -20,6 +28,29 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
 
+    # Uploads
+    MAX_UPLOAD_BYTES: int = 20 * 1024 * 1024  # Reject league files larger than 20 MB
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # Read uploads 1 MB at a time
+
+    # Background ingestion (POST /api/csv/jobs)
+    INGEST_WORKERS: int = 2  # Worker threads per process
+    INGEST_QUEUE_SIZE: int = 16  # Pending jobs before new ones are rejected with 503
+    INGEST_JOB_TIMEOUT_SECONDS: int = 900  # Queued/running jobs not updated for this long are marked failed
+
+    # Player matching
+    MATCH_WORKERS: int = 0  # >1 fuzzy-matches large ID-less uploads in a process pool
+    PARALLEL_MATCH_MIN_NAMES: int = 500  # Below this, pool startup costs more than it saves
+
+    # Scheduled projection sync (one worker per deployment holds the lease)
+    PROJECTION_SYNC_ENABLED: bool = False  # On in the deploy configs; off for local runs and scripts
+    PROJECTION_SYNC_INTERVAL_SECONDS: int = 3600
+    PROJECTION_SYNC_JITTER_SECONDS: int = 300  # Random +/- offset so replicas don't align
+    PROJECTION_SYNC_RETRIES: int = 3  # Per horizon, with exponential backoff
+    PROJECTION_SYNC_BACKOFF_SECONDS: int = 30
+    PROJECTION_SYNC_HORIZONS: str = "ros,weekly,daily"
+    PROJECTION_SNAPSHOT_CHECK_SECONDS: int = 30  # How often request workers look for a newer snapshot
+    PROJECTION_DAILY_RETENTION_DAYS: int = 28  # Older daily rows are rolled into weekly ones, then pruned
+
     # CORS
     FRONTEND_URL: str = "http://localhost:3000"
 
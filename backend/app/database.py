@@ -1,21 +1,80 @@
 """Database configuration and session management"""
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from typing import AsyncIterator, Set, Tuple
+from functools import lru_cache
+import ast
+import logging
+import os
+import threading
 from .config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
-# Create database engine
+# Alembic scripts (backend/migrations) - the app's schema source of truth
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+def async_database_url(url: str) -> str:
+    """
+    DATABASE_URL with the async driver swapped in (asyncpg / aiosqlite)
+
+    asyncpg doesn't understand libpq's sslmode, so it is passed on as ssl.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+
+    if backend in ('postgres', 'postgresql'):
+        parsed = parsed.set(drivername='postgresql+asyncpg')
+        if 'sslmode' in parsed.query:
+            sslmode = parsed.query['sslmode']
+            parsed = parsed.difference_update_query(['sslmode']).update_query_dict({'ssl': sslmode})
+    elif backend == 'sqlite':
+        parsed = parsed.set(drivername='sqlite+aiosqlite')
+    else:
+        raise ValueError(f"No async driver configured for {backend}")
+
+    return parsed.render_as_string(hide_password=False)
+
+
+def _pool_options(url: str) -> dict:
+    """Pool sizing from settings (SQLite keeps SQLAlchemy's own pool choice)"""
+    if make_url(url).get_backend_name() == 'sqlite':
+        return {}
+    return {
+        'pool_size': settings.DB_POOL_SIZE,
+        'max_overflow': settings.DB_MAX_OVERFLOW,
+        'pool_recycle': settings.DB_POOL_RECYCLE_SECONDS,
+        'pool_timeout': settings.DB_POOL_TIMEOUT_SECONDS,
+    }
+
+
+# Create database engine (ingest pipeline, background workers, CLI tools)
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
-    echo=settings.ENVIRONMENT == "development"
+    echo=settings.ENVIRONMENT == "development",
+    **_pool_options(settings.DATABASE_URL)
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for request handlers - DB waits don't block the event loop
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    pool_pre_ping=True,
+    echo=settings.ENVIRONMENT == "development",
+    **_pool_options(settings.DATABASE_URL)
+)
+
+# expire_on_commit=False so loaded objects stay readable after commit without a lazy load
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 # Base class for models
 Base = declarative_base()
 
@@ -29,30 +88,152 @@ def get_db():
         db.close()
 
 
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Dependency to get an async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
-    """Initialize database tables"""
+    """Create any missing tables directly (scripts and benchmarks - the app runs migrations instead)"""
     import app.models  # noqa
     Base.metadata.create_all(bind=engine)
 
 
+class SchemaOutOfDate(RuntimeError):
+    """Database is behind the code's migrations"""
+
+
+# One auto-migration at a time per process (SQLite has no advisory lock to do it in env.py)
+_upgrade_lock = threading.Lock()
+
+
+@lru_cache()
+def migration_revisions() -> Tuple[Set[str], Set[str]]:
+    """
+    (every revision, head revisions) from the migration scripts, read once per process
+
+    The scripts' `revision` / `down_revision` assignments are parsed
+    without importing alembic, which would add ~150 ms to every cold start.
+    """
+    revisions, parents = set(), set()
+    versions_dir = os.path.join(MIGRATIONS_DIR, 'versions')
+    for filename in sorted(os.listdir(versions_dir)):
+        if not filename.endswith('.py'):
+            continue
+        with open(os.path.join(versions_dir, filename)) as handle:
+            tree = ast.parse(handle.read(), filename)
+        values = {
+            node.targets[0].id: ast.literal_eval(node.value)
+            for node in tree.body
+            if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id in ('revision', 'down_revision')
+        }
+        revisions.add(values['revision'])
+        down = values.get('down_revision')
+        parents.update(down if isinstance(down, (tuple, list)) else [down] if down else [])
+    return revisions, revisions - parents
+
+
+def _current_revisions(connection) -> Set[str]:
+    """Revisions recorded in alembic_version (empty before the first migration)"""
+    if not inspect(connection).has_table('alembic_version'):
+        return set()
+    return {row[0] for row in connection.execute(text("SELECT version_num FROM alembic_version"))}
+
+
+def upgrade_schema() -> None:
+    """`alembic upgrade head` against DATABASE_URL (env.py serializes concurrent runs on PostgreSQL)"""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config()  # No alembic.ini, so the app's logging setup is left alone
+    config.set_main_option('script_location', MIGRATIONS_DIR)
+    command.upgrade(config, 'head')
+
+
+def check_schema(auto_migrate: bool = False) -> Set[str]:
+    """
+    Startup check that the database is at the latest migration
+
+    Reads alembic_version and compares it with the heads of the migration
+    scripts: a table lookup and one SELECT, no reflection of the models
+    or DDL, so machines booting together don't race each other. Schema
+    changes happen in the deploy's migrate step (`alembic upgrade head`).
+
+    A revision this code doesn't know about is assumed to be newer (a
+    deploy that migrated ahead of this machine). Migrations are additive,
+    so it only logs a warning.
+
+    Args:
+        auto_migrate: Upgrade instead of failing when the database is behind
+            (local development and single-instance deploys)
+
+    Returns:
+        The database's revisions after the check
+
+    Raises:
+        SchemaOutOfDate: Database is behind and auto_migrate is off
+    """
+    known, heads = migration_revisions()
+    with engine.connect() as conn:
+        current = _current_revisions(conn)
+
+    if current == heads:
+        return current
+
+    if current - known:
+        logger.warning(
+            f"Database schema is at unknown revision {', '.join(sorted(current - known))} "
+            f"(code expects {', '.join(sorted(heads))}), assuming newer"
+        )
+        return current
+
+    if not auto_migrate:
+        raise SchemaOutOfDate(
+            f"Database schema is at {', '.join(sorted(current)) or 'no revision'} but the code expects "
+            f"{', '.join(sorted(heads))}: run `alembic upgrade head` (or set DB_AUTO_MIGRATE=true)"
+        )
+
+    logger.info(f"Upgrading database schema from {', '.join(sorted(current)) or 'empty'} to {', '.join(sorted(heads))}")
+    with _upgrade_lock:
+        upgrade_schema()  # A no-op for whoever waited on the lock
+    return heads
+
+
 # UUID type that works with both PostgreSQL and SQLite
-from sqlalchemy import TypeDecorator, String
+from sqlalchemy import TypeDecorator, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID as PostgreSQLUUID
 import uuid
 
 
+@lru_cache(maxsize=65536)
+def _uuid_from_bytes(value: bytes) -> uuid.UUID:
+    """UUID for 16 stored bytes - cached, since the same league_id repeats on every roster row"""
+    return uuid.UUID(bytes=value)
+
+
+def _as_uuid(value) -> uuid.UUID:
+    if isinstance(value, uuid.UUID):
+        return value
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return _uuid_from_bytes(bytes(value))
+    return uuid.UUID(value)
+
+
 class GUID(TypeDecorator):
     """Platform-independent GUID type.
-    Uses PostgreSQL's UUID type, otherwise uses String(36).
+    Uses PostgreSQL's UUID type, otherwise 16 raw bytes (BLOB on SQLite).
+    Strings are accepted on the way in; UUID objects come back out.
     """
-    impl = String
+    impl = LargeBinary
     cache_ok = True
 
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
             return dialect.type_descriptor(PostgreSQLUUID(as_uuid=True))
         else:
-            return dialect.type_descriptor(String(36))
+            return dialect.type_descriptor(LargeBinary(16))
 
     def process_bind_param(self, value, dialect):
         if value is None:
@@ -60,13 +241,15 @@ class GUID(TypeDecorator):
         elif dialect.name == 'postgresql':
             return value
         else:
-            if isinstance(value, uuid.UUID):
-                return str(value)
-            return value
+            return _as_uuid(value).bytes
 
     def process_result_value(self, value, dialect):
         if value is None:
             return value
-        if isinstance(value, uuid.UUID):
-            return value
-        return uuid.UUID(value)
+        return _as_uuid(value)
+
+    def literal_processor(self, dialect):
+        if dialect.name == 'postgresql':
+            return super().literal_processor(dialect)
+        # Blob literal (SQLAlchemy has no generic binary literal rendering)
+        return lambda value: f"X'{_as_uuid(value).hex}'"
@@ -1,8 +1,11 @@
 """Main FastAPI application"""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.config import get_settings
-from app.database import init_db
+from app.database import check_schema, async_engine
+from app.services.ingest_queue import ingest_queue, fail_stale_jobs
+from app.services.projection_scheduler import projection_scheduler
 
 settings = get_settings()
 
@@ -20,13 +23,29 @@ app.add_middleware(
     allow_credentials=False,  # Must be False when using allow_origins=["*"]
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Server-Timing"],  # ETag for If-None-Match; per-stage chat timings
 )
 
-# Initialize database on startup
+# Compress larger responses (full rosters) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Check the schema on startup (migrations run in the deploy's release step)
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database tables on startup"""
-    init_db()
+    """Check the database is migrated, fail uploads orphaned by a restart and start the projection sync worker"""
+    check_schema(auto_migrate=settings.DB_AUTO_MIGRATE)
+    fail_stale_jobs()
+    if settings.PROJECTION_SYNC_ENABLED:
+        projection_scheduler.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Let queued background uploads finish, stop the projection sync worker and close pooled connections"""
+    ingest_queue.stop()
+    if settings.PROJECTION_SYNC_ENABLED:
+        projection_scheduler.stop()
+    await async_engine.dispose()
 
 
 # Root endpoint
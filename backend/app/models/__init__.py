@@ -3,8 +3,10 @@ from .user import User
 from .league import League
 from .player import Player
 from .roster import Roster
-from .projection import ProjectionDaily, ProjectionWeekly, ProjectionROS
+from .projection import ProjectionDaily, ProjectionWeekly, ProjectionROS, ProjectionLatest
 from .api_key import APIKey
+from .ingest_job import IngestJob
+from .sync_state import SyncLock, ProjectionSnapshot, DataVersion
 
 __all__ = [
     "User",
@@ -14,5 +16,10 @@ __all__ = [
     "ProjectionDaily",
     "ProjectionWeekly",
     "ProjectionROS",
+    "ProjectionLatest",
     "APIKey",
+    "IngestJob",
+    "SyncLock",
+    "ProjectionSnapshot",
+    "DataVersion",
 ]
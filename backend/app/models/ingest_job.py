@@ -0,0 +1,29 @@
+"""Ingest job model - background CSV uploads"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from datetime import datetime
+import uuid
+
+from app.database import Base, GUID
+
+
+class IngestJob(Base):
+    """Background league ingestion job (status lives in the DB so any worker can report it)"""
+
+    __tablename__ = "ingest_jobs"
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    status = Column(String(20), nullable=False, default="queued")  # 'queued', 'running', 'succeeded', 'failed'
+    csv_filename = Column(String(255))
+
+    # Progress
+    rows_parsed = Column(Integer, nullable=False, default=0)
+    rows_matched = Column(Integer, nullable=False, default=0)
+    rows_inserted = Column(Integer, nullable=False, default=0)
+
+    # Outcome
+    league_id = Column(GUID, ForeignKey("leagues.id"))
+    result = Column(Text)  # LeagueResponse JSON once succeeded
+    error = Column(Text)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -1,5 +1,5 @@
 """League model"""
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -15,6 +15,8 @@ class League(Base):
     user_id = Column(GUID, ForeignKey("users.id"), nullable=False)
     league_type = Column(String(20), nullable=False)  # 'fantrax', 'cbs', 'nfbc'
     csv_filename = Column(String(255))
+    content_hash = Column(String(64), unique=True, index=True)  # sha256 of the uploaded bytes
+    roster_version = Column(Integer, nullable=False, default=1)  # Bumped whenever its rosters change (roster ETags)
     uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
@@ -28,3 +28,4 @@ class Player(Base):
     projections_daily = relationship("ProjectionDaily", back_populates="player")
     projections_weekly = relationship("ProjectionWeekly", back_populates="player")
     projections_ros = relationship("ProjectionROS", back_populates="player")
+    projection_latest = relationship("ProjectionLatest", back_populates="player", uselist=False)
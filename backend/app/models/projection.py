@@ -1,10 +1,23 @@
-"""Projection models"""
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, DECIMAL, UniqueConstraint
+"""Projection models
+
+Stats are DECIMAL by default. With PROJECTION_FLOAT_STATS they are native
+floats (double precision on PostgreSQL) instead, so they load as Python
+floats rather than Decimals and go straight into NumPy arrays.
+"""
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, DECIMAL, Float, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
+from app.config import get_settings
 from app.database import Base
 
+settings = get_settings()
+
+
+def stat(precision: int, scale: int):
+    """Stat column type: DECIMAL(precision, scale), or a native float with PROJECTION_FLOAT_STATS"""
+    return Float() if settings.PROJECTION_FLOAT_STATS else DECIMAL(precision, scale)
+
 
 class ProjectionDaily(Base):
     """Daily projections"""
@@ -16,27 +29,27 @@ class ProjectionDaily(Base):
     date = Column(Date, nullable=False)
 
     # Batting stats
-    pa = Column(DECIMAL(5, 2))   # Plate appearances
-    ab = Column(DECIMAL(5, 2))   # At bats
-    h = Column(DECIMAL(5, 2))    # Hits
-    r = Column(DECIMAL(5, 2))    # Runs
-    hr = Column(DECIMAL(5, 2))   # Home runs
-    rbi = Column(DECIMAL(5, 2))  # RBIs
-    sb = Column(DECIMAL(5, 2))   # Stolen bases
-    bb = Column(DECIMAL(5, 2))   # Walks
-    so = Column(DECIMAL(5, 2))   # Strikeouts
-    avg = Column(DECIMAL(5, 3))  # Batting average
-    obp = Column(DECIMAL(5, 3))  # On-base percentage
-    slg = Column(DECIMAL(5, 3))  # Slugging percentage
+    pa = Column(stat(5, 2))   # Plate appearances
+    ab = Column(stat(5, 2))   # At bats
+    h = Column(stat(5, 2))    # Hits
+    r = Column(stat(5, 2))    # Runs
+    hr = Column(stat(5, 2))   # Home runs
+    rbi = Column(stat(5, 2))  # RBIs
+    sb = Column(stat(5, 2))   # Stolen bases
+    bb = Column(stat(5, 2))   # Walks
+    so = Column(stat(5, 2))   # Strikeouts
+    avg = Column(stat(5, 3))  # Batting average
+    obp = Column(stat(5, 3))  # On-base percentage
+    slg = Column(stat(5, 3))  # Slugging percentage
 
     # Pitching stats (for pitchers)
-    ip = Column(DECIMAL(5, 2))   # Innings pitched
-    k = Column(DECIMAL(5, 2))    # Strikeouts (pitching)
-    w = Column(DECIMAL(5, 2))    # Wins
-    l = Column(DECIMAL(5, 2))    # Losses
-    sv = Column(DECIMAL(5, 2))   # Saves
-    era = Column(DECIMAL(5, 2))  # ERA
-    whip = Column(DECIMAL(5, 2)) # WHIP
+    ip = Column(stat(5, 2))   # Innings pitched
+    k = Column(stat(5, 2))    # Strikeouts (pitching)
+    w = Column(stat(5, 2))    # Wins
+    l = Column(stat(5, 2))    # Losses
+    sv = Column(stat(5, 2))   # Saves
+    era = Column(stat(5, 2))  # ERA
+    whip = Column(stat(5, 2)) # WHIP
 
     fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
@@ -44,7 +57,10 @@ class ProjectionDaily(Base):
     player = relationship("Player", back_populates="projections_daily")
 
     __table_args__ = (
+        # Also the (player_id, date) index for per-player history, scanned either direction
         UniqueConstraint('player_id', 'date', name='unique_daily_projection'),
+        # Retention rollups/pruning scan by date across players
+        Index('ix_projections_daily_date', 'date'),
     )
 
 
@@ -58,27 +74,27 @@ class ProjectionWeekly(Base):
     week_start = Column(Date, nullable=False)
 
     # Same stats as daily
-    pa = Column(DECIMAL(6, 2))
-    ab = Column(DECIMAL(6, 2))
-    h = Column(DECIMAL(6, 2))
-    r = Column(DECIMAL(6, 2))
-    hr = Column(DECIMAL(6, 2))
-    rbi = Column(DECIMAL(6, 2))
-    sb = Column(DECIMAL(6, 2))
-    bb = Column(DECIMAL(6, 2))
-    so = Column(DECIMAL(6, 2))
-    avg = Column(DECIMAL(5, 3))
-    obp = Column(DECIMAL(5, 3))
-    slg = Column(DECIMAL(5, 3))
+    pa = Column(stat(6, 2))
+    ab = Column(stat(6, 2))
+    h = Column(stat(6, 2))
+    r = Column(stat(6, 2))
+    hr = Column(stat(6, 2))
+    rbi = Column(stat(6, 2))
+    sb = Column(stat(6, 2))
+    bb = Column(stat(6, 2))
+    so = Column(stat(6, 2))
+    avg = Column(stat(5, 3))
+    obp = Column(stat(5, 3))
+    slg = Column(stat(5, 3))
 
     # Pitching
-    ip = Column(DECIMAL(6, 2))
-    k = Column(DECIMAL(6, 2))
-    w = Column(DECIMAL(5, 2))
-    l = Column(DECIMAL(5, 2))
-    sv = Column(DECIMAL(5, 2))
-    era = Column(DECIMAL(5, 2))
-    whip = Column(DECIMAL(5, 2))
+    ip = Column(stat(6, 2))
+    k = Column(stat(6, 2))
+    w = Column(stat(5, 2))
+    l = Column(stat(5, 2))
+    sv = Column(stat(5, 2))
+    era = Column(stat(5, 2))
+    whip = Column(stat(5, 2))
 
     fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
@@ -100,27 +116,27 @@ class ProjectionROS(Base):
     season = Column(Integer, nullable=False)
 
     # Same stats as daily/weekly
-    pa = Column(DECIMAL(7, 2))
-    ab = Column(DECIMAL(7, 2))
-    h = Column(DECIMAL(7, 2))
-    r = Column(DECIMAL(7, 2))
-    hr = Column(DECIMAL(7, 2))
-    rbi = Column(DECIMAL(7, 2))
-    sb = Column(DECIMAL(7, 2))
-    bb = Column(DECIMAL(7, 2))
-    so = Column(DECIMAL(7, 2))
-    avg = Column(DECIMAL(5, 3))
-    obp = Column(DECIMAL(5, 3))
-    slg = Column(DECIMAL(5, 3))
+    pa = Column(stat(7, 2))
+    ab = Column(stat(7, 2))
+    h = Column(stat(7, 2))
+    r = Column(stat(7, 2))
+    hr = Column(stat(7, 2))
+    rbi = Column(stat(7, 2))
+    sb = Column(stat(7, 2))
+    bb = Column(stat(7, 2))
+    so = Column(stat(7, 2))
+    avg = Column(stat(5, 3))
+    obp = Column(stat(5, 3))
+    slg = Column(stat(5, 3))
 
     # Pitching
-    ip = Column(DECIMAL(7, 2))
-    k = Column(DECIMAL(7, 2))
-    w = Column(DECIMAL(5, 2))
-    l = Column(DECIMAL(5, 2))
-    sv = Column(DECIMAL(5, 2))
-    era = Column(DECIMAL(5, 2))
-    whip = Column(DECIMAL(5, 2))
+    ip = Column(stat(7, 2))
+    k = Column(stat(7, 2))
+    w = Column(stat(5, 2))
+    l = Column(stat(5, 2))
+    sv = Column(stat(5, 2))
+    era = Column(stat(5, 2))
+    whip = Column(stat(5, 2))
 
     fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
@@ -130,3 +146,40 @@ class ProjectionROS(Base):
     __table_args__ = (
         UniqueConstraint('player_id', 'season', name='unique_ros_projection'),
     )
+
+
+class ProjectionLatest(Base):
+    """Newest daily projection per player - kept in step with projections_daily on every sync"""
+
+    __tablename__ = "projections_latest"
+
+    player_id = Column(Integer, ForeignKey("players.id"), primary_key=True)
+    date = Column(Date, nullable=False)  # Day of the projections_daily row mirrored here
+
+    # Same stats as daily
+    pa = Column(stat(5, 2))
+    ab = Column(stat(5, 2))
+    h = Column(stat(5, 2))
+    r = Column(stat(5, 2))
+    hr = Column(stat(5, 2))
+    rbi = Column(stat(5, 2))
+    sb = Column(stat(5, 2))
+    bb = Column(stat(5, 2))
+    so = Column(stat(5, 2))
+    avg = Column(stat(5, 3))
+    obp = Column(stat(5, 3))
+    slg = Column(stat(5, 3))
+
+    # Pitching
+    ip = Column(stat(5, 2))
+    k = Column(stat(5, 2))
+    w = Column(stat(5, 2))
+    l = Column(stat(5, 2))
+    sv = Column(stat(5, 2))
+    era = Column(stat(5, 2))
+    whip = Column(stat(5, 2))
+
+    fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    player = relationship("Player", back_populates="projection_latest")
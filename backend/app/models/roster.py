@@ -1,5 +1,5 @@
 """Roster model"""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -21,3 +21,8 @@ class Roster(Base):
     # Relationships
     league = relationship("League", back_populates="rosters")
     player = relationship("Player", back_populates="rosters")
+
+    __table_args__ = (
+        # Roster reads filter by league (and often owner) and join players - covered by one index
+        Index('ix_rosters_league_owner_player', 'league_id', 'team_owner', 'player_id'),
+    )
@@ -0,0 +1,35 @@
+"""Sync state models - background sync lease, published projection snapshots and data versions"""
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from datetime import datetime
+
+from app.database import Base
+
+
+class SyncLock(Base):
+    """Time-limited lease so only one worker per deployment runs a given sync"""
+
+    __tablename__ = "sync_locks"
+
+    name = Column(String(50), primary_key=True)  # e.g. 'projection_sync'
+    owner = Column(String(255), nullable=False)  # host:pid:nonce of the holder
+    expires_at = Column(DateTime, nullable=False)
+
+
+class ProjectionSnapshot(Base):
+    """Latest raw Razzball feed per horizon, shared by every worker"""
+
+    __tablename__ = "projection_snapshots"
+
+    horizon = Column(String(10), primary_key=True)  # 'daily', 'weekly', 'ros'
+    version = Column(Integer, nullable=False, default=1)  # Bumped on every publish
+    payload = Column(Text, nullable=False)  # Records JSON, same shape as the API response
+    fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class DataVersion(Base):
+    """Change counter for a derived table, so readers can tell when it was rewritten (e.g. roster ETags)"""
+
+    __tablename__ = "data_versions"
+
+    name = Column(String(50), primary_key=True)  # Table name, e.g. 'projections_latest'
+    version = Column(Integer, nullable=False, default=0)  # Bumped in the same transaction as every write
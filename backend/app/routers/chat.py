@@ -1,21 +1,153 @@
 """Chat Router - GPT-4 Powered Fantasy Baseball Assistant"""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.models import League, Roster
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.models import League, Roster, Player
 from app.services.openai_service import OpenAIService
-from app.services.projection_service import ProjectionService
+from app.services.context_cache import context_cache
 from app.schemas.chat import ChatRequest, ChatResponse
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
 import logging
+import time
+import uuid
+
+if TYPE_CHECKING:
+    # Imported on first use in _build_context (pandas, requests and cloudscraper)
+    from app.services.projection_service import ProjectionService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _with_projection(player: Dict, projection_service: 'ProjectionService') -> Dict:
+    """Copy of a roster entry enriched with its Razzball projection (API uses $STAT$ format for category dollars)"""
+    player = dict(player)
+    proj = projection_service.get_player_projection(player['name'])
+
+    if proj:
+        # Overall dollar value
+        player['dollar_value'] = proj.get('$')
+        # Category dollar values (for 5x5 analysis)
+        player['$R'] = proj.get('$R$')
+        player['$HR'] = proj.get('$HR$')
+        player['$RBI'] = proj.get('$RBI$')
+        player['$SB'] = proj.get('$SB$')
+        player['$AVG'] = proj.get('$AVG$')
+        player['$W'] = proj.get('$W$')
+        player['$SV'] = proj.get('$SV$')
+        player['$K'] = proj.get('$K$')
+        player['$ERA'] = proj.get('$ERA$')
+        player['$WHIP'] = proj.get('$WHIP$')
+        # Raw stat projections
+        player['hr'] = proj.get('HR')
+        player['rbi'] = proj.get('RBI')
+        player['sb'] = proj.get('SB')
+        player['avg'] = proj.get('AVG')
+        player['r'] = proj.get('R')
+        player['era'] = proj.get('ERA')
+        player['whip'] = proj.get('WHIP')
+        player['w'] = proj.get('W')
+        player['sv'] = proj.get('SV')
+        player['k'] = proj.get('K')
+        player['has_projections'] = True
+    else:
+        player['has_projections'] = False
+
+    return player
+
+
+def _enriched_group(
+    league_id: uuid.UUID,
+    owner: str,
+    players: List[Dict],
+    projection_service: 'ProjectionService'
+) -> List[Dict]:
+    """One owner's players with projections, reusing the context cache when the roster is unchanged"""
+    enriched = context_cache.get(league_id, owner, players)
+    if enriched is None:
+        enriched = [_with_projection(player, projection_service) for player in players]
+        matched = sum(1 for player in enriched if player['has_projections'])
+        logger.info(f"Matched projections for {matched}/{len(enriched)} players of {owner}")
+        context_cache.set(league_id, owner, players, enriched)
+    return enriched
+
+
+def _build_context(league_id: uuid.UUID, league_type: str, all_rosters: Sequence[Tuple]) -> Dict:
+    """
+    AI context for a league: owned players and top free agents with projections
+
+    Blocking (projection fetch / snapshot read), so the chat handler runs it
+    in the threadpool.
+
+    Args:
+        league_id: League the rosters belong to
+        league_type: 'fantrax', 'cbs' or 'nfbc'
+        all_rosters: (team_owner, name, team, position) rows in roster order
+    """
+    # Group by owner - projection enrichment is cached per (league, owner)
+    by_owner: Dict[str, List[Dict]] = {}
+    for team_owner, name, team, position in all_rosters:
+        player_data = {
+            'name': name,
+            'mlb_team': team,
+            'position': position,
+            'owner': team_owner,
+        }
+        by_owner.setdefault(team_owner, []).append(player_data)
+
+    free_agents_db = by_owner.pop('Free Agent', [])
+
+    from app.services.projection_service import ProjectionService
+
+    # Fetch latest projections from Razzball API
+    projection_service = ProjectionService()
+    try:
+        projections_df = projection_service.fetch_projections()
+        logger.info(f"Fetched {len(projections_df)} projections from Razzball API")
+
+        enriched_by_owner = {
+            owner: iter(_enriched_group(league_id, owner, players, projection_service))
+            for owner, players in by_owner.items()
+        }
+
+        # Enrich free agents with projections (top 50 only for context)
+        free_agents = _enriched_group(league_id, 'Free Agent', free_agents_db[:50], projection_service)
+
+    except Exception as e:
+        logger.warning(f"Could not fetch projections: {str(e)}. Proceeding without projections.")
+        enriched_by_owner = {owner: iter(players) for owner, players in by_owner.items()}
+        free_agents = free_agents_db[:50]
+
+    # Owned players, back in database order
+    user_roster = [
+        next(enriched_by_owner[team_owner])
+        for team_owner, *_ in all_rosters
+        if team_owner != 'Free Agent'
+    ]
+
+    return {
+        'my_roster': user_roster,
+        'free_agents': free_agents,
+        'league_info': {
+            'league_type': league_type,
+            'total_players': len(all_rosters),
+            'free_agents': len(free_agents_db)
+        }
+    }
+
+
+def _server_timing(stages: Dict[str, float]) -> str:
+    """Server-Timing header value (stage name -> seconds)"""
+    return ", ".join(f"{name};dur={seconds * 1000:.1f}" for name, seconds in stages.items())
+
+
 @router.post("/", response_model=ChatResponse)
 async def chat(
     request: ChatRequest,
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Chat with GPT-4 AI assistant about fantasy baseball roster
@@ -23,130 +155,45 @@ async def chat(
     Requires:
     - league_id: UUID of uploaded league
     - message: User's question
+
+    The Server-Timing header splits the request into db (league and
+    rosters), context (projection enrichment) and llm (completion).
     """
+    stages: Dict[str, float] = {}
+    started = time.perf_counter()
     try:
-        # Get league
-        league = db.query(League).filter(League.id == request.league_id).first()
+        # Get league type (a plain row, not an instance tied to the session)
+        league = (await db.execute(
+            select(League.league_type).where(League.id == request.league_id)
+        )).first()
         if not league:
             raise HTTPException(status_code=404, detail="League not found")
 
-        # Get user's roster and free agents from database
-        all_rosters = db.query(Roster).filter(Roster.league_id == request.league_id).all()
-
-        user_roster = []
-        free_agents_db = []
-
-        for roster in all_rosters:
-            player = roster.player
-
-            player_data = {
-                'name': player.name,
-                'mlb_team': player.team,
-                'position': player.position,
-                'owner': roster.team_owner,
-            }
-
-            if roster.team_owner == 'Free Agent':
-                free_agents_db.append(player_data)
-            else:
-                user_roster.append(player_data)
-
-        # Fetch latest projections from Razzball API
-        projection_service = ProjectionService()
-        try:
-            projections_df = projection_service.fetch_projections()
-            logger.info(f"Fetched {len(projections_df)} projections from Razzball API")
-
-            # Enrich roster with projections (API uses $STAT$ format for category dollars)
-            for player in user_roster:
-                proj = projection_service.get_player_projection(player['name'])
-                if proj:
-                    # Overall dollar value
-                    player['dollar_value'] = proj.get('$')
-                    # Category dollar values (for 5x5 analysis)
-                    player['$R'] = proj.get('$R$')
-                    player['$HR'] = proj.get('$HR$')
-                    player['$RBI'] = proj.get('$RBI$')
-                    player['$SB'] = proj.get('$SB$')
-                    player['$AVG'] = proj.get('$AVG$')
-                    player['$W'] = proj.get('$W$')
-                    player['$SV'] = proj.get('$SV$')
-                    player['$K'] = proj.get('$K$')
-                    player['$ERA'] = proj.get('$ERA$')
-                    player['$WHIP'] = proj.get('$WHIP$')
-                    # Raw stat projections
-                    player['hr'] = proj.get('HR')
-                    player['rbi'] = proj.get('RBI')
-                    player['sb'] = proj.get('SB')
-                    player['avg'] = proj.get('AVG')
-                    player['r'] = proj.get('R')
-                    player['era'] = proj.get('ERA')
-                    player['whip'] = proj.get('WHIP')
-                    player['w'] = proj.get('W')
-                    player['sv'] = proj.get('SV')
-                    player['k'] = proj.get('K')
-                    player['has_projections'] = True
-                else:
-                    player['has_projections'] = False
-
-            # Enrich free agents with projections (top 50 only for context)
-            free_agents = []
-            for player in free_agents_db[:50]:
-                proj = projection_service.get_player_projection(player['name'])
-                if proj:
-                    # Overall dollar value
-                    player['dollar_value'] = proj.get('$')
-                    # Category dollar values (for 5x5 analysis)
-                    player['$R'] = proj.get('$R$')
-                    player['$HR'] = proj.get('$HR$')
-                    player['$RBI'] = proj.get('$RBI$')
-                    player['$SB'] = proj.get('$SB$')
-                    player['$AVG'] = proj.get('$AVG$')
-                    player['$W'] = proj.get('$W$')
-                    player['$SV'] = proj.get('$SV$')
-                    player['$K'] = proj.get('$K$')
-                    player['$ERA'] = proj.get('$ERA$')
-                    player['$WHIP'] = proj.get('$WHIP$')
-                    # Raw stat projections
-                    player['hr'] = proj.get('HR')
-                    player['rbi'] = proj.get('RBI')
-                    player['sb'] = proj.get('SB')
-                    player['avg'] = proj.get('AVG')
-                    player['r'] = proj.get('R')
-                    player['era'] = proj.get('ERA')
-                    player['whip'] = proj.get('WHIP')
-                    player['w'] = proj.get('W')
-                    player['sv'] = proj.get('SV')
-                    player['k'] = proj.get('K')
-                    player['has_projections'] = True
-                    logger.info(f"Matched projection for {player['name']}: ${proj.get('$')}")
-                else:
-                    player['has_projections'] = False
-                    logger.warning(f"No projection match for {player['name']}")
-                free_agents.append(player)
-
-        except Exception as e:
-            logger.warning(f"Could not fetch projections: {str(e)}. Proceeding without projections.")
-            free_agents = free_agents_db[:50]
+        # Get user's roster and free agents from database (players joined in, not lazy-loaded)
+        all_rosters = (await db.execute(
+            select(Roster.team_owner, Player.name, Player.team, Player.position)
+            .join(Player, Roster.player_id == Player.id)
+            .where(Roster.league_id == request.league_id)
+            .order_by(Roster.id)
+        )).all()
+        # Hand the pooled connection back before the slow context and LLM stages
+        await db.close()
+        stages['db'] = time.perf_counter() - started
 
         # Build context for AI
-        context_data = {
-            'my_roster': user_roster,
-            'free_agents': free_agents,
-            'league_info': {
-                'league_type': league.league_type,
-                'total_players': len(all_rosters),
-                'free_agents': len(free_agents_db)
-            }
-        }
+        context_data = await run_in_threadpool(_build_context, request.league_id, league.league_type, all_rosters)
+        stages['context'] = time.perf_counter() - started - stages['db']
 
-        # Get AI response
+        # Get AI response (blocking client call - keep it off the event loop)
         openai_service = OpenAIService()
-        ai_response = openai_service.get_chat_completion(
+        ai_response = await run_in_threadpool(
+            openai_service.get_chat_completion,
             user_message=request.message,
             conversation_history=request.conversation_history if hasattr(request, 'conversation_history') else None,
             context_data=context_data
         )
+        stages['llm'] = time.perf_counter() - started - stages['db'] - stages['context']
+        response.headers['Server-Timing'] = _server_timing(stages)
 
         return ChatResponse(
             message=request.message,
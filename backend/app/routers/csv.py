@@ -1,18 +1,81 @@
 """CSV Upload Router"""
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Float, Row, Select, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.database import get_db
-from app.models import User, League, Roster
-from app.services.csv_parser import CSVParser
-from app.services.player_matcher import PlayerMatcher
-from app.schemas.league import LeagueResponse, RosterResponse, PlayerInRoster
+from app.config import get_settings
+from app.database import get_db, get_async_db
+from app.models import League, Roster, Player, ProjectionLatest, DataVersion, IngestJob
+from app.services.ingest_queue import ingest_queue, is_stale, STALE_ERROR
+from app.services.roster_pagination import (
+    MAX_PAGE_SIZE, PageError, resolve_order, parse_fields, order_page, page_cursor
+)
+from app.schemas.league import (
+    LeagueResponse, RosterResponse, PlayerInRoster, IngestJobResponse, RosterDiffResponse
+)
+from typing import Dict, Iterable, Optional, Set, Tuple
+import hashlib
 import uuid
-import tempfile
-import os
+import io
 
+settings = get_settings()
 router = APIRouter()
 
 
+async def _read_upload(file: UploadFile) -> Tuple[io.BytesIO, str]:
+    """
+    Read an upload into an in-memory buffer in fixed-size chunks
+
+    Only the buffer holds the file bytes; each chunk is released once copied in
+    (and fed to the content hash on the way). Raises 413 as soon as the
+    running total passes MAX_UPLOAD_BYTES.
+
+    Returns:
+        (buffer positioned at 0, sha256 hex digest of the file)
+    """
+    buffer = io.BytesIO()
+    digest = hashlib.sha256()
+    total = 0
+
+    while True:
+        chunk = await file.read(settings.UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+
+        total += len(chunk)
+        if total > settings.MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large (max {settings.MAX_UPLOAD_BYTES // (1024 * 1024)} MB)"
+            )
+        buffer.write(chunk)
+        digest.update(chunk)
+
+    buffer.seek(0)
+    return buffer, digest.hexdigest()
+
+
+def _ingest_upload(db: Session, buffer: io.BytesIO, filename: str, content_hash: str) -> LeagueResponse:
+    """Existing league for a duplicate upload, otherwise the full ingest (runs in the threadpool)"""
+    # The ingest pipeline (pandas, fuzzywuzzy) loads on the first upload, not at startup
+    from app.services.league_ingest import ingest_league, league_summary, find_duplicate
+
+    existing = find_duplicate(db, content_hash)
+    if existing:
+        return league_summary(db, existing, deduplicated=True)
+
+    return ingest_league(db, buffer, filename, content_hash=content_hash)
+
+
+def _reingest_upload(db: Session, league: League, buffer: io.BytesIO, filename: str) -> RosterDiffResponse:
+    """Apply a re-uploaded file to an existing league (runs in the threadpool)"""
+    from app.services.league_ingest import reingest_league
+
+    return reingest_league(db, league, buffer, filename)
+
+
 @router.post("/upload", response_model=LeagueResponse)
 async def upload_csv(
     file: UploadFile = File(...),
@@ -23,147 +86,323 @@ async def upload_csv(
 
     Accepts CSV from Fantrax, CBS Sports, or NFBC
     Auto-detects format and parses roster
+
+    Re-uploading a file with identical bytes returns the existing league
+    (deduplicated=true) without parsing or storing anything.
     """
     # Validate file type
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
-        tmp_file_path = tmp_file.name
+    # Read upload into memory (no temp file on disk)
+    buffer, content_hash = await _read_upload(file)
 
     try:
-        # Parse CSV
-        parser = CSVParser()
-        players_data, league_type = parser.parse_csv(tmp_file_path)
-
-        # Create or get user (for now, create a new one each time)
-        user = User()
-        db.add(user)
-        db.flush()
-
-        # Create league record
-        league = League(
-            id=uuid.uuid4(),
-            user_id=user.id,
-            league_type=league_type,
-            csv_filename=file.filename
-        )
-        db.add(league)
-        db.flush()
-
-        # Match and store players (optimized with bulk inserts)
-        matcher = PlayerMatcher(db)
-        owned_count = 0
-        free_agent_count = 0
-        roster_entries = []
-
-        for player_data in players_data:
-            # Get or create player
-            player = matcher.get_or_create_player(player_data)
-
-            # Create roster entry object (don't add to session yet)
-            roster = Roster(
-                league_id=league.id,
-                player_id=player.id,
-                team_owner=player_data['owner'],
-                status=player_data.get('status')
-            )
-            roster_entries.append(roster)
+        # Parsing, matching and the bulk insert are blocking - keep them off the event loop
+        return await run_in_threadpool(_ingest_upload, db, buffer, file.filename, content_hash)
 
-            if player_data['owner'] == 'Free Agent':
-                free_agent_count += 1
-            else:
-                owned_count += 1
+    except ValueError as e:
+        # Unrecognized or malformed file (pandas parser errors are ValueErrors too)
+        await run_in_threadpool(db.rollback)
+        raise HTTPException(status_code=400, detail=f"Invalid CSV: {str(e)}")
 
-        # Bulk insert all roster entries at once (much faster)
-        db.bulk_save_objects(roster_entries)
-        db.commit()
+    except Exception as e:
+        await run_in_threadpool(db.rollback)
+        raise HTTPException(status_code=500, detail=f"Error processing CSV: {str(e)}")
+
+    finally:
+        buffer.close()
 
-        # Return response
-        return LeagueResponse(
-            id=league.id,
-            league_type=league_type,
-            total_players=len(players_data),
-            owned_players=owned_count,
-            free_agents=free_agent_count,
-            uploaded_at=league.uploaded_at
-        )
+
+@router.post("/{league_id}/upload", response_model=RosterDiffResponse)
+async def reupload_csv(
+    league_id: uuid.UUID,
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db)
+):
+    """
+    Re-upload the CSV for an existing league
+
+    Diffs the new file against the stored rosters and applies only the
+    adds, drops and owner changes. The file must be from the same platform.
+    """
+    if not file.filename.endswith('.csv'):
+        raise HTTPException(status_code=400, detail="File must be a CSV")
+
+    league = await run_in_threadpool(db.get, League, league_id)
+    if not league:
+        raise HTTPException(status_code=404, detail="League not found")
+
+    buffer, _ = await _read_upload(file)
+
+    try:
+        return await run_in_threadpool(_reingest_upload, db, league, buffer, file.filename)
+
+    except ValueError as e:
+        await run_in_threadpool(db.rollback)
+        raise HTTPException(status_code=400, detail=f"Invalid CSV: {str(e)}")
 
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=500, detail=f"Error processing CSV: {str(e)}")
 
     finally:
-        # Clean up temp file
-        os.unlink(tmp_file_path)
+        buffer.close()
+
+
+def _job_response(job: IngestJob) -> IngestJobResponse:
+    """Job status, with the final LeagueResponse once the job succeeded"""
+    return IngestJobResponse(
+        id=job.id,
+        status=job.status,
+        csv_filename=job.csv_filename,
+        rows_parsed=job.rows_parsed,
+        rows_matched=job.rows_matched,
+        rows_inserted=job.rows_inserted,
+        league=LeagueResponse.model_validate_json(job.result) if job.result else None,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at
+    )
+
+
+def _queue_upload(db: Session, buffer: io.BytesIO, filename: str, content_hash: str) -> IngestJobResponse:
+    """Record a job and hand the file to the ingest queue (runs in the threadpool)"""
+    from app.services.league_ingest import league_summary, find_duplicate
+
+    existing = find_duplicate(db, content_hash)
+    if existing:
+        buffer.close()
+        job = IngestJob(
+            csv_filename=filename,
+            status="succeeded",
+            league_id=existing.id,
+            result=league_summary(db, existing, deduplicated=True).model_dump_json()
+        )
+        db.add(job)
+        db.commit()
+        return _job_response(job)
+
+    job = IngestJob(csv_filename=filename)
+    db.add(job)
+    db.commit()
+
+    if not ingest_queue.submit(job.id, buffer, filename, content_hash):
+        buffer.close()
+        job.status = "failed"
+        job.error = "Ingest queue is full"
+        db.commit()
+        raise HTTPException(status_code=503, detail="Too many uploads in progress, please retry shortly")
+
+    return _job_response(job)
+
+
+@router.post("/jobs", response_model=IngestJobResponse, status_code=202)
+async def create_upload_job(
+    response: Response,
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db)
+):
+    """
+    Upload league CSV file for background processing
+
+    Returns a job immediately; poll GET /jobs/{job_id} for progress and
+    the final league. Use this for large files that would otherwise hit
+    proxy timeouts on /upload.
+
+    A file that was already uploaded gets a job that has already
+    succeeded, pointing at the existing league, with 200 instead of 202.
+    """
+    if not file.filename.endswith('.csv'):
+        raise HTTPException(status_code=400, detail="File must be a CSV")
+
+    buffer, content_hash = await _read_upload(file)
+
+    job = await run_in_threadpool(_queue_upload, db, buffer, file.filename, content_hash)
+    if job.status == "succeeded":
+        response.status_code = 200
+    return job
+
+
+@router.get("/jobs/{job_id}", response_model=IngestJobResponse)
+async def get_upload_job(
+    job_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get status and progress of a background upload job (failed once it stops updating)"""
+    job = await db.get(IngestJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if is_stale(job):
+        job.status = "failed"
+        job.error = STALE_ERROR
+        await db.commit()
+
+    return _job_response(job)
+
+
+def _roster_query(league_id: uuid.UUID, owner: Optional[str] = None) -> Select:
+    """
+    Roster rows for a league - one joined query, unordered
+
+    Plain columns rather than ORM entities, labelled as PlayerInRoster
+    fields (plus roster_id), so rows go straight into the response dicts.
+    """
+    query = (
+        select(
+            Roster.id.label('roster_id'),
+            Player.id.label('id'),
+            Player.name,
+            Player.team.label('mlb_team'),
+            Player.position,
+            Roster.team_owner.label('owner'),
+            # Floats however the stats are stored (orjson doesn't serialize Decimals)
+            cast(ProjectionLatest.hr, Float).label('hr'),
+            cast(ProjectionLatest.rbi, Float).label('rbi'),
+            cast(ProjectionLatest.sb, Float).label('sb'),
+            cast(ProjectionLatest.avg, Float).label('avg'),
+        )
+        .join(Player, Roster.player_id == Player.id)
+        .outerjoin(ProjectionLatest, ProjectionLatest.player_id == Player.id)
+        .where(Roster.league_id == league_id)
+    )
+
+    if owner:
+        query = query.where(Roster.team_owner == owner)
+
+    return query
+
+
+def _roster_body(
+    league_id: uuid.UUID,
+    league_type: str,
+    rows: Iterable[Row],
+    next_cursor: Optional[str] = None,
+    fields: Optional[Set[str]] = None
+) -> Dict:
+    """RosterResponse-shaped dict from _roster_query rows, with only the selected player fields"""
+    names = [name for name in PlayerInRoster.model_fields if fields is None or name in fields]
+    return {
+        'league_id': league_id,
+        'league_type': league_type,
+        'players': [{name: row._mapping[name] for name in names} for row in rows],
+        'next_cursor': next_cursor,
+    }
+
+
+def _roster_etag(league_id: uuid.UUID, roster_version: int, projection_version: int, *params) -> str:
+    """
+    Weak ETag for one roster representation (the data versions plus every query param)
+
+    Weak because GZipMiddleware serves the same representation as gzip or
+    identity bytes under this one tag.
+    """
+    key = ':'.join(str(part) for part in (league_id, roster_version, projection_version) + params)
+    return 'W/"' + hashlib.sha256(key.encode()).hexdigest()[:32] + '"'
+
+
+def _opaque_tag(tag: str) -> str:
+    return tag[2:] if tag.startswith('W/') else tag
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 prescribes for it)"""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(',')]
+    return '*' in tags or any(_opaque_tag(tag) == _opaque_tag(etag) for tag in tags)
 
 
 @router.get("/{league_id}/roster", response_model=RosterResponse)
 async def get_roster(
+    request: Request,
     league_id: uuid.UUID,
     owner: str = None,
-    db: Session = Depends(get_db)
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    sort: str = 'id',
+    order: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get roster for a league
 
     Query params:
     - owner: Filter by team owner (optional)
+    - limit: Page size (optional; without it the whole roster is returned)
+    - cursor: next_cursor from the previous page
+    - sort: id (upload order), name, hr, rbi, sb or avg
+    - order: asc or desc (default: desc for stats, asc otherwise)
+    - fields: Comma-separated player fields to return, e.g. name,owner,hr
+
+    Responses carry a weak ETag built from the league's roster version and
+    the projections_latest version; send it back as If-None-Match to get a
+    304 without the roster being read or serialized.
     """
-    # Get league
-    league = db.query(League).filter(League.id == league_id).first()
+    try:
+        order = resolve_order(sort, order)
+        selected = parse_fields(fields)
+        query = order_page(_roster_query(league_id, owner), sort, order, cursor)
+    except PageError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # League and data versions in one primary-key lookup
+    projection_version = (
+        select(DataVersion.version)
+        .where(DataVersion.name == ProjectionLatest.__tablename__)
+        .scalar_subquery()
+    )
+    league = (await db.execute(
+        select(League.league_type, League.roster_version, func.coalesce(projection_version, 0))
+        .where(League.id == league_id)
+    )).first()
     if not league:
         raise HTTPException(status_code=404, detail="League not found")
 
-    # Get rosters
-    query = db.query(Roster).filter(Roster.league_id == league_id)
+    league_type, roster_version, latest_version = league
+    etag = _roster_etag(
+        league_id, roster_version, latest_version,
+        owner, limit, cursor, sort, order, ','.join(sorted(selected)) if selected else None
+    )
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
 
-    if owner:
-        query = query.filter(Roster.team_owner == owner)
-
-    rosters = query.all()
-
-    # Build response
-    players = []
-    for roster in rosters:
-        player = roster.player
-
-        # Get latest projection (if available)
-        latest_projection = None
-        if player.projections_daily:
-            latest_projection = sorted(
-                player.projections_daily,
-                key=lambda p: p.date,
-                reverse=True
-            )[0]
-
-        player_data = PlayerInRoster(
-            id=player.id,
-            name=player.name,
-            mlb_team=player.team,
-            position=player.position,
-            owner=roster.team_owner,
-            hr=latest_projection.hr if latest_projection else None,
-            rbi=latest_projection.rbi if latest_projection else None,
-            sb=latest_projection.sb if latest_projection else None,
-            avg=latest_projection.avg if latest_projection else None,
-        )
-        players.append(player_data)
+    if limit is None:
+        rows, next_cursor = (await db.execute(query)).all(), None
+    else:
+        # One extra row tells us whether there is a next page
+        rows = (await db.execute(query.limit(limit + 1))).all()
+        next_cursor = page_cursor(sort, order, rows[limit - 1]) if len(rows) > limit else None
+        rows = rows[:limit]
 
-    return RosterResponse(
-        league_id=league.id,
-        league_type=league.league_type,
-        players=players
-    )
+    # Plain dicts through orjson - no per-player model construction or validation
+    return ORJSONResponse(_roster_body(league_id, league_type, rows, next_cursor, selected), headers=headers)
 
 
 @router.get("/{league_id}/free-agents", response_model=RosterResponse)
 async def get_free_agents(
+    request: Request,
     league_id: uuid.UUID,
-    db: Session = Depends(get_db)
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    sort: str = 'id',
+    order: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all free agents in a league"""
-    return await get_roster(league_id, owner="Free Agent", db=db)
+    """Get free agents in a league (same paging, sorting, field and ETag behaviour as the roster)"""
+    return await get_roster(
+        request,
+        league_id,
+        owner="Free Agent",
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        order=order,
+        fields=fields,
+        db=db
+    )
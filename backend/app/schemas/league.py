@@ -31,6 +31,7 @@ class LeagueResponse(BaseModel):
     owned_players: int
     free_agents: int
     uploaded_at: datetime
+    deduplicated: bool = False  # True if this exact file was already uploaded
 
     class Config:
         from_attributes = True
@@ -44,9 +45,60 @@ class RosterResponse(BaseModel):
     league_id: UUID
     league_type: str
     players: List[PlayerInRoster]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page; None on the last page
 
     class Config:
         from_attributes = True
         json_encoders = {
             UUID: str
         }
+
+
+class IngestJobResponse(BaseModel):
+    """Background upload job status"""
+    id: UUID
+    status: str  # 'queued', 'running', 'succeeded', 'failed'
+    csv_filename: Optional[str]
+
+    # Progress
+    rows_parsed: int
+    rows_matched: int
+    rows_inserted: int
+
+    # Outcome
+    league: Optional[LeagueResponse] = None
+    error: Optional[str] = None
+
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+        json_encoders = {
+            UUID: str
+        }
+
+
+class RosterChange(BaseModel):
+    """One player's change between two uploads of a league"""
+    player_id: int
+    name: str
+    old_owner: Optional[str] = None  # None when added
+    new_owner: Optional[str] = None  # None when dropped
+
+
+class RosterDiffResponse(BaseModel):
+    """Result of re-uploading a league file"""
+    league_id: UUID
+    league_type: str
+    added: List[RosterChange]
+    dropped: List[RosterChange]
+    owner_changes: List[RosterChange]
+    status_changes: int
+    unchanged: int
+    affected_owners: List[str]  # Owners whose rosters changed (incl. 'Free Agent')
+
+    class Config:
+        json_encoders = {
+            UUID: str
+        }
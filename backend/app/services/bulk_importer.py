@@ -0,0 +1,161 @@
+"""Bulk Importer - Load a directory of league exports from the command line"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import os
+import time
+
+from app.database import SessionLocal
+from app.services.csv_parser import CSVParser
+from app.services.league_ingest import store_league, find_duplicate
+from app.services.player_matcher import PlayerMatcher
+
+
+@dataclass
+class FileResult:
+    """Outcome of importing one file"""
+    path: Path
+    status: str = "ok"  # 'ok', 'duplicate', 'error'
+    league_type: Optional[str] = None
+    rows: int = 0
+    parse_seconds: float = 0.0
+    store_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        seconds = self.parse_seconds + self.store_seconds
+        return self.rows / seconds if seconds else 0.0
+
+
+def _parse_file(path: Path) -> Tuple[Optional[List[Dict]], Optional[str], str, float, Optional[str]]:
+    """
+    Parse one file in a worker process
+
+    Returns:
+        (records, league_type, sha256, seconds, error) - records is None on error
+    """
+    start = time.perf_counter()
+    try:
+        content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        players_data, league_type = CSVParser.parse_csv(str(path))
+        return list(players_data), league_type, content_hash, time.perf_counter() - start, None
+    except Exception as e:
+        return None, None, "", time.perf_counter() - start, str(e)
+
+
+def import_directory(directory: Path, workers: Optional[int] = None, pattern: str = "*.csv") -> List[FileResult]:
+    """
+    Import every matching file in a directory as its own league
+
+    Files are parsed in a process pool while the main process matches and
+    stores them in order, so parsing of the next files overlaps with
+    database work. All files share one PlayerMatcher (and so one player
+    index, which learns the players created by earlier files). Each league
+    is committed on its own, so a bad file doesn't undo the others.
+
+    Args:
+        directory: Folder with Fantrax / CBS / NFBC exports
+        workers: Parser processes (default: CPU count)
+        pattern: Glob for files to import
+
+    Returns:
+        FileResult per file, in file name order
+    """
+    paths = sorted(p for p in directory.glob(pattern) if p.is_file())
+    results = []
+
+    db = SessionLocal()
+    matcher = PlayerMatcher(db)
+
+    try:
+        with ProcessPoolExecutor(workers or os.cpu_count()) as pool:
+            for path, parsed in zip(paths, pool.map(_parse_file, paths)):
+                records, league_type, content_hash, parse_seconds, error = parsed
+                result = FileResult(path=path, league_type=league_type, parse_seconds=parse_seconds)
+                results.append(result)
+
+                if error:
+                    result.status, result.error = "error", error
+                    continue
+
+                result.rows = len(records)
+                start = time.perf_counter()
+                try:
+                    if find_duplicate(db, content_hash):
+                        result.status = "duplicate"
+                    else:
+                        response = store_league(
+                            db,
+                            records,
+                            league_type,
+                            path.name,
+                            matcher=matcher,
+                            content_hash=content_hash
+                        )
+                        if response.deduplicated:
+                            result.status = "duplicate"
+                except Exception as e:
+                    db.rollback()
+                    matcher.reset()
+                    result.status, result.error = "error", str(e)
+                result.store_seconds = time.perf_counter() - start
+    finally:
+        db.close()
+
+    return results
+
+
+def print_report(results: List[FileResult], elapsed: float) -> None:
+    """Per-file throughput table plus totals and errors"""
+    print(f"{'file':40} {'type':8} {'rows':>7} {'parse s':>8} {'store s':>8} {'rows/s':>9}  status")
+    for r in results:
+        print(
+            f"{r.path.name[:40]:40} {r.league_type or '-':8} {r.rows:7d} "
+            f"{r.parse_seconds:8.2f} {r.store_seconds:8.2f} {r.rows_per_second:9.0f}  {r.status}"
+        )
+
+    imported = [r for r in results if r.status == "ok"]
+    failed = [r for r in results if r.status == "error"]
+    rows = sum(r.rows for r in imported)
+
+    print(
+        f"\n{len(imported)} imported, {len(results) - len(imported) - len(failed)} duplicate, "
+        f"{len(failed)} failed - {rows} rows in {elapsed:.1f}s ({rows / elapsed if elapsed else 0:.0f} rows/s)"
+    )
+    for r in failed:
+        print(f"  [FAIL] {r.path.name}: {r.error}")
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from app.config import get_settings
+    from app.database import check_schema, SchemaOutOfDate
+
+    parser = argparse.ArgumentParser(description="Import a directory of league CSV exports")
+    parser.add_argument("directory", type=Path, help="Folder with Fantrax / CBS / NFBC files")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
+    parser.add_argument("--pattern", default="*.csv", help="File glob (default: *.csv)")
+    parser.add_argument(
+        "--migrate", action="store_true",
+        help="Run `alembic upgrade head` first if the database is behind (default: DB_AUTO_MIGRATE)"
+    )
+    args = parser.parse_args()
+
+    if not args.directory.is_dir():
+        parser.error(f"{args.directory} is not a directory")
+
+    # Same schema check as app startup - never import into tables Alembic doesn't know about
+    try:
+        check_schema(auto_migrate=args.migrate or get_settings().DB_AUTO_MIGRATE)
+    except SchemaOutOfDate as e:
+        parser.exit(1, f"{e}\n")
+
+    start = time.perf_counter()
+    results = import_directory(args.directory, args.workers, args.pattern)
+    print_report(results, time.perf_counter() - start)
+
+    sys.exit(1 if any(r.status == "error" for r in results) else 0)
@@ -0,0 +1,64 @@
+"""Context Cache - Projection-enriched roster groups for chat context"""
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+import threading
+import uuid
+
+
+class RosterContextCache:
+    """
+    Enriched player dicts cached per (league, owner)
+
+    Enriching a player means a projection lookup, so chat requests reuse
+    the enriched group until that owner's roster changes. Entries also
+    remember which players they were built from and are ignored if the
+    roster no longer matches (e.g. changed by another process).
+    """
+
+    MAX_ENTRIES = 1024
+
+    def __init__(self):
+        self._entries: "OrderedDict[Tuple[uuid.UUID, str], Tuple[tuple, List[Dict]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _signature(players: List[Dict]) -> tuple:
+        return tuple((p.get('name'), p.get('mlb_team'), p.get('position')) for p in players)
+
+    def get(self, league_id: uuid.UUID, owner: str, players: List[Dict]) -> Optional[List[Dict]]:
+        """Cached enriched copy of `players`, or None if missing/stale"""
+        key = (league_id, owner)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != self._signature(players):
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, league_id: uuid.UUID, owner: str, players: List[Dict], enriched: List[Dict]) -> None:
+        """Store the enriched version of an owner's players"""
+        key = (league_id, owner)
+        with self._lock:
+            self._entries[key] = (self._signature(players), enriched)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.MAX_ENTRIES:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, league_id: uuid.UUID, owners: Optional[Iterable[str]] = None) -> None:
+        """Drop cached groups for some owners of a league (all owners if None)"""
+        with self._lock:
+            if owners is None:
+                stale = [key for key in self._entries if key[0] == league_id]
+            else:
+                stale = [(league_id, owner) for owner in owners]
+            for key in stale:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop everything (e.g. after projections are refreshed)"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by all requests in this process
+context_cache = RosterContextCache()
@@ -1,39 +1,136 @@
 """CSV Parser Service - Parse league CSVs from Fantrax, CBS Sports, NFBC"""
 import pandas as pd
-from typing import List, Dict, Optional
-import re
+from typing import List, Dict, Iterator, Union, IO, Callable, Optional, Tuple
+from collections.abc import Sequence
+import csv
+
+# A league file on disk or an already-open (e.g. in-memory) buffer
+CSVSource = Union[str, IO]
+
+# Detectors see a candidate header row and the data row under it
+FormatDetector = Callable[[List[str], List[str]], bool]
+
+
+def _as_frame(source: Union[CSVSource, pd.DataFrame], skiprows: int = 0) -> pd.DataFrame:
+    """Read a league file, unless the caller already has it as a DataFrame"""
+    if isinstance(source, pd.DataFrame):
+        return source
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return pd.read_csv(source, skiprows=skiprows)
+
+
+def _find_column(columns: List[str], name: str) -> Optional[int]:
+    """Position of a column, matched case-insensitively"""
+    for i, col in enumerate(columns):
+        if col.lower().strip() == name:
+            return i
+    return None
+
+
+class PlayerBatch(Sequence):
+    """
+    Columnar batch of parsed players
+
+    Holds one column per player field; row dicts are only built when the
+    batch is iterated or indexed, a chunk at a time.
+    """
+
+    CHUNK_SIZE = 1024
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PlayerBatch(self.frame.iloc[index])
+        return self.frame.iloc[[index]].to_dict('records')[0]
+
+    def __iter__(self) -> Iterator[Dict]:
+        for start in range(0, len(self.frame), self.CHUNK_SIZE):
+            yield from self.frame.iloc[start:start + self.CHUNK_SIZE].to_dict('records')
+
+    def column(self, name: str) -> List:
+        """All values of one field, as native Python objects"""
+        return self.frame[name].tolist()
+
+    def to_records(self) -> List[Dict]:
+        """Materialize every row as a dict"""
+        return self.frame.to_dict('records')
 
 
 class CSVParser:
     """Parse fantasy league CSV files"""
 
-    @staticmethod
-    def detect_league_type(df: pd.DataFrame) -> str:
+    # Bytes read from the top of a file to detect its format
+    SNIFF_BYTES = 64 * 1024
+
+    # CBS exports put a title row above the header, so also try the second line
+    HEADER_OFFSETS = (0, 1)
+
+    # league_type -> (detector, parser), checked in registration order
+    _formats: Dict[str, Tuple[FormatDetector, Callable]] = {}
+
+    @classmethod
+    def register_format(cls, league_type: str, detector: FormatDetector, parser: Callable) -> None:
         """
-        Detect which league platform the CSV is from
-        Returns: 'fantrax', 'cbs', 'nfbc', or 'unknown'
+        Register a league platform
+
+        Args:
+            league_type: Name returned by parse_csv ('fantrax', 'cbs', ...)
+            detector: fn(columns, first_row) -> bool, given raw header/data cells
+            parser: fn(df) -> PlayerBatch, given the fully read DataFrame
+        """
+        cls._formats[league_type] = (detector, parser)
+
+    @classmethod
+    def sniff(cls, head: Union[bytes, str]) -> Tuple[str, int]:
+        """
+        Detect the platform from the first bytes of a file
+
+        Returns: (league_type, header_offset) or ('unknown', 0)
         """
-        columns = [col.lower().strip() for col in df.columns]
+        if isinstance(head, bytes):
+            head = head.decode('utf-8-sig', errors='replace')
 
-        # Fantrax has unique 'ID' column with format like *05ajh*
-        if 'id' in columns:
-            # Find the actual column name (case-insensitive)
-            id_col = [col for col in df.columns if col.lower().strip() == 'id'][0]
-            if pd.notna(df[id_col].iloc[0]) and str(df[id_col].iloc[0]).startswith('*'):
-                return 'fantrax'
+        lines = head.splitlines()
+        if len(head) >= cls.SNIFF_BYTES and len(lines) > 1:
+            lines = lines[:-1]  # Last line may be cut off mid-row
 
-        # CBS Sports has 'Avail' column (team owner name)
-        if 'avail' in columns:
-            return 'cbs'
+        rows = list(csv.reader(lines[:max(cls.HEADER_OFFSETS) + 2]))
 
-        # NFBC has 'Owner' column and numeric 'id'
-        if 'owner' in columns and 'id' in columns:
-            return 'nfbc'
+        for offset in cls.HEADER_OFFSETS:
+            if offset >= len(rows):
+                break
+            columns = rows[offset]
+            first_row = rows[offset + 1] if offset + 1 < len(rows) else []
+
+            for league_type, (detector, _) in cls._formats.items():
+                if detector(columns, first_row):
+                    return league_type, offset
+
+        return 'unknown', 0
+
+    @classmethod
+    def detect_league_type(cls, df: pd.DataFrame) -> str:
+        """
+        Detect which league platform an already-read DataFrame is from
+        Returns: 'fantrax', 'cbs', 'nfbc', or 'unknown'
+        """
+        columns = [str(col) for col in df.columns]
+        first_row = ['' if pd.isna(v) else str(v) for v in df.iloc[0]] if len(df) else []
+
+        for league_type, (detector, _) in cls._formats.items():
+            if detector(columns, first_row):
+                return league_type
 
         return 'unknown'
 
     @staticmethod
-    def parse_fantrax(file_path: str) -> List[Dict]:
+    def parse_fantrax(source: Union[CSVSource, pd.DataFrame]) -> PlayerBatch:
         """
         Parse Fantrax CSV
         Format: ID,Player,Team,Position,RkOv,Status,Score,Ros
@@ -44,35 +141,29 @@ class CSVParser:
         - Team owner name (AA, MG, Doc, etc.) = Owned player
         - Empty/'-' = Free Agent
         """
-        df = pd.read_csv(file_path)
-        players = []
-
-        for _, row in df.iterrows():
-            # Check Status field for free agent designation
-            status = row['Status']
-
-            if pd.notna(status) and str(status).strip() not in ['-', '', 'FA']:
-                # Has a team owner name (not FA, not empty)
-                owner = str(status).strip()
-            else:
-                # Status is "FA", empty, or "-" = Free Agent
-                owner = 'Free Agent'
-
-            player = {
-                'fantrax_id': row['ID'],  # *05ajh*
-                'name': row['Player'],
-                'mlb_team': row['Team'],  # BOS, NYY, etc.
-                'position': row['Position'],  # SP, OF, etc.
-                'owner': owner,
-                'league_type': 'fantrax',
-                'status': str(status) if pd.notna(status) else None  # Keep original status for reference
-            }
-            players.append(player)
-
-        return players
+        df = _as_frame(source)
+
+        # Check Status field for free agent designation
+        status = df['Status']
+        has_status = status.notna()
+        status_text = status.astype(str)
+        stripped = status_text.str.strip()
+
+        # Has a team owner name (not FA, not empty); otherwise Free Agent
+        owned = has_status & ~stripped.isin(['-', '', 'FA'])
+
+        return PlayerBatch(pd.DataFrame({
+            'fantrax_id': df['ID'],  # *05ajh*
+            'name': df['Player'],
+            'mlb_team': df['Team'],  # BOS, NYY, etc.
+            'position': df['Position'],  # SP, OF, etc.
+            'owner': stripped.where(owned, 'Free Agent'),
+            'league_type': 'fantrax',
+            'status': status_text.astype(object).where(has_status, None),  # Keep original status for reference
+        }))
 
     @staticmethod
-    def parse_cbs(file_path: str) -> List[Dict]:
+    def parse_cbs(source: Union[CSVSource, pd.DataFrame]) -> PlayerBatch:
         """
         Parse CBS Sports CSV
         Format: Avail,Player,AB,R,H,1B,2B,3B,HR,RBI,BB,K,SB,CS,AVG,OBP,SLG,Rank
@@ -81,105 +172,113 @@ class CSVParser:
         Note: NO player IDs in CBS - will need fuzzy matching
         """
         # CBS files have a title row before the header, skip it
-        df = pd.read_csv(file_path, skiprows=1)
-        players = []
-
-        for _, row in df.iterrows():
-            # Avail column contains team owner name OR is empty for free agents
-            avail_val = row['Avail']
-            if pd.notna(avail_val) and isinstance(avail_val, str) and avail_val.strip() != '':
-                owner = avail_val.strip()
-            else:
-                owner = 'Free Agent'
-
-            # Player column format: "Name Position | Team"
-            # Example: "Shohei Ohtani P,U | LAD "
-            player_str = str(row['Player'])
-
-            # Extract name and team
-            if '|' in player_str:
-                name_pos, mlb_team = player_str.split('|')
-                mlb_team = mlb_team.strip()
-
-                # Extract just the name (before position abbreviations)
-                # Position is usually at the end: "Shohei Ohtani P,U"
-                name = re.sub(r'\s+[A-Z,]+\s*$', '', name_pos).strip()
-            else:
-                name = player_str.strip()
-                mlb_team = None
-
-            player = {
-                'fantrax_id': None,  # CBS has no IDs
-                'nfbc_id': None,
-                'name': name,
-                'mlb_team': mlb_team,
-                'position': None,  # Could extract from Player string if needed
-                'owner': owner,
-                'league_type': 'cbs'
-            }
-            players.append(player)
-
-        return players
+        df = _as_frame(source, skiprows=1)
+
+        # Avail column contains team owner name OR is empty for free agents
+        # (.str yields NaN for non-string cells, so only real names count)
+        avail = df['Avail']
+        if avail.dtype == object:
+            avail_text = avail.str.strip()
+            owner = avail_text.where(avail_text.notna() & (avail_text != ''), 'Free Agent')
+        else:
+            owner = pd.Series('Free Agent', index=df.index)
+
+        # Player column format: "Name Position | Team"
+        # Example: "Shohei Ohtani P,U | LAD "
+        player_str = df['Player'].astype(str)
+        parts = player_str.str.extract(r'^(?P<name_pos>[^|]*)\|(?P<team>[^|]*)$')
+        has_team = parts['name_pos'].notna()
+
+        # Extract just the name (before position abbreviations)
+        # Position is usually at the end: "Shohei Ohtani P,U"
+        name = parts['name_pos'].str.replace(r'\s+[A-Z,]+\s*$', '', regex=True).str.strip()
+
+        return PlayerBatch(pd.DataFrame({
+            'fantrax_id': None,  # CBS has no IDs
+            'nfbc_id': None,
+            'name': name.where(has_team, player_str.str.strip()),
+            'mlb_team': parts['team'].str.strip().astype(object).where(has_team, None),
+            'position': None,  # Could extract from Player string if needed
+            'owner': owner,
+            'league_type': 'cbs',
+        }, index=df.index))
 
     @staticmethod
-    def parse_nfbc(file_path: str) -> List[Dict]:
+    def parse_nfbc(source: Union[CSVSource, pd.DataFrame]) -> PlayerBatch:
         """
         Parse NFBC CSV
         Format: id,Players,Owner,Injury,Pos,Team,Own %,Start %,...
         Example: 11802,"Abbott, Andrew",Matt Cathey - TARF,,P,CIN,100,82,...
         """
-        df = pd.read_csv(file_path)
-        players = []
-
-        for _, row in df.iterrows():
-            # Owner column contains team owner name OR is empty for free agents
-            owner = row['Owner'] if pd.notna(row['Owner']) and row['Owner'].strip() != '' else 'Free Agent'
+        df = _as_frame(source)
+
+        # Owner column contains team owner name OR is empty for free agents
+        owner = df['Owner']
+        owned = owner.notna() & (owner.astype(str).str.strip() != '')
+
+        return PlayerBatch(pd.DataFrame({
+            'nfbc_id': df['id'].astype('int64'),
+            'name': df['Players'],
+            'mlb_team': df['Team'],
+            'position': df['Pos'],
+            'owner': owner.where(owned, 'Free Agent'),
+            'league_type': 'nfbc',
+        }))
+
+    @classmethod
+    def parse_csv(cls, source: CSVSource) -> tuple[PlayerBatch, str]:
+        """
+        Auto-detect league type and parse CSV
 
-            player = {
-                'nfbc_id': int(row['id']),
-                'name': row['Players'],
-                'mlb_team': row['Team'],
-                'position': row['Pos'],
-                'owner': owner,
-                'league_type': 'nfbc'
-            }
-            players.append(player)
+        Sniffs the header bytes once, then reads the whole file exactly once
+        from the same open handle.
 
-        return players
+        Args:
+            source: File path or open buffer (e.g. io.BytesIO of an upload)
 
-    @staticmethod
-    def parse_csv(file_path: str) -> tuple[List[Dict], str]:
-        """
-        Auto-detect league type and parse CSV
         Returns: (players_list, league_type)
         """
-        # Try reading normally first
+        handle = open(source, 'rb') if isinstance(source, str) else source
+
         try:
-            df_sample = pd.read_csv(file_path, nrows=5)
-            league_type = CSVParser.detect_league_type(df_sample)
-        except:
-            league_type = 'unknown'
+            start = handle.tell()
+            league_type, header_offset = cls.sniff(handle.read(cls.SNIFF_BYTES))
+            handle.seek(start)
 
-        # If detection failed, try skipping first row (CBS format)
-        if league_type == 'unknown':
-            try:
-                df_sample = pd.read_csv(file_path, skiprows=1, nrows=5)
-                league_type = CSVParser.detect_league_type(df_sample)
-            except:
-                pass
-
-        if league_type == 'fantrax':
-            players = CSVParser.parse_fantrax(file_path)
-        elif league_type == 'cbs':
-            players = CSVParser.parse_cbs(file_path)
-        elif league_type == 'nfbc':
-            players = CSVParser.parse_nfbc(file_path)
-        else:
-            raise ValueError(f"Unknown CSV format. Could not detect league type.")
+            if league_type not in cls._formats:
+                raise ValueError("Unknown CSV format. Could not detect league type.")
+
+            _, parser = cls._formats[league_type]
+            df = pd.read_csv(handle, skiprows=header_offset)
+            players = parser(df)
+        finally:
+            if handle is not source:
+                handle.close()
 
         return players, league_type
 
 
+def _detect_fantrax(columns: List[str], first_row: List[str]) -> bool:
+    """Fantrax has unique 'ID' column with format like *05ajh*"""
+    id_col = _find_column(columns, 'id')
+    return id_col is not None and id_col < len(first_row) and first_row[id_col].startswith('*')
+
+
+def _detect_cbs(columns: List[str], first_row: List[str]) -> bool:
+    """CBS Sports has 'Avail' column (team owner name)"""
+    return _find_column(columns, 'avail') is not None
+
+
+def _detect_nfbc(columns: List[str], first_row: List[str]) -> bool:
+    """NFBC has 'Owner' column and numeric 'id'"""
+    return _find_column(columns, 'owner') is not None and _find_column(columns, 'id') is not None
+
+
+CSVParser.register_format('fantrax', _detect_fantrax, CSVParser.parse_fantrax)
+CSVParser.register_format('cbs', _detect_cbs, CSVParser.parse_cbs)
+CSVParser.register_format('nfbc', _detect_nfbc, CSVParser.parse_nfbc)
+
+
 # Test the parser
 if __name__ == "__main__":
     import sys
@@ -0,0 +1,184 @@
+"""Ingest Queue - Bounded in-process worker pool for background CSV uploads"""
+from datetime import datetime, timedelta
+from typing import IO, List, Optional
+import logging
+import queue
+import threading
+import uuid
+
+from sqlalchemy import update
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models import IngestJob
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+STALE_ERROR = "Upload was interrupted (worker restarted or stalled), please upload the file again"
+
+
+def _update_job(job_id: uuid.UUID, **fields) -> None:
+    """Write job fields in their own short transaction so pollers see them at once"""
+    db = SessionLocal()
+    try:
+        job = db.get(IngestJob, job_id)
+        if job is None:
+            return
+        for key, value in fields.items():
+            setattr(job, key, value)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _claim_job(job_id: uuid.UUID) -> bool:
+    """Move a queued job to running; False if it was failed as stale while waiting"""
+    db = SessionLocal()
+    try:
+        claimed = db.execute(
+            update(IngestJob)
+            .where(IngestJob.id == job_id, IngestJob.status == "queued")
+            .values(status="running", updated_at=datetime.utcnow())
+        ).rowcount
+        db.commit()
+        return claimed == 1
+    finally:
+        db.close()
+
+
+def is_stale(job: IngestJob) -> bool:
+    """Queued or running, but not updated for INGEST_JOB_TIMEOUT_SECONDS"""
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.INGEST_JOB_TIMEOUT_SECONDS)
+    return job.status in ACTIVE_STATUSES and job.updated_at < cutoff
+
+
+def fail_stale_jobs() -> int:
+    """
+    Mark queued and running jobs that stopped updating as failed
+
+    Upload buffers only live in the worker process's memory, so a job
+    left behind by a restart can't be re-queued; failing it tells the
+    poller to upload again. Jobs still making progress (in this or any
+    other process) keep refreshing updated_at and are left alone.
+
+    Returns:
+        Number of jobs marked failed
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.INGEST_JOB_TIMEOUT_SECONDS)
+    db = SessionLocal()
+    try:
+        failed = db.execute(
+            update(IngestJob)
+            .where(IngestJob.status.in_(ACTIVE_STATUSES), IngestJob.updated_at < cutoff)
+            .values(status="failed", error=STALE_ERROR, updated_at=datetime.utcnow())
+        ).rowcount
+        db.commit()
+    finally:
+        db.close()
+
+    if failed:
+        logger.warning(f"Marked {failed} stale ingest jobs as failed")
+    return failed
+
+
+def run_job(job_id: uuid.UUID, buffer: IO, filename: str, content_hash: Optional[str] = None) -> None:
+    """Run the upload pipeline for one job, recording progress and outcome"""
+    # Imported by the first job, not at app startup (pandas and fuzzywuzzy)
+    from app.services.league_ingest import ingest_league
+
+    if not _claim_job(job_id):
+        buffer.close()
+        return
+
+    db = SessionLocal()
+    try:
+        response = ingest_league(
+            db,
+            buffer,
+            filename,
+            progress=lambda **counts: _update_job(job_id, **counts),
+            content_hash=content_hash
+        )
+        _update_job(
+            job_id,
+            status="succeeded",
+            league_id=response.id,
+            result=response.model_dump_json()
+        )
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Ingest job {job_id} failed: {str(e)}")
+        _update_job(job_id, status="failed", error=str(e))
+    finally:
+        db.close()
+        buffer.close()
+
+
+class IngestQueue:
+    """
+    Bounded job queue drained by a few daemon threads
+
+    The queue only holds job IDs and upload buffers; everything a status
+    poll needs is written to the ingest_jobs table.
+    """
+
+    def __init__(self, workers: int, maxsize: int):
+        self.workers = workers
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start worker threads (idempotent)"""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"ingest-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Let queued jobs finish, then stop the workers"""
+        with self._lock:
+            for _ in self._threads:
+                self._queue.put(None)
+            for thread in self._threads:
+                thread.join()
+            self._threads = []
+
+    def submit(
+        self,
+        job_id: uuid.UUID,
+        buffer: IO,
+        filename: str,
+        content_hash: Optional[str] = None
+    ) -> bool:
+        """
+        Queue a job
+
+        Returns:
+            False if the queue is full (caller should reject the upload)
+        """
+        self.start()
+        try:
+            self._queue.put_nowait((job_id, buffer, filename, content_hash))
+            return True
+        except queue.Full:
+            return False
+
+    def _work(self) -> None:
+        while True:
+            item: Optional[tuple] = self._queue.get()
+            try:
+                if item is None:
+                    return
+                run_job(*item)
+            finally:
+                self._queue.task_done()
+
+
+# Shared by all requests in this process
+ingest_queue = IngestQueue(settings.INGEST_WORKERS, settings.INGEST_QUEUE_SIZE)
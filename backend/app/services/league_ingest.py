@@ -0,0 +1,314 @@
+"""League Ingest Service - Parse, match and store an uploaded league CSV"""
+from sqlalchemy import func, case
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import uuid
+
+from app.models import User, League, Roster, Player
+from app.schemas.league import LeagueResponse, RosterChange, RosterDiffResponse
+from app.services.csv_parser import CSVParser, CSVSource
+from app.services.player_matcher import PlayerMatcher
+from app.services.context_cache import context_cache
+
+# Receives progress counters as keyword arguments (rows_parsed=..., ...)
+ProgressCallback = Callable[..., None]
+
+
+def league_summary(db: Session, league: League, deduplicated: bool = False) -> LeagueResponse:
+    """LeagueResponse for a stored league, with roster counts from one grouped query"""
+    total, free_agents = db.query(
+        func.count(Roster.id),
+        func.coalesce(func.sum(case((Roster.team_owner == 'Free Agent', 1), else_=0)), 0)
+    ).filter(Roster.league_id == league.id).one()
+
+    return LeagueResponse(
+        id=league.id,
+        league_type=league.league_type,
+        total_players=total,
+        owned_players=total - free_agents,
+        free_agents=free_agents,
+        uploaded_at=league.uploaded_at,
+        deduplicated=deduplicated
+    )
+
+
+def find_duplicate(db: Session, content_hash: Optional[str]) -> Optional[League]:
+    """League already ingested from exactly these bytes, if any"""
+    if not content_hash:
+        return None
+    return db.query(League).filter(League.content_hash == content_hash).first()
+
+
+def ingest_league(
+    db: Session,
+    source: CSVSource,
+    filename: str,
+    progress: Optional[ProgressCallback] = None,
+    content_hash: Optional[str] = None
+) -> LeagueResponse:
+    """
+    Run the full upload pipeline and commit once
+
+    Parsing and matching only read from the database, so progress reported
+    up to `rows_matched` never waits on this session's write transaction.
+
+    Args:
+        db: Session the league is written with (committed on success)
+        source: File path or open buffer with the CSV
+        filename: Original upload filename, stored on the league
+        progress: Optional callback for rows_parsed / rows_matched / rows_inserted
+        content_hash: sha256 of the upload; if a concurrent upload of the
+            same bytes commits first, its league is returned instead
+
+    Returns:
+        LeagueResponse for the new league (or the duplicate's, deduplicated=True)
+
+    Raises:
+        ValueError: Unknown or malformed CSV
+    """
+    report = progress or (lambda **counts: None)
+
+    # Parse CSV
+    players_data, league_type = CSVParser.parse_csv(source)
+    records = list(players_data)
+    report(rows_parsed=len(records))
+
+    return store_league(
+        db,
+        records,
+        league_type,
+        filename,
+        progress=progress,
+        content_hash=content_hash
+    )
+
+
+def store_league(
+    db: Session,
+    records: List[Dict],
+    league_type: str,
+    filename: str,
+    matcher: Optional[PlayerMatcher] = None,
+    progress: Optional[ProgressCallback] = None,
+    content_hash: Optional[str] = None
+) -> LeagueResponse:
+    """
+    Match parsed rows and store them as a new league (commits once)
+
+    Args:
+        db: Session the league is written with
+        records: Parsed player rows
+        league_type: 'fantrax', 'cbs' or 'nfbc'
+        filename: Original filename, stored on the league
+        matcher: Matcher to reuse across leagues (its index is kept warm);
+            a fresh one is created if omitted
+        progress: Optional callback for rows_matched / rows_inserted
+        content_hash: sha256 of the source file, see ingest_league
+
+    Returns:
+        LeagueResponse for the new league (or the duplicate's, deduplicated=True)
+    """
+    report = progress or (lambda **counts: None)
+
+    # Match all players in one batch (ID lookups with IN queries, fuzzy for the rest)
+    matcher = matcher or PlayerMatcher(db)
+    players = matcher.get_or_create_many(
+        records,
+        on_matched=lambda count: report(rows_matched=count)
+    )
+
+    # Create or get user (for now, create a new one each time)
+    user = User()
+    db.add(user)
+    db.flush()
+
+    # Create league record
+    league = League(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        league_type=league_type,
+        csv_filename=filename,
+        content_hash=content_hash
+    )
+    db.add(league)
+
+    # The unique hash is the tie-breaker between racing uploads of the same file
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        existing = find_duplicate(db, content_hash)
+        if existing is None:
+            raise
+        return league_summary(db, existing, deduplicated=True)
+
+    owned_count = 0
+    free_agent_count = 0
+    roster_entries = []
+
+    for player_data, player in zip(records, players):
+        # Create roster entry object (don't add to session yet)
+        roster = Roster(
+            league_id=league.id,
+            player_id=player.id,
+            team_owner=player_data['owner'],
+            status=player_data.get('status')
+        )
+        roster_entries.append(roster)
+
+        if player_data['owner'] == 'Free Agent':
+            free_agent_count += 1
+        else:
+            owned_count += 1
+
+    # Bulk insert all roster entries at once (much faster)
+    db.bulk_save_objects(roster_entries)
+    db.commit()
+    report(rows_inserted=len(roster_entries))
+
+    return LeagueResponse(
+        id=league.id,
+        league_type=league_type,
+        total_players=len(records),
+        owned_players=owned_count,
+        free_agents=free_agent_count,
+        uploaded_at=league.uploaded_at
+    )
+
+
+def reingest_league(
+    db: Session,
+    league: League,
+    source: CSVSource,
+    filename: str
+) -> RosterDiffResponse:
+    """
+    Re-upload a league file and apply only what changed
+
+    Rows are first resolved against players already on the league's
+    rosters (by platform ID, or exact name and team), so only new names go
+    through the matcher. Adds, drops and owner/status changes are then
+    applied in one transaction, and the chat context cache is invalidated
+    for the affected owners only.
+
+    Args:
+        db: Session the changes are written with (committed on success)
+        league: League being updated
+        source: File path or open buffer with the new CSV
+        filename: Upload filename, stored on the league
+
+    Returns:
+        RosterDiffResponse describing the applied delta
+
+    Raises:
+        ValueError: Unknown/malformed CSV, or a file from another platform
+    """
+    players_data, league_type = CSVParser.parse_csv(source)
+    if league_type != league.league_type:
+        raise ValueError(f"League is {league.league_type}, but the file is {league_type}")
+    records = list(players_data)
+
+    stored = (
+        db.query(Roster)
+        .options(joinedload(Roster.player))
+        .filter(Roster.league_id == league.id)
+        .all()
+    )
+
+    # Players already on this league, by the same keys the matcher dedupes on
+    known: Dict[tuple, Player] = {}
+    for roster in stored:
+        player = roster.player
+        if player.fantrax_id:
+            known[('fantrax', player.fantrax_id)] = player
+        if player.nfbc_id:
+            known[('nfbc', player.nfbc_id)] = player
+        known[PlayerMatcher.identity({'name': player.name, 'mlb_team': player.team})] = player
+
+    players: List[Optional[Player]] = [known.get(PlayerMatcher.identity(r)) for r in records]
+    unresolved = [i for i, player in enumerate(players) if player is None]
+    if unresolved:
+        matched = PlayerMatcher(db).get_or_create_many(records[i] for i in unresolved)
+        for i, player in zip(unresolved, matched):
+            players[i] = player
+
+    # Latest row per player (first occurrence wins, as on a fresh upload's roster view)
+    incoming: Dict[int, tuple] = {}
+    for record, player in zip(records, players):
+        incoming.setdefault(player.id, (record, player))
+
+    current: Dict[int, Roster] = {}
+    duplicates: List[Roster] = []
+    for roster in stored:
+        if roster.player_id in current:
+            duplicates.append(roster)
+        else:
+            current[roster.player_id] = roster
+
+    added, dropped, owner_changes = [], [], []
+    new_rows, updates = [], []
+    affected = set()
+    status_changes = 0
+    unchanged = 0
+
+    for player_id, (record, player) in incoming.items():
+        owner = record['owner']
+        status = record.get('status')
+        roster = current.get(player_id)
+
+        if roster is None:
+            added.append(RosterChange(player_id=player_id, name=player.name, new_owner=owner))
+            new_rows.append(Roster(league_id=league.id, player_id=player_id, team_owner=owner, status=status))
+            affected.add(owner)
+        elif roster.team_owner != owner:
+            owner_changes.append(RosterChange(
+                player_id=player_id, name=player.name, old_owner=roster.team_owner, new_owner=owner
+            ))
+            updates.append({'id': roster.id, 'team_owner': owner, 'status': status})
+            affected.update((roster.team_owner, owner))
+        elif roster.status != status:
+            status_changes += 1
+            updates.append({'id': roster.id, 'team_owner': owner, 'status': status})
+        else:
+            unchanged += 1
+
+    for player_id, roster in current.items():
+        if player_id not in incoming:
+            dropped.append(RosterChange(player_id=player_id, name=roster.player.name, old_owner=roster.team_owner))
+            affected.add(roster.team_owner)
+
+    drop_ids = [c.player_id for c in dropped]
+    stale_ids = [current[pid].id for pid in drop_ids] + [r.id for r in duplicates]
+    affected.update(r.team_owner for r in duplicates)
+
+    # Apply the delta in one transaction
+    for start in range(0, len(stale_ids), PlayerMatcher.IN_BATCH_SIZE):
+        chunk = stale_ids[start:start + PlayerMatcher.IN_BATCH_SIZE]
+        db.query(Roster).filter(Roster.id.in_(chunk)).delete(synchronize_session=False)
+    if updates:
+        db.bulk_update_mappings(Roster, updates)
+    if new_rows:
+        db.bulk_save_objects(new_rows)
+
+    league.csv_filename = filename
+    league.uploaded_at = datetime.utcnow()
+    league.content_hash = None  # Rosters no longer reflect the originally uploaded bytes
+    if stale_ids or updates or new_rows:
+        # In SQL, so concurrent re-uploads can't both write the same version
+        league.roster_version = League.roster_version + 1
+    db.commit()
+
+    context_cache.invalidate(league.id, affected)
+
+    return RosterDiffResponse(
+        league_id=league.id,
+        league_type=league_type,
+        added=added,
+        dropped=dropped,
+        owner_changes=owner_changes,
+        status_changes=status_changes,
+        unchanged=unchanged,
+        affected_owners=sorted(affected)
+    )
@@ -1,15 +1,25 @@
 """OpenAI Chat Service - GPT-4 powered fantasy baseball recommendations"""
-from openai import OpenAI
+from functools import lru_cache
 from typing import List, Dict, Optional
 import logging
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+@lru_cache()
+def get_client():
+    """
+    Shared OpenAI client, built on the first chat request
+
+    The SDK (and httpx under it) takes about half a second to import, so
+    it stays out of app startup; cold starts that never chat never pay it.
+    """
+    from dotenv import load_dotenv
+    from openai import OpenAI
+
+    load_dotenv()
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 
 class OpenAIService:
@@ -93,7 +103,7 @@ Keep responses detailed but organized. Use tables and bullet points. Help users
             messages.append({"role": "user", "content": user_message})
 
             # Get completion from GPT-4
-            response = client.chat.completions.create(
+            response = get_client().chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=0.7,
@@ -0,0 +1,281 @@
+"""Player Index - In-memory fuzzy name index, built once per upload"""
+from sqlalchemy.orm import Session
+from fuzzywuzzy import fuzz
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import multiprocessing
+import re
+import unicodedata
+
+from app.models import Player
+
+# (id, name, team, position) - plain tuples so the index pickles cheaply
+PlayerRow = Tuple[int, str, Optional[str], Optional[str]]
+
+# Name suffixes skipped when picking the last-name blocking key
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv'}
+
+# (name, mlb_team, position) as passed to PlayerIndex.match
+MatchQuery = Tuple[str, Optional[str], Optional[str]]
+
+# Index used by pool workers - installed in each worker process by _init_worker
+_WORKER_INDEX: Optional["PlayerIndex"] = None
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents and punctuation (used for blocking keys only)"""
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(ch for ch in name if not unicodedata.combining(ch))
+    name = re.sub(r'[^a-z0-9, ]+', ' ', name.lower())
+    return re.sub(r'\s+', ' ', name).strip()
+
+
+def last_name_key(normalized: str, length: int = 3) -> str:
+    """
+    First letters of the last name
+
+    Handles "Last, First" (NFBC) as well as "First Last Jr." (Fantrax, CBS)
+    """
+    if ',' in normalized:
+        last = normalized.split(',', 1)[0].strip()
+    else:
+        tokens = [t for t in normalized.split() if t not in NAME_SUFFIXES]
+        last = tokens[-1] if tokens else ''
+    return last.replace(' ', '')[:length]
+
+
+def name_grams(normalized: str, n: int = 3) -> Set[str]:
+    """Character n-grams of the name, padded so word boundaries count"""
+    padded = f" {normalized.replace(',', '')} "
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def score_name(name: str, candidate: str) -> int:
+    """Same scorers as the original matcher: best of ratio, partial and token sort"""
+    return max(
+        fuzz.ratio(name, candidate),
+        fuzz.partial_ratio(name, candidate),
+        fuzz.token_sort_ratio(name, candidate),
+    )
+
+
+class PlayerIndex:
+    """
+    Blocking index over the player master table
+
+    Candidates for a name are narrowed in three steps before any fuzzy
+    scoring happens:
+    1. Team (and position) filter - same fallback to all players as before
+    2. MLB team first letter must agree when both sides have a team
+    3. Shared last-name prefix, or enough character trigrams in common
+    """
+
+    # Minimum share of trigrams (of the shorter name) a candidate must have
+    MIN_GRAM_OVERLAP = 0.5
+
+    def __init__(self, rows: Iterable[PlayerRow]):
+        self.ids: List[int] = []
+        self.names: List[str] = []  # Lowercased, as the scorers see them
+        self.teams: List[Optional[str]] = []
+        self.positions: List[Optional[str]] = []
+        self.gram_counts: List[int] = []
+
+        self.by_team: Dict[str, List[int]] = {}
+        self.by_last_name: Dict[str, Set[int]] = {}
+        self.by_gram: Dict[str, List[int]] = {}
+
+        self._pools: Dict[Tuple[Optional[str], Optional[str]], Optional[Set[int]]] = {}
+
+        for player_id, name, team, position in rows:
+            self.add(player_id, name, team, position)
+
+    def add(self, player_id: int, name: str, team: Optional[str], position: Optional[str]) -> None:
+        """Index one player (e.g. one just created, so later rows can match it)"""
+        row = len(self.ids)
+        normalized = normalize_name(name)
+        grams = name_grams(normalized)
+
+        self.ids.append(player_id)
+        self.names.append(str(name).lower())
+        self.teams.append(team)
+        self.positions.append(position)
+        self.gram_counts.append(len(grams))
+
+        if team:
+            self.by_team.setdefault(team, []).append(row)
+        self.by_last_name.setdefault(last_name_key(normalized), set()).add(row)
+        for gram in grams:
+            self.by_gram.setdefault(gram, []).append(row)
+
+        # Cached team/position pools may now be missing this row
+        if self._pools:
+            self._pools.clear()
+
+    @classmethod
+    def from_db(cls, db: Session) -> "PlayerIndex":
+        """Build the index from every player in one query"""
+        rows = db.query(Player.id, Player.name, Player.team, Player.position).order_by(Player.id)
+        return cls(tuple(row) for row in rows)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _pool(self, mlb_team: Optional[str], position: Optional[str]) -> Optional[Set[int]]:
+        """
+        Rows allowed by the team/position filter (None = all players)
+
+        Mirrors the old query: filter by team and position, and if that
+        finds nobody, search all players instead.
+        """
+        key = (mlb_team, position)
+        if key not in self._pools:
+            pool = None
+            if mlb_team or position:
+                rows = self.by_team.get(mlb_team, []) if mlb_team else range(len(self.ids))
+                if position:
+                    wanted = position.upper()
+                    rows = [r for r in rows if self.positions[r] and wanted in self.positions[r].upper()]
+                pool = set(rows) or None
+            self._pools[key] = pool
+        return self._pools[key]
+
+    def candidates(
+        self,
+        name: str,
+        mlb_team: Optional[str] = None,
+        position: Optional[str] = None
+    ) -> List[int]:
+        """Row numbers worth scoring for this name, in player id order"""
+        normalized = normalize_name(name)
+        grams = name_grams(normalized)
+
+        # Rows sharing enough trigrams with the query
+        overlaps = Counter()
+        for gram in grams:
+            overlaps.update(self.by_gram.get(gram, ()))
+
+        blocked = {
+            row for row, shared in overlaps.items()
+            if shared >= self.MIN_GRAM_OVERLAP * min(len(grams), self.gram_counts[row])
+        }
+        blocked |= self.by_last_name.get(last_name_key(normalized), set())
+
+        pool = self._pool(mlb_team, position)
+        if pool is not None:
+            blocked &= pool
+
+        # CBS fuzzy match: verify first letter of MLB team matches to reduce false positives
+        if mlb_team:
+            initial = mlb_team[0].upper()
+            blocked = {
+                row for row in blocked
+                if not self.teams[row] or self.teams[row][0].upper() == initial
+            }
+
+        return sorted(blocked)
+
+    def match(
+        self,
+        name: str,
+        mlb_team: Optional[str] = None,
+        position: Optional[str] = None,
+        threshold: int = 85
+    ) -> Optional[int]:
+        """
+        Best fuzzy match for one name
+
+        Returns:
+            Player id if the best score reaches threshold, else None
+        """
+        search = str(name).lower()
+        best_row = None
+        best_score = 0
+
+        for row in self.candidates(name, mlb_team, position):
+            score = score_name(search, self.names[row])
+            if score > best_score:
+                best_score = score
+                best_row = row
+
+        # Return match if above threshold
+        if best_row is not None and best_score >= threshold:
+            return self.ids[best_row]
+
+        return None
+
+    def match_many(
+        self,
+        queries: Iterable[MatchQuery],
+        threshold: int = 85
+    ) -> List[Optional[int]]:
+        """
+        Batch scorer - match (name, mlb_team, position) tuples
+
+        Repeated queries within the batch are scored once.
+        """
+        results = {}
+        matches = []
+
+        for query in queries:
+            if query not in results:
+                results[query] = self.match(*query, threshold=threshold)
+            matches.append(results[query])
+
+        return matches
+
+    def match_many_parallel(
+        self,
+        queries: Iterable[MatchQuery],
+        workers: int,
+        threshold: int = 85
+    ) -> List[Optional[int]]:
+        """
+        match_many sharded across a process pool
+
+        Distinct queries are split into contiguous shards and results are
+        merged back in input order, so the output is identical to match_many.
+        The index is pickled once per worker and installed by the pool
+        initializer, so concurrent calls (ingest queue threads, request
+        threadpool) each get their own index. Workers come from a
+        forkserver (spawn where unavailable) rather than a fork of this
+        process, which has threads running and database connections open.
+        """
+        queries = list(queries)
+        distinct = list(dict.fromkeys(queries))
+        if workers <= 1 or len(distinct) < 2:
+            return self.match_many(queries, threshold)
+
+        # A few shards per worker keeps them busy when some names are slower
+        shard_size = -(-len(distinct) // (workers * 4))
+        shards = [distinct[i:i + shard_size] for i in range(0, len(distinct), shard_size)]
+
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('forkserver')
+            # Imported once in the server, so workers fork with it loaded
+            context.set_forkserver_preload([__name__])
+        else:
+            context = multiprocessing.get_context('spawn')
+        pool = ProcessPoolExecutor(
+            workers, mp_context=context,
+            initializer=_init_worker, initargs=(self,)
+        )
+
+        with pool:
+            shard_results = pool.map(_match_shard, shards, [threshold] * len(shards))
+            results = {}
+            for shard, player_ids in zip(shards, shard_results):
+                results.update(zip(shard, player_ids))
+
+        return [results[query] for query in queries]
+
+
+def _init_worker(index: PlayerIndex) -> None:
+    """Pool initializer - runs once in each worker process"""
+    global _WORKER_INDEX
+    _WORKER_INDEX = index
+
+
+def _match_shard(queries: List[MatchQuery], threshold: int) -> List[Optional[int]]:
+    """Score one shard of queries in a worker process"""
+    return _WORKER_INDEX.match_many(queries, threshold)
@@ -1,15 +1,47 @@
 """Player Matching Service - Match CSV players to database using IDs or fuzzy matching"""
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from fuzzywuzzy import fuzz
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Iterable, Any, Callable
 from app.models import Player
+from app.config import get_settings
+from app.services.player_index import PlayerIndex
+
+settings = get_settings()
+
+
+def _present(value: Any) -> bool:
+    """True for real values - not None, NaN (pandas blanks) or empty strings"""
+    return value is not None and value == value and value != ''
+
+
+def _clean(value: Any) -> Any:
+    """Map NaN/empty cells to None before they reach the database"""
+    return value if _present(value) else None
 
 
 class PlayerMatcher:
     """Match players from CSVs to database"""
 
-    def __init__(self, db: Session):
+    # Values per IN (...) lookup, safely under SQLite's bound-parameter limit
+    IN_BATCH_SIZE = 900
+
+    def __init__(self, db: Session, workers: Optional[int] = None):
+        """
+        Args:
+            db: Database session
+            workers: Processes for fuzzy matching (default: MATCH_WORKERS setting);
+                0 or 1 keeps matching in-process
+        """
         self.db = db
+        self.workers = settings.MATCH_WORKERS if workers is None else workers
+        self._index: Optional[PlayerIndex] = None
+
+    @property
+    def index(self) -> PlayerIndex:
+        """Fuzzy name index over all players, built on first use"""
+        if self._index is None:
+            self._index = PlayerIndex.from_db(self.db)
+        return self._index
 
     def match_by_fantrax_id(self, fantrax_id: str) -> Optional[Player]:
         """Match player by Fantrax ID (*05ajh*)"""
@@ -33,6 +65,9 @@ class PlayerMatcher:
         """
         Match player by fuzzy name matching
 
+        Uses the in-memory index, so the player table is read once per
+        matcher rather than once per name.
+
         Args:
             name: Player name to match
             mlb_team: MLB team (BOS, NYY) - optional for better matching
@@ -42,48 +77,8 @@ class PlayerMatcher:
         Returns:
             Matched Player or None
         """
-        # Get all players (or filter by team/position if provided)
-        query = self.db.query(Player)
-
-        if mlb_team:
-            query = query.filter(Player.team == mlb_team)
-
-        if position:
-            query = query.filter(Player.position.like(f'%{position}%'))
-
-        candidates = query.all()
-
-        if not candidates:
-            # Try without filters
-            candidates = self.db.query(Player).all()
-
-        # Find best fuzzy match
-        best_match = None
-        best_score = 0
-
-        for candidate in candidates:
-            # CBS fuzzy match: verify first letter of MLB team matches to reduce false positives
-            if mlb_team and candidate.team:
-                if mlb_team[0].upper() != candidate.team[0].upper():
-                    continue
-
-            # Try different name variations
-            scores = [
-                fuzz.ratio(name.lower(), candidate.name.lower()),
-                fuzz.partial_ratio(name.lower(), candidate.name.lower()),
-                fuzz.token_sort_ratio(name.lower(), candidate.name.lower()),
-            ]
-            score = max(scores)
-
-            if score > best_score:
-                best_score = score
-                best_match = candidate
-
-        # Return match if above threshold
-        if best_score >= threshold:
-            return best_match
-
-        return None
+        player_id = self.index.match(name, mlb_team, position, threshold)
+        return self.db.get(Player, player_id) if player_id is not None else None
 
     def match_player(self, player_data: Dict) -> Optional[Player]:
         """
@@ -153,9 +148,152 @@ class PlayerMatcher:
         self.db.add(new_player)
         self.db.commit()
         self.db.refresh(new_player)
+        self._index = None  # New player - rebuild the index on next fuzzy match
 
         return new_player
 
+    def reset(self) -> None:
+        """Forget the index (after a rollback it may hold players that no longer exist)"""
+        self._index = None
+
+    def _players_by(self, column, values: Iterable) -> Dict[Any, Player]:
+        """Load players whose `column` is in `values`, keyed by that value"""
+        values = list(values)
+        found = {}
+
+        for start in range(0, len(values), self.IN_BATCH_SIZE):
+            chunk = values[start:start + self.IN_BATCH_SIZE]
+            for player in self.db.query(Player).filter(column.in_(chunk)):
+                found.setdefault(getattr(player, column.key), player)
+
+        return found
+
+    def match_many(self, players_data: Iterable[Dict]) -> List[Optional[Player]]:
+        """
+        Batch version of match_player - same ID-first, fuzzy-fallback order
+
+        Fantrax and NFBC IDs are resolved with one IN query each; only rows
+        neither ID matched go through fuzzy name matching.
+
+        Args:
+            players_data: Dicts with keys: fantrax_id, nfbc_id, name, mlb_team, position
+
+        Returns:
+            Matched Player (or None) for each input, in input order
+        """
+        records = list(players_data)
+
+        by_fantrax = self._players_by(
+            Player.fantrax_id,
+            {r['fantrax_id'] for r in records if _present(r.get('fantrax_id'))}
+        )
+        matches = [by_fantrax.get(r.get('fantrax_id')) for r in records]
+
+        by_nfbc = self._players_by(
+            Player.nfbc_id,
+            {r['nfbc_id'] for r, m in zip(records, matches) if m is None and _present(r.get('nfbc_id'))}
+        )
+
+        for i, record in enumerate(records):
+            if matches[i] is None and _present(record.get('nfbc_id')):
+                matches[i] = by_nfbc.get(record['nfbc_id'])
+
+        # Fallback to fuzzy name matching, scored in one batch against the index
+        leftovers = [i for i, m in enumerate(matches) if m is None and _present(records[i].get('name'))]
+        if leftovers:
+            queries = [
+                (records[i]['name'], _clean(records[i].get('mlb_team')), _clean(records[i].get('position')))
+                for i in leftovers
+            ]
+            if self.workers > 1 and len(queries) >= settings.PARALLEL_MATCH_MIN_NAMES:
+                player_ids = self.index.match_many_parallel(queries, self.workers)
+            else:
+                player_ids = self.index.match_many(queries)
+            by_id = self._players_by(Player.id, {pid for pid in player_ids if pid is not None})
+            for i, player_id in zip(leftovers, player_ids):
+                matches[i] = by_id.get(player_id)
+
+        return matches
+
+    @staticmethod
+    def identity(player_data: Dict) -> tuple:
+        """Key that collapses repeated rows for the same new player"""
+        if _present(player_data.get('fantrax_id')):
+            return ('fantrax', player_data['fantrax_id'])
+        if _present(player_data.get('nfbc_id')):
+            return ('nfbc', player_data['nfbc_id'])
+        return ('name', str(player_data.get('name')).lower().strip(), _clean(player_data.get('mlb_team')))
+
+    def get_or_create_many(
+        self,
+        players_data: Iterable[Dict],
+        on_matched: Optional[Callable[[int], None]] = None
+    ) -> List[Player]:
+        """
+        Batch version of get_or_create_player
+
+        Matches everything with match_many, back-fills missing platform IDs,
+        then creates all unmatched players with one INSERT ... RETURNING.
+        Only flushes - the caller commits once for the whole upload.
+
+        Args:
+            players_data: Dicts with player info
+            on_matched: Called with the number of rows matched to existing
+                players, after matching and before anything is written
+
+        Returns:
+            Player (existing or newly created) for each input, in input order
+        """
+        records = list(players_data)
+        players = self.match_many(records)
+
+        if on_matched:
+            on_matched(sum(1 for p in players if p is not None))
+
+        # Update IDs if we have new ones; group unmatched rows by identity
+        pending: Dict[tuple, List[int]] = {}
+        for i, (record, player) in enumerate(zip(records, players)):
+            if player is None:
+                pending.setdefault(self.identity(record), []).append(i)
+                continue
+            if _present(record.get('fantrax_id')) and not player.fantrax_id:
+                player.fantrax_id = record['fantrax_id']
+            if _present(record.get('nfbc_id')) and not player.nfbc_id:
+                player.nfbc_id = record['nfbc_id']
+
+        # Create new players (one row per identity) in a single bulk insert
+        if pending:
+            new_rows = []
+            for indexes in pending.values():
+                record = records[indexes[0]]
+                new_rows.append({
+                    'name': record['name'],
+                    'team': _clean(record.get('mlb_team')),
+                    'position': _clean(record.get('position')),
+                    'fantrax_id': _clean(record.get('fantrax_id')),
+                    'nfbc_id': _clean(record.get('nfbc_id')),
+                })
+
+            # RETURNING order isn't guaranteed for batched inserts, so map rows back by identity
+            created = self.db.scalars(insert(Player).returning(Player), new_rows).all()
+
+            for player in created:
+                identity = self.identity({
+                    'fantrax_id': player.fantrax_id,
+                    'nfbc_id': player.nfbc_id,
+                    'name': player.name,
+                    'mlb_team': player.team,
+                })
+                for i in pending[identity]:
+                    players[i] = player
+
+                # Keep a built index current for later batches on this matcher
+                if self._index is not None:
+                    self._index.add(player.id, player.name, player.team, player.position)
+
+        self.db.flush()
+        return players
+
 
 # Test the matcher
 if __name__ == "__main__":
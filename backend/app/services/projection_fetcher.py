@@ -1,14 +1,140 @@
 """Projection Fetcher Service - Fetch projections from Razzball API"""
 import requests
-from datetime import datetime, timedelta
+from datetime import date as date_type, datetime, timedelta
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
-from app.models import Player, ProjectionDaily
+from app.models import ProjectionDaily
 from app.config import get_settings
+from app.services.projection_store import store_projections, HORIZONS, period_for
 import pandas as pd
 
 settings = get_settings()
 
+# Razzball columns (matched case-insensitively) -> projection keys
+ID_FIELDS = {
+    'razzid': 'razzball_id',
+    'razzball_id': 'razzball_id',
+    'name': 'name',
+    'team': 'mlb_team',
+    'mlb_team': 'mlb_team',
+}
+POSITION_FIELDS = ('espn', 'y!', 'pos', 'position')  # First non-blank wins
+HITTER_FIELDS = {
+    'pa': 'pa', 'ab': 'ab', 'h': 'h', 'r': 'r', 'hr': 'hr', 'rbi': 'rbi', 'sb': 'sb',
+    'bb': 'bb', 'so': 'so', 'avg': 'avg', 'obp': 'obp', 'slg': 'slg',
+}
+PITCHER_FIELDS = {
+    'ip': 'ip', 'k': 'k', 'so': 'k', 'w': 'w', 'l': 'l', 'sv': 'sv', 'era': 'era', 'whip': 'whip',
+}
+
+# Player type -> (stat fields, column that marks a row as that type in mixed feeds)
+PLAYER_TYPES = {
+    'hitter': (HITTER_FIELDS, 'pa'),
+    'pitcher': (PITCHER_FIELDS, 'ip'),
+}
+
+# Blank markers seen in Razzball CSV exports
+CSV_NA_VALUES = ['-', 'N/A']
+
+# Horizon -> API path (daily is dated; weekly/ROS serve the current projections)
+ENDPOINTS = {
+    'daily': '/projections/daily/{date}',
+    'weekly': '/projections/botweekly',
+    'ros': '/projections/botros',
+}
+
+
+def default_projection_date() -> str:
+    """
+    Date the most recent Razzball data is stored under: yesterday, local time
+
+    Every sync path without an explicit date uses this, so the CLI and
+    the background scheduler key the same pull the same way.
+    """
+    return (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def normalize_projections(df: pd.DataFrame, player_type: str = 'hitter') -> pd.DataFrame:
+    """
+    Map a Razzball frame (API JSON or CSV) to projection columns, column-wise
+
+    Only stat fields of the given player type are kept, so hitter and
+    pitcher syncs of the same period fill different columns of one row.
+
+    Args:
+        df: Raw Razzball projections
+        player_type: 'hitter' or 'pitcher'
+
+    Returns:
+        Frame with razzball_id, name, mlb_team, position and stat columns (blanks as NaN)
+    """
+    fields, marker = PLAYER_TYPES[player_type]
+    columns = {str(col).strip().lower(): col for col in df.columns}
+
+    # A feed of only the other player type (e.g. pitchers when syncing hitters) has nothing for us
+    others = [other for kind, (_, other) in PLAYER_TYPES.items() if kind != player_type]
+    if marker not in columns and any(other in columns for other in others):
+        return pd.DataFrame(columns=['razzball_id', 'name'])
+
+    out = pd.DataFrame(index=df.index)
+    for source, target in {**ID_FIELDS, **fields}.items():
+        if source in columns and target not in out:
+            out[target] = df[columns[source]]
+
+    if 'razzball_id' not in out or 'name' not in out:
+        raise ValueError("Projection data needs RazzID and Name columns")
+
+    positions = [columns[col] for col in POSITION_FIELDS if col in columns]
+    out['position'] = None
+    for col in reversed(positions):
+        out['position'] = df[col].where(df[col].notna(), out['position'])
+
+    for target in set(fields.values()) & set(out.columns):
+        out[target] = pd.to_numeric(out[target], errors='coerce')
+
+    # Mixed feeds (both types' marker columns present): keep only this type's rows
+    mixed = all(other in columns for _, other in PLAYER_TYPES.values())
+    if mixed and marker in out:
+        out = out[out[marker].notna()]
+
+    out['razzball_id'] = pd.to_numeric(out['razzball_id'], errors='coerce')
+    out = out[out['razzball_id'].notna()].astype({'razzball_id': 'int64'})
+
+    # API names may carry [player id=...] tags
+    out['name'] = out['name'].astype(str).str.replace(r'\[player id=\d+\]|\[/player\]', '', regex=True).str.strip()
+
+    return out
+
+
+def projections_from_frame(df: pd.DataFrame, player_type: str = 'hitter') -> List[Dict]:
+    """normalize_projections as a list of dicts, with blanks as None"""
+    out = normalize_projections(df, player_type)
+    return out.astype(object).where(out.notna(), None).to_dict('records')
+
+
+def read_projection_csv(csv_path: str, player_type: str = 'hitter') -> pd.DataFrame:
+    """
+    Load a Razzball CSV export with only the columns normalize_projections uses
+
+    The header is read first so the wanted columns (any case) can be given
+    explicit dtypes; stats load straight into float64.
+    """
+    fields, _ = PLAYER_TYPES[player_type]
+    wanted = set(ID_FIELDS) | set(POSITION_FIELDS) | set(fields) | {m for _, m in PLAYER_TYPES.values()}
+
+    header = pd.read_csv(csv_path, encoding='utf-8-sig', nrows=0).columns
+    usecols = [col for col in header if str(col).strip().lower() in wanted]
+
+    numeric = set(fields) | {m for _, m in PLAYER_TYPES.values()}
+    dtype = {col: 'float64' if str(col).strip().lower() in numeric else 'object' for col in usecols}
+    dtype.update({col: 'Int64' for col in usecols if str(col).strip().lower() in ('razzid', 'razzball_id')})
+
+    try:
+        return pd.read_csv(csv_path, encoding='utf-8-sig', usecols=usecols, dtype=dtype, na_values=CSV_NA_VALUES)
+    except (ValueError, TypeError):
+        # Stray text in a stat column - load untyped and let normalize_projections coerce
+        return pd.read_csv(csv_path, encoding='utf-8-sig', usecols=usecols, na_values=CSV_NA_VALUES)
+
 
 class ProjectionFetcher:
     """Fetch and store player projections"""
@@ -30,8 +156,7 @@ class ProjectionFetcher:
         """
         if not date:
             # Default to yesterday (most recent data)
-            yesterday = datetime.now() - timedelta(days=1)
-            date = yesterday.strftime("%Y-%m-%d")
+            date = default_projection_date()
 
         url = f"{self.base_url}/projections/daily/{date}"
         headers = {
@@ -52,46 +177,60 @@ class ProjectionFetcher:
             print(f"❌ Error fetching projections: {str(e)}")
             return None
 
-    def parse_daily_csv(self, csv_path: str) -> List[Dict]:
+    def fetch_projections(self, horizon: str = 'daily', date: str = None) -> Optional[pd.DataFrame]:
+        """
+        Fetch one horizon's projections from Razzball API
+
+        Args:
+            horizon: 'daily', 'weekly' or 'ros'
+            date: Date string in YYYY-MM-DD format (daily only)
+
+        Returns:
+            Raw projections DataFrame or None if error
+        """
+        url = self.base_url + ENDPOINTS[horizon].format(date=date)
+        headers = {
+            "Razzball-Api-Key": self.api_key,
+            "Accept": "application/vnd.razzball-v1+json"
+        }
+
+        try:
+            response = requests.get(url, headers=headers, timeout=120)
+
+            if response.status_code != 200:
+                print(f"⚠️  API returned status {response.status_code}")
+                return None
+
+            data = response.json()
+            if isinstance(data, dict):
+                data = data.get('players', data.get('data', data))
+            return pd.DataFrame(data)
+
+        except Exception as e:
+            print(f"❌ Error fetching {horizon} projections: {str(e)}")
+            return None
+
+    def parse_daily_csv(self, csv_path: str, player_type: str = 'hitter') -> List[Dict]:
         """
         Parse daily projection CSV (backup if API fails)
 
         Args:
-            csv_path: Path to Razzball daily CSV
+            csv_path: Path to Razzball daily CSV (hitters or pitchers)
+            player_type: 'hitter' or 'pitcher'
 
         Returns:
             List of projection dicts
         """
-        df = pd.read_csv(csv_path, encoding='utf-8-sig')
-        projections = []
-
-        for _, row in df.iterrows():
-            projection = {
-                'razzball_id': int(row['RazzID']),
-                'name': row['Name'],
-                'mlb_team': row['Team'],
-                'position': row.get('ESPN') or row.get('Y!'),
-                'pa': float(row['PA']) if pd.notna(row['PA']) else None,
-                'ab': float(row['AB']) if pd.notna(row['AB']) else None,
-                'h': float(row['H']) if pd.notna(row['H']) else None,
-                'r': float(row['R']) if pd.notna(row['R']) else None,
-                'hr': float(row['HR']) if pd.notna(row['HR']) else None,
-                'rbi': float(row['RBI']) if pd.notna(row['RBI']) else None,
-                'sb': float(row['SB']) if pd.notna(row['SB']) else None,
-                'bb': float(row['BB']) if pd.notna(row['BB']) else None,
-                'so': float(row['SO']) if pd.notna(row['SO']) else None,
-                'avg': float(row['AVG']) if pd.notna(row['AVG']) else None,
-                'obp': float(row['OBP']) if pd.notna(row['OBP']) else None,
-                'slg': float(row['SLG']) if pd.notna(row['SLG']) else None,
-            }
-            projections.append(projection)
-
-        return projections
+        return projections_from_frame(read_projection_csv(csv_path, player_type), player_type)
 
     def store_daily_projections(self, projections: List[Dict], date: str = None) -> int:
         """
         Store daily projections in database
 
+        Players are resolved with one razzball_id lookup (missing ones are
+        bulk inserted) and projections are written with batched
+        INSERT ... ON CONFLICT (player_id, date) DO UPDATE.
+
         Args:
             projections: List of projection dicts
             date: Date for projections
@@ -100,92 +239,99 @@ class ProjectionFetcher:
             Number of projections stored
         """
         if not date:
-            yesterday = datetime.now() - timedelta(days=1)
-            date = yesterday.strftime("%Y-%m-%d")
+            date = default_projection_date()
 
         projection_date = datetime.strptime(date, "%Y-%m-%d").date()
-        stored_count = 0
-
-        for proj_data in projections:
-            # Find or create player
-            player = self.db.query(Player).filter(
-                Player.razzball_id == proj_data['razzball_id']
-            ).first()
-
-            if not player:
-                # Create new player
-                player = Player(
-                    razzball_id=proj_data['razzball_id'],
-                    name=proj_data['name'],
-                    team=proj_data.get('mlb_team'),
-                    position=proj_data.get('position')
-                )
-                self.db.add(player)
-                self.db.flush()
-
-            # Check if projection already exists
-            existing = self.db.query(ProjectionDaily).filter(
-                ProjectionDaily.player_id == player.id,
-                ProjectionDaily.date == projection_date
-            ).first()
-
-            if existing:
-                # Update existing
-                for key, value in proj_data.items():
-                    if key not in ['razzball_id', 'name', 'mlb_team', 'position'] and value is not None:
-                        setattr(existing, key, value)
-            else:
-                # Create new projection
-                projection = ProjectionDaily(
-                    player_id=player.id,
-                    date=projection_date,
-                    pa=proj_data.get('pa'),
-                    ab=proj_data.get('ab'),
-                    h=proj_data.get('h'),
-                    r=proj_data.get('r'),
-                    hr=proj_data.get('hr'),
-                    rbi=proj_data.get('rbi'),
-                    sb=proj_data.get('sb'),
-                    bb=proj_data.get('bb'),
-                    so=proj_data.get('so'),
-                    avg=proj_data.get('avg'),
-                    obp=proj_data.get('obp'),
-                    slg=proj_data.get('slg'),
-                )
-                self.db.add(projection)
-
-            stored_count += 1
+
+        stored_count = store_projections(self.db, ProjectionDaily, 'date', projection_date, projections)
 
         self.db.commit()
         return stored_count
 
-    def sync_daily_projections(self, date: str = None, fallback_csv: str = None) -> int:
+    def sync_projections(
+        self,
+        horizon: str = 'daily',
+        player_type: str = 'hitter',
+        date: str = None,
+        fallback_csv: str = None
+    ) -> int:
         """
-        Sync daily projections - try API first, fallback to CSV
+        Sync one horizon for hitters or pitchers - API first, CSV fallback
+
+        Daily rows are keyed by date, weekly by the week's Monday and ROS
+        by season; all go through the same bulk upsert.
 
         Args:
-            date: Date string
-            fallback_csv: Path to CSV file as backup
+            horizon: 'daily', 'weekly' or 'ros'
+            player_type: 'hitter' or 'pitcher'
+            date: Date string (default: yesterday)
+            fallback_csv: Path to Razzball CSV export as backup
 
         Returns:
             Number of projections synced
         """
+        if not date:
+            date = default_projection_date()
+        day = datetime.strptime(date, "%Y-%m-%d").date()
+
         # Try API first
-        projections = self.fetch_daily_projections(date)
+        data = self.fetch_projections(horizon, date)
 
         # Fallback to CSV if API fails
-        if not projections and fallback_csv:
+        if (data is None or data.empty) and fallback_csv:
             print("⚠️  API failed, using CSV fallback...")
-            projections = self.parse_daily_csv(fallback_csv)
-
-        if projections:
-            count = self.store_daily_projections(projections, date)
-            print(f"✅ Synced {count} daily projections")
-            return count
-        else:
-            print("❌ No projections available")
+            data = read_projection_csv(fallback_csv, player_type)
+
+        if data is None or data.empty:
+            print(f"❌ No {horizon} {player_type} projections available")
             return 0
 
+        projections = normalize_projections(data, player_type)
+
+        model, key_column = HORIZONS[horizon]
+        count = store_projections(self.db, model, key_column, period_for(horizon, day), projections)
+        self.db.commit()
+
+        print(f"✅ Synced {count} {horizon} {player_type} projections")
+        return count
+
+    def store_frame(self, horizon: str, data: pd.DataFrame, day: date_type) -> Dict[str, int]:
+        """
+        Store an already-fetched Razzball frame for hitters and pitchers (commits once)
+
+        Args:
+            horizon: 'daily', 'weekly' or 'ros'
+            data: Raw projections (API response or CSV)
+            day: Day the projections are for (mapped to the horizon's period)
+
+        Returns:
+            Rows stored per player type
+        """
+        model, key_column = HORIZONS[horizon]
+        period = period_for(horizon, day)
+
+        counts = {
+            player_type: store_projections(
+                self.db, model, key_column, period, normalize_projections(data, player_type)
+            )
+            for player_type in PLAYER_TYPES
+        }
+        self.db.commit()
+        return counts
+
+    def sync_daily_projections(self, date: str = None, fallback_csv: str = None) -> int:
+        """
+        Sync daily projections - try API first, fallback to CSV
+
+        Args:
+            date: Date string
+            fallback_csv: Path to CSV file as backup
+
+        Returns:
+            Number of projections synced
+        """
+        return self.sync_projections('daily', 'hitter', date, fallback_csv)
+
 
 # Test the fetcher
 if __name__ == "__main__":
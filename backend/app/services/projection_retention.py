@@ -0,0 +1,94 @@
+"""Projection Retention - Roll old daily projections into weekly rows and prune them"""
+from sqlalchemy.orm import Session
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+import pandas as pd
+
+from app.config import get_settings
+from app.models import ProjectionDaily, ProjectionWeekly
+from app.services.projection_store import STAT_COLUMNS, period_for, records_from_frame, upsert_rows
+
+settings = get_settings()
+
+# Summed when rolling days into a week
+COUNTING_COLUMNS = ('pa', 'ab', 'h', 'r', 'hr', 'rbi', 'sb', 'bb', 'so', 'ip', 'k', 'w', 'l', 'sv')
+
+# Rate stats, averaged weighted by the column they are a rate of
+RATE_WEIGHTS = {'avg': 'ab', 'obp': 'pa', 'slg': 'ab', 'era': 'ip', 'whip': 'ip'}
+
+
+def retention_cutoff(today: date, retention_days: int) -> date:
+    """First day kept - aligned to a Monday so only whole weeks are rolled up"""
+    return period_for('weekly', today - timedelta(days=retention_days))
+
+
+def rollup_daily(db: Session, before: date) -> int:
+    """
+    Aggregate daily rows older than `before` into projections_weekly (not committed)
+
+    Weeks Razzball already published a weekly projection for keep it
+    (ON CONFLICT DO NOTHING).
+
+    Returns:
+        Number of weekly rows produced
+    """
+    columns = ('player_id', 'date') + STAT_COLUMNS
+    rows = db.query(*[getattr(ProjectionDaily, col) for col in columns]).filter(ProjectionDaily.date < before)
+    daily = pd.DataFrame(rows.all(), columns=columns)
+    if daily.empty:
+        return 0
+
+    daily[list(STAT_COLUMNS)] = daily[list(STAT_COLUMNS)].astype(float)
+    daily['week_start'] = daily['date'].map(lambda day: period_for('weekly', day))
+    keys = [daily['player_id'], daily['week_start']]
+
+    weekly = daily.groupby(keys)[list(COUNTING_COLUMNS)].sum(min_count=1)
+    for rate, weight in RATE_WEIGHTS.items():
+        weighted = (daily[rate] * daily[weight]).groupby(keys).sum(min_count=1)
+        total = daily[weight].where(daily[rate].notna()).groupby(keys).sum(min_count=1)
+        weekly[rate] = (weighted / total).round(3)
+
+    weekly = weekly.reset_index()
+    upsert_rows(db, ProjectionWeekly, records_from_frame(weekly), ('player_id', 'week_start'), ())
+    return len(weekly)
+
+
+def apply_retention(
+    db: Session,
+    retention_days: Optional[int] = None,
+    today: Optional[date] = None
+) -> Dict[str, int]:
+    """
+    Roll up and delete daily projections older than the retention window (commits)
+
+    projections_latest is untouched, so a player's newest projection
+    survives even if it is older than the window.
+
+    Returns:
+        {'rolled_up': weekly rows written, 'pruned': daily rows deleted}
+    """
+    retention_days = settings.PROJECTION_DAILY_RETENTION_DAYS if retention_days is None else retention_days
+    before = retention_cutoff(today or date.today(), retention_days)
+
+    rolled_up = rollup_daily(db, before)
+    pruned = db.query(ProjectionDaily).filter(ProjectionDaily.date < before).delete(synchronize_session=False)
+    db.commit()
+
+    return {'rolled_up': rolled_up, 'pruned': pruned}
+
+
+# Run retention by hand (also rebuilds projections_latest)
+if __name__ == "__main__":
+    from app.database import SessionLocal, init_db
+    from app.services.projection_store import rebuild_latest
+
+    init_db()
+    db = SessionLocal()
+    try:
+        players = rebuild_latest(db)
+        db.commit()
+        print(f"Rebuilt latest projections for {players} players")
+        print(f"Retention: {apply_retention(db)}")
+    finally:
+        db.close()
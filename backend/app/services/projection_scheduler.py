@@ -0,0 +1,210 @@
+"""Projection Scheduler - Background Razzball sync, one worker per deployment"""
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime, timedelta
+from typing import List, Optional
+import logging
+import os
+import random
+import socket
+import threading
+import uuid
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models import SyncLock
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def acquire_lease(name: str, owner: str, ttl: timedelta) -> bool:
+    """
+    Take or renew a named lease (own short transaction)
+
+    Succeeds if the lease is free, expired, or already held by `owner`.
+    A holder that dies simply stops renewing, and another worker takes
+    over once the lease expires.
+    """
+    now = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        renewed = db.query(SyncLock).filter(
+            SyncLock.name == name,
+            (SyncLock.expires_at < now) | (SyncLock.owner == owner)
+        ).update({'owner': owner, 'expires_at': now + ttl}, synchronize_session=False)
+
+        if not renewed:
+            db.add(SyncLock(name=name, owner=owner, expires_at=now + ttl))
+        db.commit()
+        return True
+
+    except IntegrityError:
+        # Someone else holds an unexpired lease
+        db.rollback()
+        return False
+
+    finally:
+        db.close()
+
+
+def release_lease(name: str, owner: str) -> None:
+    """Give up a lease early (e.g. on shutdown) so another worker can take over"""
+    db = SessionLocal()
+    try:
+        db.query(SyncLock).filter(SyncLock.name == name, SyncLock.owner == owner).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def sync_horizon(horizon: str) -> int:
+    """
+    Fetch one horizon from Razzball, store it and publish it as the snapshot
+
+    Goes through ProjectionFetcher like the manual syncs, so the endpoint
+    and the stored date come from the same code path, and the snapshot
+    is published from the very frame that was stored.
+
+    Returns:
+        New snapshot version
+
+    Raises:
+        ValueError: Razzball returned nothing (the fetcher logs why)
+        Anything from the database (the scheduler retries)
+    """
+    # Deferred to the first sync so app startup doesn't import pandas and requests
+    from app.services.projection_fetcher import ProjectionFetcher, default_projection_date
+    from app.services.projection_snapshot import publish_snapshot
+
+    date = default_projection_date()
+    db = SessionLocal()
+    try:
+        fetcher = ProjectionFetcher(db)
+        data = fetcher.fetch_projections(horizon, date)
+        if data is None or data.empty:
+            raise ValueError(f"Razzball returned no {horizon} projections for {date}")
+
+        counts = fetcher.store_frame(horizon, data, datetime.strptime(date, "%Y-%m-%d").date())
+        version = publish_snapshot(db, horizon, data)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    logger.info(f"Synced {horizon} projections {counts}, snapshot v{version}")
+    return version
+
+
+class ProjectionScheduler:
+    """
+    Daemon thread that syncs projections on a jittered cadence
+
+    Every replica runs one, but a tick only syncs if it holds the
+    'projection_sync' lease, which lasts a little over one interval, so
+    at most one worker per deployment calls Razzball per cadence. The
+    lease holder also applies daily projection retention after syncing.
+    """
+
+    LOCK_NAME = "projection_sync"
+
+    def __init__(
+        self,
+        interval: int,
+        jitter: int,
+        retries: int,
+        backoff: int,
+        horizons: List[str]
+    ):
+        self.interval = interval
+        self.jitter = jitter
+        self.retries = retries
+        self.backoff = backoff
+        self.horizons = horizons
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the scheduler thread (idempotent)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="projection-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop after the current attempt and hand the lease back"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        release_lease(self.LOCK_NAME, self.owner)
+
+    def _run(self) -> None:
+        # First tick soon after startup, spread out so replicas don't race for the lease
+        delay = random.uniform(0, self.jitter)
+        while not self._stop.wait(delay):
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error(f"Projection sync tick failed: {str(e)}")
+            delay = max(0.0, self.interval + random.uniform(-self.jitter, self.jitter))
+
+    def tick(self) -> bool:
+        """
+        Sync every horizon if this worker holds the lease
+
+        Returns:
+            True if this worker ran the sync
+        """
+        ttl = timedelta(seconds=self.interval + 2 * self.jitter)
+        if not acquire_lease(self.LOCK_NAME, self.owner, ttl):
+            return False
+
+        for horizon in self.horizons:
+            self._sync_with_retries(horizon)
+
+        self._apply_retention()
+        return True
+
+    def _apply_retention(self) -> None:
+        """Roll up and prune old daily rows (a failure just waits for the next tick)"""
+        from app.services.projection_retention import apply_retention
+
+        db = SessionLocal()
+        try:
+            logger.info(f"Projection retention: {apply_retention(db)}")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Projection retention failed: {str(e)}")
+        finally:
+            db.close()
+
+    def _sync_with_retries(self, horizon: str) -> bool:
+        """Retry one horizon with exponential backoff (+/-50% jitter)"""
+        for attempt in range(self.retries + 1):
+            try:
+                sync_horizon(horizon)
+                return True
+            except Exception as e:
+                logger.warning(f"{horizon} projection sync attempt {attempt + 1} failed: {str(e)}")
+                if attempt == self.retries:
+                    break
+                delay = self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+                if self._stop.wait(delay):
+                    return False
+
+        logger.error(f"Giving up on {horizon} projection sync until the next interval")
+        return False
+
+
+# Shared by the app process (started on startup when PROJECTION_SYNC_ENABLED)
+projection_scheduler = ProjectionScheduler(
+    interval=settings.PROJECTION_SYNC_INTERVAL_SECONDS,
+    jitter=settings.PROJECTION_SYNC_JITTER_SECONDS,
+    retries=settings.PROJECTION_SYNC_RETRIES,
+    backoff=settings.PROJECTION_SYNC_BACKOFF_SECONDS,
+    horizons=[h.strip() for h in settings.PROJECTION_SYNC_HORIZONS.split(',') if h.strip()]
+)
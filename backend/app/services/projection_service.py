@@ -5,14 +5,25 @@ import cloudscraper
 from typing import Dict, List, Optional
 import logging
 import os
+import time
 from dotenv import load_dotenv
 
+from app.config import get_settings
+from app.database import SessionLocal
+from app.services.context_cache import context_cache
+from app.services.projection_snapshot import snapshot_version, load_snapshot
+
 load_dotenv()
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
 # Global cache for projections (shared across all instances)
 _PROJECTION_CACHE = {}
 
+# Snapshot version held in _PROJECTION_CACHE, and when it was last checked (monotonic)
+_SNAPSHOT_VERSIONS = {}
+_SNAPSHOT_CHECKED_AT = {}
+
 
 class ProjectionService:
     """Fetch player projections from Razzball APIs"""
@@ -44,57 +55,99 @@ class ProjectionService:
         else:
             self.api_url = self.ROS_URL
 
+    def download_projections(self) -> pd.DataFrame:
+        """
+        Fetch projections straight from Razzball API (no caching)
+
+        Returns:
+            DataFrame with player projections
+        """
+        # Set up headers based on Rudy's working Postman example
+        headers = {
+            'User-Agent': 'PostmanRuntime/7.49.1',
+            'Accept': 'application/vnd.razzball-v1+json',
+            'Connection': 'keep-alive'
+        }
+        # Note: Don't specify Accept-Encoding - requests handles it automatically
+
+        if self.API_KEY:
+            # Use the correct header name from Postman
+            headers['Razzball-Api-Key'] = self.API_KEY
+
+        # Use standard requests (Cloudflare now allows access)
+        logger.info(f"Fetching {self.projection_type} projections from {self.api_url}")
+        response = requests.get(self.api_url, headers=headers, timeout=120)  # 2 minutes for large response
+        logger.info(f"Response status: {response.status_code}")
+        logger.info(f"Response size: {len(response.content)} bytes")
+        response.raise_for_status()
+
+        # Parse JSON response
+        try:
+            data = response.json()
+        except ValueError as e:
+            logger.error(f"Failed to parse JSON. Response preview: {response.text[:500]}")
+            raise
+
+        # Convert to DataFrame
+        # API should return a list of player objects
+        if isinstance(data, list):
+            return pd.DataFrame(data)
+        elif isinstance(data, dict) and 'players' in data:
+            return pd.DataFrame(data['players'])
+        elif isinstance(data, dict) and 'data' in data:
+            return pd.DataFrame(data['data'])
+        else:
+            return pd.DataFrame(data)
+
+    def _refresh_from_snapshot(self) -> None:
+        """
+        Swap in the shared snapshot if the sync worker published a newer one
+
+        Checks the version at most every PROJECTION_SNAPSHOT_CHECK_SECONDS;
+        a new version also drops chat context enriched from the old one.
+        """
+        now = time.monotonic()
+        if now - _SNAPSHOT_CHECKED_AT.get(self.projection_type, float('-inf')) < settings.PROJECTION_SNAPSHOT_CHECK_SECONDS:
+            return
+        _SNAPSHOT_CHECKED_AT[self.projection_type] = now
+
+        db = SessionLocal()
+        try:
+            version = snapshot_version(db, self.projection_type)
+            if version is None or version == _SNAPSHOT_VERSIONS.get(self.projection_type):
+                return
+
+            version, df = load_snapshot(db, self.projection_type)
+        except Exception as e:
+            logger.warning(f"Could not read {self.projection_type} projection snapshot: {str(e)}")
+            return
+        finally:
+            db.close()
+
+        _PROJECTION_CACHE[self.projection_type] = df
+        _SNAPSHOT_VERSIONS[self.projection_type] = version
+        context_cache.clear()
+        logger.info(f"Loaded {self.projection_type} projection snapshot v{version} ({len(df)} players)")
+
     def fetch_projections(self) -> pd.DataFrame:
         """
-        Fetch projections from Razzball API (with global caching)
+        Get projections - shared snapshot first, Razzball API only if none was published yet,
+        and the stored projection tables if the API call fails
 
         Returns:
             DataFrame with player projections
         """
         global _PROJECTION_CACHE
 
+        self._refresh_from_snapshot()
+
         # Check global cache first
         if self.projection_type in _PROJECTION_CACHE:
             logger.info(f"Using cached {self.projection_type} projections ({len(_PROJECTION_CACHE[self.projection_type])} players)")
             return _PROJECTION_CACHE[self.projection_type]
 
         try:
-            # Set up headers based on Rudy's working Postman example
-            headers = {
-                'User-Agent': 'PostmanRuntime/7.49.1',
-                'Accept': 'application/vnd.razzball-v1+json',
-                'Connection': 'keep-alive'
-            }
-            # Note: Don't specify Accept-Encoding - requests handles it automatically
-
-            if self.API_KEY:
-                # Use the correct header name from Postman
-                headers['Razzball-Api-Key'] = self.API_KEY
-
-            # Use standard requests (Cloudflare now allows access)
-            logger.info(f"Fetching {self.projection_type} projections from {self.api_url}")
-            response = requests.get(self.api_url, headers=headers, timeout=120)  # 2 minutes for large response
-            logger.info(f"Response status: {response.status_code}")
-            logger.info(f"Response size: {len(response.content)} bytes")
-            response.raise_for_status()
-
-            # Parse JSON response
-            try:
-                data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON. Response preview: {response.text[:500]}")
-                raise
-
-            # Convert to DataFrame
-            # API should return a list of player objects
-            if isinstance(data, list):
-                df = pd.DataFrame(data)
-            elif isinstance(data, dict) and 'players' in data:
-                df = pd.DataFrame(data['players'])
-            elif isinstance(data, dict) and 'data' in data:
-                df = pd.DataFrame(data['data'])
-            else:
-                df = pd.DataFrame(data)
+            df = self.download_projections()
 
             # Cache globally for fast subsequent requests
             _PROJECTION_CACHE[self.projection_type] = df
@@ -103,11 +156,40 @@ class ProjectionService:
 
         except Exception as e:
             logger.error(f"Error fetching projections from API: {str(e)}")
-            # Return cached version if available
-            if self.projection_type in _PROJECTION_CACHE:
-                logger.warning("Using cached projections from previous fetch")
-                return _PROJECTION_CACHE[self.projection_type]
-            raise
+
+            # Fall back to the newest period synced into the projection tables
+            df = self.load_stored_projections()
+            if df is None:
+                raise
+            # Cached like a download; a newer published snapshot still replaces it
+            _PROJECTION_CACHE[self.projection_type] = df
+            logger.info(f"Using {len(df)} stored {self.projection_type} projections instead")
+            return df
+
+    def load_stored_projections(self) -> Optional[pd.DataFrame]:
+        """
+        Newest stored period of this horizon from the projection tables, None if none was synced
+
+        Columns are razzball_id, name, mlb_team, position and the lowercase
+        stat keys, with stats as floats (NaN when missing) whichever way
+        they are stored.
+        """
+        from app.services.projection_store import STAT_COLUMNS, read_projections
+
+        db = SessionLocal()
+        try:
+            rows = read_projections(db, self.projection_type)
+        except Exception as e:
+            logger.warning(f"Could not read stored {self.projection_type} projections: {str(e)}")
+            return None
+        finally:
+            db.close()
+
+        if not rows:
+            return None
+        df = pd.DataFrame(rows)
+        df[list(STAT_COLUMNS)] = df[list(STAT_COLUMNS)].astype(float)
+        return df
 
     def get_player_projection(self, player_name: str) -> Optional[Dict]:
         """
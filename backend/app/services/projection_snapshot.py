@@ -0,0 +1,44 @@
+"""Projection Snapshot - Publish and read the shared Razzball feed per horizon"""
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional, Tuple
+import json
+
+import pandas as pd
+
+from app.models import ProjectionSnapshot
+
+
+def publish_snapshot(db: Session, horizon: str, frame: pd.DataFrame) -> int:
+    """
+    Store a freshly fetched feed as the horizon's current snapshot (commits)
+
+    Returns:
+        New snapshot version
+    """
+    payload = frame.to_json(orient='records')
+    snapshot = db.get(ProjectionSnapshot, horizon)
+
+    if snapshot is None:
+        snapshot = ProjectionSnapshot(horizon=horizon, version=1, payload=payload)
+        db.add(snapshot)
+    else:
+        snapshot.version += 1
+        snapshot.payload = payload
+        snapshot.fetched_at = datetime.utcnow()
+
+    db.commit()
+    return snapshot.version
+
+
+def snapshot_version(db: Session, horizon: str) -> Optional[int]:
+    """Current version of a horizon's snapshot (one primary-key lookup), None if never published"""
+    return db.query(ProjectionSnapshot.version).filter(ProjectionSnapshot.horizon == horizon).scalar()
+
+
+def load_snapshot(db: Session, horizon: str) -> Optional[Tuple[int, pd.DataFrame]]:
+    """(version, frame) of a horizon's snapshot, None if never published"""
+    snapshot = db.get(ProjectionSnapshot, horizon)
+    if snapshot is None:
+        return None
+    return snapshot.version, pd.DataFrame(json.loads(snapshot.payload))
@@ -0,0 +1,75 @@
+"""
+Projection Storage - Convert stored projection stat columns to the type PROJECTION_FLOAT_STATS selects
+
+Migrations always leave the stats DECIMAL; run this after `alembic
+upgrade head` when the setting is on, and again after changing it.
+Columns a migration hasn't created yet are skipped.
+"""
+from alembic.operations import Operations
+from sqlalchemy import Float, Numeric, inspect
+from typing import Dict, List
+
+from app.models import ProjectionDaily, ProjectionWeekly, ProjectionROS, ProjectionLatest
+
+TABLES = tuple(model.__table__ for model in (ProjectionDaily, ProjectionWeekly, ProjectionROS, ProjectionLatest))
+
+
+def pending_columns(ops: Operations) -> Dict[str, List[str]]:
+    """Stat columns whose stored type (float or DECIMAL) differs from the model's, per table (missing ones skipped)"""
+    inspector = inspect(ops.get_bind())
+    pending = {}
+    for table in TABLES:
+        stored = {c['name']: c['type'] for c in inspector.get_columns(table.name)}
+        columns = [
+            column.name for column in table.columns
+            if isinstance(column.type, Numeric) and column.name in stored
+            and isinstance(column.type, Float) != isinstance(stored[column.name], Float)
+        ]
+        if columns:
+            pending[table.name] = columns
+    return pending
+
+
+def align_stat_columns(ops: Operations) -> Dict[str, List[str]]:
+    """
+    Convert stat columns to the models' type in place
+
+    A plain ALTER on PostgreSQL; SQLite rebuilds each table in batch mode.
+    Columns already stored as the model's type are left alone. Going to
+    DECIMAL rounds every value to the column's scale.
+
+    Args:
+        ops: Alembic operations bound to a connection
+
+    Returns:
+        Converted column names per table
+    """
+    inspector = inspect(ops.get_bind())
+    pending = pending_columns(ops)
+
+    for table in TABLES:
+        if table.name not in pending:
+            continue
+        stored = {c['name']: c['type'] for c in inspector.get_columns(table.name)}
+        with ops.batch_alter_table(table.name) as batch:
+            for name in pending[table.name]:
+                batch.alter_column(
+                    name, type_=table.c[name].type, existing_type=stored[name], existing_nullable=True
+                )
+
+    return pending
+
+
+# Apply PROJECTION_FLOAT_STATS to the database (after migrating, or after changing it)
+if __name__ == "__main__":
+    from alembic.migration import MigrationContext
+    from app.config import get_settings
+    from app.database import engine
+
+    target = 'float' if get_settings().PROJECTION_FLOAT_STATS else 'DECIMAL'
+    with engine.begin() as connection:
+        converted = align_stat_columns(Operations(MigrationContext.configure(connection)))
+
+    for table, columns in converted.items():
+        print(f"{table}: {len(columns)} stat columns -> {target}")
+    print(f"Projection stats are stored as {target}")
@@ -0,0 +1,323 @@
+"""Projection Store - Bulk writes of Razzball projections"""
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from app.models import (
+    Player, Roster, ProjectionDaily, ProjectionWeekly, ProjectionROS, ProjectionLatest, DataVersion
+)
+
+# Stat columns shared by the daily, weekly and ROS projection tables
+STAT_COLUMNS = (
+    'pa', 'ab', 'h', 'r', 'hr', 'rbi', 'sb', 'bb', 'so', 'avg', 'obp', 'slg',
+    'ip', 'k', 'w', 'l', 'sv', 'era', 'whip',
+)
+
+# Horizon -> (table, period column of its unique constraint)
+HORIZONS = {
+    'daily': (ProjectionDaily, 'date'),
+    'weekly': (ProjectionWeekly, 'week_start'),
+    'ros': (ProjectionROS, 'season'),
+}
+
+# Rows per executemany batch
+UPSERT_BATCH_SIZE = 500
+
+
+def period_for(horizon: str, day: date) -> Any:
+    """Period key a day falls in: the day, its week's Monday, or its season"""
+    if horizon == 'daily':
+        return day
+    if horizon == 'weekly':
+        return day - timedelta(days=day.weekday())
+    if horizon == 'ros':
+        return day.year
+    raise ValueError(f"Unknown projection horizon: {horizon}")
+
+
+def _dialect_insert(db: Session):
+    """INSERT construct with ON CONFLICT support for the session's database"""
+    dialect = db.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"Upserts are not supported on {dialect}")
+    return dialect_insert
+
+
+def upsert_rows(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str]
+) -> None:
+    """
+    INSERT ... ON CONFLICT DO UPDATE in batches
+
+    On conflict, a column is only overwritten when the new value is not
+    NULL, so partial feeds never blank out stats stored earlier. With no
+    update_columns, conflicting rows are skipped (DO NOTHING).
+
+    Args:
+        db: Database session (not committed)
+        model: Mapped class whose table has a unique constraint on conflict_columns
+        rows: Dicts with identical keys; at most one per conflict key
+        conflict_columns: Columns of the unique constraint
+        update_columns: Columns to refresh on conflict
+    """
+    table = model.__table__
+    stmt = _dialect_insert(db)(table)
+    if update_columns:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_={col: func.coalesce(stmt.excluded[col], table.c[col]) for col in update_columns}
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+    # One compiled statement, executed with a parameter list per batch
+    # (a multi-row VALUES clause would be recompiled for every batch)
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        db.execute(stmt, rows[start:start + UPSERT_BATCH_SIZE])
+
+
+def player_ids_by_razzball(db: Session, projections: pd.DataFrame) -> Dict[int, int]:
+    """
+    razzball_id -> player.id for every projection, creating missing players
+
+    One query loads the known IDs; players not seen before are created
+    with one bulk INSERT ... RETURNING.
+    """
+    known = dict(
+        db.query(Player.razzball_id, Player.id).filter(Player.razzball_id.isnot(None))
+    )
+
+    new = projections.drop_duplicates('razzball_id')
+    new = new[~new['razzball_id'].isin(known.keys())]
+
+    if not new.empty:
+        rows = pd.DataFrame({
+            'razzball_id': new['razzball_id'],
+            'name': new['name'],
+            'team': new['mlb_team'] if 'mlb_team' in new else None,
+            'position': new['position'] if 'position' in new else None,
+        })
+        created = db.execute(
+            insert(Player).returning(Player.razzball_id, Player.id),
+            records_from_frame(rows)
+        )
+        known.update((razzball_id, player_id) for razzball_id, player_id in created)
+
+    return known
+
+
+def records_from_frame(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Rows as dicts of plain Python values, NaN as None (numpy scalars don't bind)"""
+    return frame.astype(object).where(frame.notna(), None).to_dict('records')
+
+
+def store_projections(
+    db: Session,
+    model,
+    key_column: str,
+    key_value: Any,
+    projections: Union[pd.DataFrame, List[Dict]]
+) -> int:
+    """
+    Upsert one batch of projections (e.g. one day) for all players
+
+    Works on columns: player IDs are mapped onto the frame, and rows for
+    the same player are merged with groupby().last() - later non-null
+    values win, as the old row-by-row path did.
+
+    Args:
+        db: Database session (not committed)
+        model: ProjectionDaily / ProjectionWeekly / ProjectionROS
+        key_column: Period column of the unique constraint ('date', 'week_start', 'season')
+        key_value: Value of that column for every row
+        projections: Frame or dicts with razzball_id, name, mlb_team, position and stat keys
+
+    Returns:
+        Number of projection rows processed (same count as before: one per input)
+    """
+    frame = projections if isinstance(projections, pd.DataFrame) else pd.DataFrame(list(projections))
+    if frame.empty:
+        return 0
+
+    player_ids = player_ids_by_razzball(db, frame)
+    player_col = frame['razzball_id'].map(player_ids)
+
+    stats = [col for col in STAT_COLUMNS if col in frame]
+    merged = frame[stats].groupby(player_col.rename('player_id'), sort=False).last().reset_index()
+
+    fetched_at = datetime.utcnow()
+    rows = records_from_frame(merged)
+    for row in rows:
+        for col in STAT_COLUMNS:
+            row.setdefault(col, None)
+        row[key_column] = key_value
+        row['fetched_at'] = fetched_at
+
+    upsert_rows(db, model, rows, ('player_id', key_column), STAT_COLUMNS)
+
+    if model is ProjectionDaily:
+        update_latest(db, key_value, [row['player_id'] for row in rows])
+
+    return len(frame)
+
+
+def update_latest(db: Session, day: date, player_ids: List[int]) -> None:
+    """
+    Mirror these players' projections_daily rows for `day` into projections_latest
+
+    The daily rows are read back after their upsert, so the copy includes
+    values merged from earlier partial syncs. Players whose latest row is
+    already from a later day are left alone.
+    """
+    table = ProjectionLatest.__table__
+    columns = ('player_id', 'date', 'fetched_at') + STAT_COLUMNS
+
+    stmt = _dialect_insert(db)(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['player_id'],
+        set_={col: stmt.excluded[col] for col in columns if col != 'player_id'},
+        where=stmt.excluded.date >= table.c.date
+    )
+
+    written = False
+    daily = [getattr(ProjectionDaily, col) for col in columns]
+    for start in range(0, len(player_ids), UPSERT_BATCH_SIZE):
+        chunk = player_ids[start:start + UPSERT_BATCH_SIZE]
+        rows = db.query(*daily).filter(ProjectionDaily.date == day, ProjectionDaily.player_id.in_(chunk))
+        latest = [dict(zip(columns, row)) for row in rows]
+        if latest:
+            db.execute(stmt, latest)
+            written = True
+
+    if written:
+        bump_latest_version(db)
+
+
+def rebuild_latest(db: Session) -> int:
+    """
+    Refill projections_latest from projections_daily (backfill / repair; not committed)
+
+    Returns:
+        Number of players with a latest projection
+    """
+    newest = (
+        db.query(ProjectionDaily.player_id, func.max(ProjectionDaily.date).label('date'))
+        .group_by(ProjectionDaily.player_id)
+        .subquery()
+    )
+    columns = ('player_id', 'date', 'fetched_at') + STAT_COLUMNS
+    rows = (
+        db.query(*[getattr(ProjectionDaily, col) for col in columns])
+        .join(newest, (ProjectionDaily.player_id == newest.c.player_id) & (ProjectionDaily.date == newest.c.date))
+    )
+
+    db.query(ProjectionLatest).delete(synchronize_session=False)
+    latest = [dict(zip(columns, row)) for row in rows]
+    for start in range(0, len(latest), UPSERT_BATCH_SIZE):
+        db.execute(insert(ProjectionLatest), latest[start:start + UPSERT_BATCH_SIZE])
+
+    bump_latest_version(db)
+    return len(latest)
+
+
+def bump_latest_version(db: Session) -> None:
+    """
+    Count a write to projections_latest (not committed)
+
+    Runs in the writer's transaction, so readers see the new version
+    exactly when they can see the new rows. Roster ETags include it.
+    """
+    table = DataVersion.__table__
+    stmt = _dialect_insert(db)(table).values(name=ProjectionLatest.__tablename__, version=1)
+    db.execute(stmt.on_conflict_do_update(index_elements=['name'], set_={'version': table.c.version + 1}))
+
+
+def read_projections(db: Session, horizon: str, period: Optional[Any] = None) -> List[Dict]:
+    """
+    Stored projections for one period, with player name/team/position
+
+    Args:
+        db: Database session
+        horizon: 'daily', 'weekly' or 'ros'
+        period: Period key (default: the latest one stored)
+
+    Returns:
+        Dicts with razzball_id, name, mlb_team, position and stat keys
+    """
+    model, key_column = HORIZONS[horizon]
+    period_col = getattr(model, key_column)
+
+    if period is None:
+        period = db.query(func.max(period_col)).scalar()
+        if period is None:
+            return []
+
+    columns = [getattr(model, col) for col in STAT_COLUMNS]
+    rows = (
+        db.query(Player.razzball_id, Player.name, Player.team, Player.position, *columns)
+        .join(model, model.player_id == Player.id)
+        .filter(period_col == period)
+    )
+
+    keys = ('razzball_id', 'name', 'mlb_team', 'position') + STAT_COLUMNS
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def read_projection_arrays(
+    db: Session,
+    horizon: str,
+    period: Optional[Any] = None,
+    league_id: Optional[uuid.UUID] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stored projections as NumPy arrays, for whole-league math without per-row objects
+
+    Rows come back as column tuples (no ORM objects) and are copied into
+    one float64 matrix.
+
+    Args:
+        db: Database session
+        horizon: 'daily', 'weekly', 'ros', or 'latest' (each player's newest daily row)
+        period: Period key for daily/weekly/ros (default: the latest one stored)
+        league_id: Only players on this league's rosters
+
+    Returns:
+        (player IDs, int64 [n]; stats, float64 [n, len(STAT_COLUMNS)] in
+        STAT_COLUMNS order, NaN where a stat is missing)
+    """
+    if horizon == 'latest':
+        model, period_col = ProjectionLatest, None
+    else:
+        model, key_column = HORIZONS[horizon]
+        period_col = getattr(model, key_column)
+        if period is None:
+            period = db.query(func.max(period_col)).scalar()
+
+    query = db.query(model.player_id, *[getattr(model, col) for col in STAT_COLUMNS])
+    if period_col is not None:
+        query = query.filter(period_col == period)
+    if league_id is not None:
+        query = query.filter(
+            model.player_id.in_(db.query(Roster.player_id).filter(Roster.league_id == league_id))
+        )
+
+    rows = query.order_by(model.player_id).all()
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty((0, len(STAT_COLUMNS)), dtype=np.float64)
+
+    # Plain tuples convert ~7x faster than Row objects; None -> NaN on the way in
+    table = np.array([tuple(row) for row in rows], dtype=np.float64)
+    return table[:, 0].astype(np.int64), table[:, 1:]
@@ -0,0 +1,110 @@
+"""Roster Pagination - Keyset cursors, stat sorting and field selection for roster reads"""
+from sqlalchemy import Row, Select, and_, or_
+from typing import Any, Optional, Set, Tuple
+import base64
+import json
+
+from app.models import Roster, Player, ProjectionLatest
+from app.schemas.league import PlayerInRoster
+
+# Sort key -> column (stats come from each player's latest projection, NULLs sort last)
+SORT_COLUMNS = {
+    'id': Roster.id,  # Upload order
+    'name': Player.name,
+    'hr': ProjectionLatest.hr,
+    'rbi': ProjectionLatest.rbi,
+    'sb': ProjectionLatest.sb,
+    'avg': ProjectionLatest.avg,
+}
+
+# Projections read best-first by default; id and name read A-Z / upload order
+DEFAULT_ORDER = {'id': 'asc', 'name': 'asc', 'hr': 'desc', 'rbi': 'desc', 'sb': 'desc', 'avg': 'desc'}
+
+MAX_PAGE_SIZE = 500
+
+
+class PageError(ValueError):
+    """Bad sort, order, cursor or field list (reported to the client as 400)"""
+
+
+def resolve_order(sort: str, order: Optional[str]) -> str:
+    """Validated sort direction, defaulting per sort key"""
+    if sort not in SORT_COLUMNS:
+        raise PageError(f"Unknown sort '{sort}' (use one of: {', '.join(SORT_COLUMNS)})")
+    order = order or DEFAULT_ORDER[sort]
+    if order not in ('asc', 'desc'):
+        raise PageError("order must be 'asc' or 'desc'")
+    return order
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """Comma-separated PlayerInRoster field names -> set (None means every field)"""
+    if not fields:
+        return None
+    selected = {name.strip() for name in fields.split(',') if name.strip()}
+    unknown = selected - set(PlayerInRoster.model_fields)
+    if unknown:
+        raise PageError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return selected
+
+
+def encode_cursor(sort: str, order: str, value: Any, roster_id: int) -> str:
+    """Opaque cursor pointing just past a row (its sort value and roster id)"""
+    payload = json.dumps({'s': sort, 'o': order, 'v': value, 'id': roster_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, sort: str, order: str) -> Tuple[Any, int]:
+    """
+    (sort value, roster id) from a cursor issued for the same sort and order
+
+    Raises:
+        PageError: Malformed cursor, or one from a different sort/order
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_sort, cursor_order, value, roster_id = payload['s'], payload['o'], payload['v'], int(payload['id'])
+    except (ValueError, KeyError, TypeError):
+        raise PageError("Invalid cursor")
+
+    if (cursor_sort, cursor_order) != (sort, order):
+        raise PageError("Cursor was issued for a different sort or order")
+    return value, roster_id
+
+
+def order_page(query: Select, sort: str, order: str, cursor: Optional[str] = None) -> Select:
+    """
+    Order a roster query for keyset paging and skip past the cursor
+
+    Rows are ordered by the sort column (NULLs last) and then roster id,
+    so every position is unique and a cursor is just the last row's
+    (value, id). OFFSET isn't used, so however deep the page, only its
+    own rows are loaded and serialized.
+    """
+    column = SORT_COLUMNS[sort]
+    descending = order == 'desc'
+
+    if sort == 'id':
+        if cursor:
+            _, after_id = decode_cursor(cursor, sort, order)
+            query = query.where(Roster.id < after_id if descending else Roster.id > after_id)
+        return query.order_by(Roster.id.desc() if descending else Roster.id)
+
+    if cursor:
+        value, after_id = decode_cursor(cursor, sort, order)
+        if value is None:
+            # Already in the NULL tail: only later NULL rows remain
+            query = query.where(and_(column.is_(None), Roster.id > after_id))
+        else:
+            beyond = column < value if descending else column > value
+            query = query.where(or_(beyond, and_(column == value, Roster.id > after_id), column.is_(None)))
+
+    ordered = column.desc() if descending else column.asc()
+    return query.order_by(ordered.nulls_last(), Roster.id)
+
+
+def page_cursor(sort: str, order: str, last_row: Row) -> str:
+    """Cursor for the page after the one ending with `last_row` (a row labelled like PlayerInRoster, plus roster_id)"""
+    value = last_row.roster_id if sort == 'id' else getattr(last_row, sort)
+    return encode_cursor(sort, order, value, last_row.roster_id)
@@ -0,0 +1,11 @@
+"""Benchmark scripts - run from backend/ as `python -m benchmarks.<name>`"""
+import os
+
+# Benchmarks run against a throwaway local SQLite database unless told otherwise
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark.db")
+os.environ.setdefault("RAZZBALL_API_KEY", "benchmark")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("ENVIRONMENT", "benchmark")
+os.environ.setdefault("PROJECTION_SYNC_ENABLED", "false")  # No background Razzball calls, whatever .env says
+os.environ.setdefault("DB_AUTO_MIGRATE", "true")  # Fresh benchmark databases are migrated on app startup
@@ -0,0 +1,172 @@
+"""
+Chat latency benchmark - POST /api/chat/ end to end at increasing concurrency, offline
+
+Starts the fake Razzball and LLM servers (benchmarks.fake_servers), points
+the app at them, serves the app with uvicorn on a local port and uploads
+a few synthetic leagues whose players are in the fake projections. Every
+league is chatted with once first, so the projection download and
+context enrichment are cached (that first request's stages are shown
+separately). Then for each concurrency level, that many clients send
+--requests chats between them, spread over the leagues.
+
+Reports throughput and p50/p95/p99 latency for the whole request and for
+each stage from the app's Server-Timing header: db (league and rosters),
+context (projection enrichment), llm (completion call) and other (HTTP,
+routing, threadpool queueing). Replies that didn't come from the fake
+LLM (the app's error fallback) are counted as errors. The fakes, the app
+and the clients share one process, so absolute numbers at high
+concurrency include GIL contention; compare runs on the same machine.
+
+Usage (from backend/):
+    python -m benchmarks.bench_chat --concurrency 1,4,16,32 --requests 64 --ttft 0.5 --tokens 150
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import Dict, List
+
+from benchmarks import synthetic
+from benchmarks.bench_concurrency import percentile
+from benchmarks.fake_servers import (
+    REPLY_MARKER, BackgroundServer, LLMConfig, RazzballConfig, llm_app, razzball_app
+)
+
+STAGES = ("db", "context", "llm", "other")
+
+
+def parse_server_timing(header: str) -> Dict[str, float]:
+    """'db;dur=1.2, llm;dur=500.0' -> {'db': 0.0012, 'llm': 0.5} (seconds)"""
+    stages = {}
+    for entry in filter(None, (part.strip() for part in header.split(","))):
+        name, *params = (piece.strip() for piece in entry.split(";"))
+        for param in params:
+            key, _, value = param.partition("=")
+            if key == "dur":
+                stages[name] = float(value) / 1000
+    return stages
+
+
+async def chat_once(client, league_id: str, message: str) -> Dict[str, float]:
+    """One chat request: total seconds, per-stage seconds and whether the reply is the fake LLM's"""
+    start = time.perf_counter()
+    response = await client.post("/api/chat/", json={"league_id": league_id, "message": message})
+    total = time.perf_counter() - start
+
+    stages = parse_server_timing(response.headers.get("server-timing", ""))
+    ok = response.status_code == 200 and response.json()["response"].startswith(REPLY_MARKER)
+    return {
+        "total": total,
+        **stages,
+        "other": total - sum(stages.values()),
+        "ok": ok,
+    }
+
+
+async def run_level(client, concurrency: int, requests: int, league_ids: List[str]) -> Dict[str, object]:
+    """`requests` chats from `concurrency` clients at once"""
+    pending = iter(range(requests))
+    results: List[Dict[str, float]] = []
+
+    async def worker() -> None:
+        for i in pending:
+            results.append(await chat_once(client, league_ids[i % len(league_ids)], "Who should I pick up?"))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    ok = [r for r in results if r["ok"]]
+    return {
+        "concurrency": concurrency,
+        "requests": len(results),
+        "errors": len(results) - len(ok),
+        "throughput": len(results) / elapsed,
+        "latency": {
+            stage: [r[stage] for r in ok if stage in r]
+            for stage in ("total",) + STAGES
+        },
+    }
+
+
+def print_level(level: Dict[str, object]) -> None:
+    print(
+        f"\nconcurrency {level['concurrency']:>3}: {level['requests']} requests, "
+        f"{level['throughput']:.1f} req/s, {level['errors']} errors"
+    )
+    for stage, values in level["latency"].items():
+        if not values:
+            continue
+        print(
+            f"  {stage:8} p50 {statistics.median(values) * 1000:8.1f} ms   "
+            f"p95 {percentile(values, 95) * 1000:8.1f} ms   p99 {percentile(values, 99) * 1000:8.1f} ms"
+        )
+
+
+async def upload_leagues(client, leagues: int, rows: int) -> List[str]:
+    """Leagues of the fake projections' players (blank lines keep the uploads from being deduplicated)"""
+    payload = synthetic.fantrax_csv(rows)
+    league_ids = []
+    for i in range(leagues):
+        response = await client.post(
+            "/api/csv/upload", files={"file": ("chat.csv", payload + b"\n" * i, "text/csv")}
+        )
+        response.raise_for_status()
+        league_ids.append(response.json()["id"])
+    return league_ids
+
+
+async def drive(app_url: str, args) -> None:
+    import httpx
+
+    connections = max(args.concurrency_levels)
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    async with httpx.AsyncClient(base_url=app_url, timeout=300, limits=limits) as client:
+        league_ids = await upload_leagues(client, args.leagues, args.rows)
+
+        first = await chat_once(client, league_ids[0], "Who should I pick up?")
+        for league_id in league_ids[1:]:
+            await chat_once(client, league_id, "Who should I pick up?")
+        print(
+            "first request (projection download, client setup): "
+            + ", ".join(f"{stage} {first[stage] * 1000:.1f} ms" for stage in ("total",) + STAGES if stage in first)
+            + ("" if first["ok"] else "  [reply was not from the fake LLM]")
+        )
+
+        for concurrency in args.concurrency_levels:
+            print_level(await run_level(client, concurrency, max(args.requests, concurrency), league_ids))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,4,16,32", help="Comma-separated client counts")
+    parser.add_argument("--requests", type=int, default=64, help="Chats per concurrency level")
+    parser.add_argument("--leagues", type=int, default=4, help="Synthetic leagues chatted about")
+    parser.add_argument("--rows", type=int, default=300, help="Players per league")
+    parser.add_argument("--players", type=int, default=RazzballConfig.players, help="Rows in the fake projections")
+    parser.add_argument("--razzball-latency", type=float, default=RazzballConfig.latency, help="Seconds")
+    parser.add_argument("--ttft", type=float, default=LLMConfig.ttft, help="Fake LLM seconds to first token")
+    parser.add_argument("--token-interval", type=float, default=LLMConfig.token_interval, help="Seconds per token")
+    parser.add_argument("--tokens", type=int, default=LLMConfig.tokens, help="Fake reply length")
+    args = parser.parse_args()
+    args.concurrency_levels = [int(c) for c in args.concurrency.split(",")]
+
+    if os.path.exists("benchmark.db"):
+        os.remove("benchmark.db")
+
+    razzball = RazzballConfig(latency=args.razzball_latency, players=max(args.players, args.rows))
+    llm = LLMConfig(ttft=args.ttft, token_interval=args.token_interval, tokens=args.tokens)
+    with BackgroundServer(razzball_app(razzball)) as fake_razzball, BackgroundServer(llm_app(llm)) as fake_llm:
+        # Read when the services first load, so set before the app is imported
+        os.environ["RAZZBALL_API_BASE_URL"] = f"{fake_razzball.url}/mlb"
+        os.environ["OPENAI_BASE_URL"] = f"{fake_llm.url}/v1"
+        os.environ["ANTHROPIC_BASE_URL"] = fake_llm.url
+
+        from app.main import app
+        with BackgroundServer(app) as server:
+            asyncio.run(drive(server.url, args))
+
+
+if __name__ == "__main__":
+    main()
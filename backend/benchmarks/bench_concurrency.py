@@ -0,0 +1,131 @@
+"""
+Concurrency benchmark - roster reads on the async session vs. a blocking one
+
+Serves GET /api/csv/{league_id}/roster to many concurrent clients on one
+event loop (in-process ASGI transport) and, side by side, the same query
+run the old way: a sync Session inside an `async def` handler. While each
+runs, a probe hits /health every few milliseconds; its latency shows how
+long the event loop was blocked by DB waits.
+
+Runs on SQLite by default; point DATABASE_URL at PostgreSQL for numbers
+with real network round trips (and DB_POOL_SIZE / DB_MAX_OVERFLOW in play).
+
+Usage (from backend/):
+    python -m benchmarks.bench_concurrency --clients 32 --requests 20 --rows 500
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+from typing import List, Tuple
+
+from benchmarks.check_query_plans import seed
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def add_blocking_route(app) -> None:
+    """The pre-async roster handler: sync session in an async def, blocking the loop per query"""
+    from fastapi import HTTPException
+    from app.database import SessionLocal
+    from app.models import League
+    from fastapi.responses import ORJSONResponse
+    from app.routers.csv import _roster_query, _roster_body
+    from app.services.roster_pagination import order_page
+
+    async def blocking_roster(league_id: uuid.UUID):
+        db = SessionLocal()
+        try:
+            league = db.get(League, league_id)
+            if not league:
+                raise HTTPException(status_code=404, detail="League not found")
+            rows = db.execute(order_page(_roster_query(league_id), 'id', 'asc')).all()
+            return ORJSONResponse(_roster_body(league.id, league.league_type, rows))
+        finally:
+            db.close()
+
+    app.add_api_route("/bench/blocking/{league_id}/roster", blocking_roster, methods=["GET"])
+
+
+async def load(client, path: str, clients: int, requests: int) -> Tuple[float, List[float], List[float]]:
+    """
+    `clients` concurrent loops of `requests` GETs, with a /health probe alongside
+
+    Returns:
+        (wall seconds, request latencies, probe latencies)
+    """
+    latencies, probes = [], []
+    done = asyncio.Event()
+
+    async def worker() -> None:
+        for _ in range(requests):
+            start = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    async def probe() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await client.get("/health")
+            probes.append(time.perf_counter() - start)
+            await asyncio.sleep(0.005)
+
+    prober = asyncio.create_task(probe())
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await prober
+
+    return elapsed, latencies, probes
+
+
+async def run(clients: int, requests: int, leagues: int, rows: int) -> None:
+    import httpx
+    from app.database import init_db, async_engine
+    from app.main import app
+
+    init_db()
+    league_id, _, _ = seed(leagues, rows, days=1)
+    add_blocking_route(app)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label, path in (
+            ("blocking", f"/bench/blocking/{league_id}/roster"),
+            ("async", f"/api/csv/{league_id}/roster"),
+        ):
+            await client.get(path)  # Warm up the pool and statement caches
+            elapsed, latencies, probes = await load(client, path, clients, requests)
+            total = len(latencies)
+            print(
+                f"[{label:8}] {total} requests in {elapsed:.2f}s ({total / elapsed:.0f} req/s), "
+                f"latency p50 {statistics.median(latencies) * 1000:.1f} ms / p95 {percentile(latencies, 95) * 1000:.1f} ms, "
+                f"/health p50 {statistics.median(probes) * 1000:.1f} ms / max {max(probes) * 1000:.1f} ms ({len(probes)} probes)"
+            )
+
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=20, help="Requests per client")
+    parser.add_argument("--leagues", type=int, default=10, help="Synthetic leagues")
+    parser.add_argument("--rows", type=int, default=500, help="Players per league")
+    args = parser.parse_args()
+
+    if os.path.exists("benchmark.db"):
+        os.remove("benchmark.db")
+
+    asyncio.run(run(args.clients, args.requests, args.leagues, args.rows))
+
+
+if __name__ == "__main__":
+    main()
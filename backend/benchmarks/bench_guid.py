@@ -0,0 +1,128 @@
+"""
+GUID storage benchmark - 36-character text vs. 16-byte binary league_id on SQLite
+
+Fills two roster-shaped tables, one with the old text GUID and one with the
+current binary GUID, each indexed like rosters. Then it compares table
+and index size, and the time to load a whole league by league_id and to
+join it against players.
+
+Usage (from backend/):
+    python -m benchmarks.bench_guid --leagues 50 --rows 2000
+"""
+import argparse
+import os
+import time
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Column, DateTime, ForeignKey, Index, Integer, MetaData, String, Table, TypeDecorator, insert, select
+)
+
+
+class TextGUID(TypeDecorator):
+    """GUID as it was stored before: String(36), parsed with uuid.UUID() on every row"""
+    impl = String(36)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else str(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else uuid.UUID(value)
+
+
+def roster_tables(metadata: MetaData):
+    from app.database import GUID
+
+    tables = []
+    for name, guid_type in (('bench_rosters_text', TextGUID), ('bench_rosters_binary', GUID)):
+        table = Table(
+            name, metadata,
+            Column('id', Integer, primary_key=True),
+            Column('league_id', guid_type, nullable=False),
+            Column('player_id', Integer, ForeignKey('players.id'), nullable=False),
+            Column('team_owner', String(255), nullable=False),
+            Column('created_at', DateTime, nullable=False),
+        )
+        Index(f"ix_{name}_league_owner_player", table.c.league_id, table.c.team_owner, table.c.player_id)
+        tables.append(table)
+    return tables
+
+
+def size_bytes(conn, table: str) -> str:
+    """Table + index bytes from SQLite's dbstat (if compiled in)"""
+    try:
+        total = conn.exec_driver_sql(
+            "SELECT SUM(pgsize) FROM dbstat WHERE name = ? OR name LIKE ?", (table, f"ix_{table}%")
+        ).scalar()
+        return f"{total / 1024:.0f} KiB"
+    except Exception:
+        return "n/a (no dbstat)"
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(leagues: int, rows: int) -> None:
+    from app.database import engine, init_db
+    from app.models import Player
+
+    if engine.dialect.name != 'sqlite':
+        raise SystemExit("GUID storage only differs on SQLite (PostgreSQL uses native uuid)")
+
+    init_db()
+    metadata = MetaData()
+    Table('players', metadata, autoload_with=engine)
+    tables = roster_tables(metadata)
+    metadata.create_all(engine, tables=tables)
+
+    now = datetime.utcnow()
+    league_ids = [uuid.uuid4() for _ in range(leagues)]
+    with engine.begin() as conn:
+        conn.execute(insert(Player), [{'name': f"Player {i}", 'created_at': now} for i in range(rows)])
+        player_ids = [pid for (pid,) in conn.execute(select(Player.id))]
+        batch = [
+            {'league_id': lid, 'player_id': pid, 'team_owner': f"Team {i % 12}", 'created_at': now}
+            for lid in league_ids
+            for i, pid in enumerate(player_ids)
+        ]
+        for table in tables:
+            conn.execute(insert(table), batch)
+        conn.exec_driver_sql("ANALYZE")
+
+    target = league_ids[len(league_ids) // 2]
+    with engine.connect() as conn:
+        for table in tables:
+            load = select(table).where(table.c.league_id == target)
+            join = (
+                select(table.c.league_id, table.c.team_owner, Player.name)
+                .join(Player, Player.id == table.c.player_id)
+                .where(table.c.league_id == target)
+            )
+            load_s = best_of(lambda: conn.execute(load).all())
+            join_s = best_of(lambda: conn.execute(join).all())
+            print(
+                f"{table.name:22} size {size_bytes(conn, table.name):>12}, "
+                f"load league {load_s * 1000:7.1f} ms, join players {join_s * 1000:7.1f} ms "
+                f"({rows} rows of {leagues * rows})"
+            )
+
+    metadata.drop_all(engine, tables=tables)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--leagues", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    if os.path.exists("benchmark.db"):
+        os.remove("benchmark.db")
+    run(args.leagues, args.rows)
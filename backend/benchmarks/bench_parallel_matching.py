@@ -0,0 +1,55 @@
+"""
+Parallel fuzzy matching scaling - PlayerIndex.match_many_parallel across core counts
+
+Matches CBS-style names (no IDs) against an in-memory player master table,
+so no database is involved.
+
+Usage (from backend/):
+    python -m benchmarks.bench_parallel_matching --players 12000 --names 3000
+"""
+import argparse
+import io
+import random
+import time
+
+from benchmarks import synthetic
+from app.services.csv_parser import CSVParser
+from app.services.player_index import PlayerIndex
+
+
+def run(players: int, names: int, workers: list) -> None:
+    rng = random.Random(7)
+    rows = [
+        (i + 1, name, rng.choice(synthetic.MLB_TEAMS), rng.choice(synthetic.POSITIONS))
+        for i, name in enumerate(synthetic.player_names(players, seed=7))
+    ]
+    index = PlayerIndex(rows)
+
+    batch, _ = CSVParser.parse_csv(io.BytesIO(synthetic.cbs_csv(names, seed=11)))
+    queries = [(p['name'], p['mlb_team'], None) for p in batch]
+    print(f"{len(queries)} CBS names against {len(index)} players")
+
+    baseline = None
+    serial_result = None
+    for count in workers:
+        start = time.perf_counter()
+        if count <= 1:
+            result = index.match_many(queries)
+        else:
+            result = index.match_many_parallel(queries, count)
+        elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+        serial_result = serial_result or result
+        same = "identical" if result == serial_result else "DIFFERENT"
+        print(f"workers={count:<2} {elapsed:7.2f}s  speedup x{baseline / elapsed:4.1f}  ({same} to first run)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=12000)
+    parser.add_argument("--names", type=int, default=3000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    run(args.players, args.names, args.workers)
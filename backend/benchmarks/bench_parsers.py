@@ -0,0 +1,49 @@
+"""
+Parser micro-benchmarks - CSVParser on synthetic Fantrax, CBS and NFBC files
+
+Usage (from backend/):
+    python -m benchmarks.bench_parsers --sizes 1000 10000 100000
+"""
+import argparse
+import io
+import time
+
+from benchmarks import synthetic
+from app.services.csv_parser import CSVParser
+
+GENERATORS = {
+    'fantrax': synthetic.fantrax_csv,
+    'cbs': synthetic.cbs_csv,
+    'nfbc': synthetic.nfbc_csv,
+}
+
+
+def best_of(repeats: int, fn) -> float:
+    """Fastest of `repeats` runs, in seconds"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(sizes: list, repeats: int) -> None:
+    print(f"{'format':<8} {'rows':>8} {'parse (ms)':>12} {'+records (ms)':>14} {'rows/s':>12}")
+    for league_type, generate in GENERATORS.items():
+        for rows in sizes:
+            payload = generate(rows)
+
+            parse = best_of(repeats, lambda: CSVParser.parse_csv(io.BytesIO(payload)))
+            records = best_of(repeats, lambda: list(CSVParser.parse_csv(io.BytesIO(payload))[0]))
+
+            print(f"{league_type:<8} {rows:>8} {parse * 1000:>12.1f} {records * 1000:>14.1f} {rows / parse:>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.sizes, args.repeats)
@@ -0,0 +1,51 @@
+"""
+Razzball CSV fallback benchmark - parse_daily_csv and the CSV sync path
+
+Times parsing a Razzball export (hitters and pitchers) into projection
+dicts, and a full CSV-fallback sync (parse + bulk upsert), on synthetic files.
+
+Usage (from backend/):
+    python -m benchmarks.bench_projection_csv --rows 5000
+"""
+import argparse
+import os
+import tempfile
+
+from benchmarks import synthetic
+from benchmarks.bench_parsers import best_of
+
+
+def run(rows: int, repeats: int) -> None:
+    from app.database import SessionLocal, init_db
+    from app.services.projection_fetcher import ProjectionFetcher
+
+    init_db()
+    db = SessionLocal()
+    fetcher = ProjectionFetcher(db)
+    fetcher.fetch_projections = lambda horizon, date=None: None  # Always take the CSV fallback
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for player_type in ("hitter", "pitcher"):
+                path = os.path.join(tmp, f"razzball_{player_type}s.csv")
+                with open(path, "wb") as handle:
+                    handle.write(synthetic.razzball_csv(rows, player_type))
+
+                parse = best_of(repeats, lambda: fetcher.parse_daily_csv(path, player_type))
+                sync = best_of(repeats, lambda: fetcher.sync_projections("daily", player_type, "2025-06-01", path))
+
+                print(f"{player_type:<8} {rows} rows: parse {parse * 1000:.1f} ms ({rows / parse:.0f} rows/s), "
+                      f"parse + upsert {sync * 1000:.1f} ms ({rows / sync:.0f} rows/s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    if os.path.exists("benchmark.db"):
+        os.remove("benchmark.db")
+    run(args.rows, args.repeats)
@@ -0,0 +1,135 @@
+"""
+Projection load benchmark - DECIMAL vs. float stat columns, rows vs. NumPy
+
+Part 1 stores the same synthetic stats in a DECIMAL table (the default
+column types) and a float table (PROJECTION_FLOAT_STATS), then times loading every row, building
+PlayerInRoster models from them, summing a column in Python and copying
+them into a NumPy matrix.
+
+Part 2 times the app's own read paths over projections_latest: ORM
+objects (db.query(ProjectionLatest).all()) against
+read_projection_arrays(..., 'latest'), with the stat columns stored as
+PROJECTION_FLOAT_STATS selects (set it to true to time the float path).
+
+Usage (from backend/):
+    python -m benchmarks.bench_projection_load --rows 50000
+"""
+import argparse
+import os
+import random
+import time
+from datetime import date, datetime
+
+import numpy as np
+from sqlalchemy import Column, DECIMAL, Float, Integer, MetaData, Table, insert, select
+
+from app.services.projection_store import STAT_COLUMNS
+
+RATE_COLUMNS = ('avg', 'obp', 'slg')
+
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label:28} {(time.perf_counter() - start) * 1000:8.1f} ms")
+    return result
+
+
+def stat_tables(metadata: MetaData):
+    """Benchmark-only tables with the default DECIMAL types and the optional float type"""
+    decimal = Table(
+        'bench_stats_decimal', metadata,
+        Column('player_id', Integer, primary_key=True),
+        *[Column(col, DECIMAL(5, 3) if col in RATE_COLUMNS else DECIMAL(7, 2)) for col in STAT_COLUMNS],
+    )
+    floats = Table(
+        'bench_stats_float', metadata,
+        Column('player_id', Integer, primary_key=True),
+        *[Column(col, Float) for col in STAT_COLUMNS],
+    )
+    return decimal, floats
+
+
+def synthetic_stats(rows: int):
+    rng = random.Random(7)
+    return [
+        {
+            'player_id': i,
+            **{col: round(rng.uniform(0, 0.4), 3) if col in RATE_COLUMNS else round(rng.uniform(0, 40), 2)
+               for col in STAT_COLUMNS},
+        }
+        for i in range(1, rows + 1)
+    ]
+
+
+def compare_types(rows: int) -> None:
+    from app.database import engine
+    from app.schemas.league import PlayerInRoster
+
+    metadata = MetaData()
+    tables = stat_tables(metadata)
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    data = synthetic_stats(rows)
+    with engine.begin() as conn:
+        for table in tables:
+            conn.execute(insert(table), data)
+
+    for table in tables:
+        print(f"{table.name} ({rows} rows)")
+        with engine.connect() as conn:
+            loaded = timed("load rows", lambda: conn.execute(select(table)).all())
+            timed("build PlayerInRoster", lambda: [
+                PlayerInRoster(id=r.player_id, name="x", mlb_team=None, position=None, owner="x",
+                               hr=r.hr, rbi=r.rbi, sb=r.sb, avg=r.avg)
+                for r in loaded
+            ])
+            timed("sum hr in Python", lambda: sum(r.hr for r in loaded))
+            timed("to NumPy matrix", lambda: np.array([tuple(r) for r in loaded], dtype=np.float64))
+
+    metadata.drop_all(engine)
+
+
+def compare_read_paths(rows: int) -> None:
+    from app.config import get_settings
+    from app.database import SessionLocal
+    from app.models import Player, ProjectionLatest
+    from app.services.projection_store import read_projection_arrays
+
+    now = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        db.execute(insert(Player), [{'name': f"Player {i}", 'created_at': now} for i in range(rows)])
+        player_ids = [pid for (pid,) in db.query(Player.id)]
+        db.execute(insert(ProjectionLatest), [
+            {**{k: v for k, v in row.items() if k != 'player_id'}, 'player_id': pid,
+             'date': date(2025, 6, 1), 'fetched_at': now}
+            for pid, row in zip(player_ids, synthetic_stats(rows))
+        ])
+        db.commit()
+
+        storage = 'float' if get_settings().PROJECTION_FLOAT_STATS else 'DECIMAL'
+        print(f"projections_latest ({rows} rows, {storage} stats)")
+        timed("ORM objects", lambda: db.query(ProjectionLatest).all())
+        db.expunge_all()
+        ids, stats = timed("read_projection_arrays", lambda: read_projection_arrays(db, 'latest'))
+        timed("column means (NumPy)", lambda: np.nanmean(stats, axis=0))
+        print(f"  -> {ids.shape[0]} players x {stats.shape[1]} stats, {stats.dtype}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+
+    if os.path.exists("benchmark.db"):
+        os.remove("benchmark.db")
+
+    from app.database import init_db
+    init_db()
+
+    compare_types(args.rows)
+    compare_read_paths(args.rows)
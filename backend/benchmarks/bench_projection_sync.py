@@ -0,0 +1,55 @@
+"""
+Projection sync benchmark - ProjectionFetcher.store_daily_projections
+
+Times a cold sync (players and projections all new), a warm re-sync of the
+same day (every row updated on conflict) and a partial re-sync with blank
+stats (existing values must survive), with SQL statement counts.
+
+Usage (from backend/):
+    python -m benchmarks.bench_projection_sync --rows 2000
+"""
+import argparse
+import os
+import time
+
+from benchmarks import synthetic
+from benchmarks.bench_upload import QueryCounter
+
+
+def run(rows: int) -> None:
+    from app.database import SessionLocal, engine, init_db
+    from app.models import Player, ProjectionDaily
+    from app.services.projection_fetcher import ProjectionFetcher
+
+    init_db()
+    counter = QueryCounter(engine)
+    projections = synthetic.razzball_projections(rows)
+    partial = [{**p, 'hr': None, 'sb': None} for p in projections]
+
+    db = SessionLocal()
+    try:
+        fetcher = ProjectionFetcher(db)
+        for label, batch in (("cold", projections), ("warm", projections), ("partial", partial)):
+            counter.reset()
+            start = time.perf_counter()
+            count = fetcher.store_daily_projections(batch, "2025-06-01")
+            elapsed = time.perf_counter() - start
+            print(f"[{label}] {count} rows in {elapsed:.3f}s ({count / elapsed:.0f} rows/s), "
+                  f"{counter.statements} SQL statements, {counter.commits} commits")
+
+        players = db.query(Player).count()
+        stored = db.query(ProjectionDaily).count()
+        blank_hr = db.query(ProjectionDaily).filter(ProjectionDaily.hr.is_(None)).count()
+        print(f"players: {players}, projections: {stored}, rows with HR blanked by partial sync: {blank_hr}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    if os.path.exists("benchmark.db"):
+        os.remove("benchmark.db")
+    run(args.rows)
@@ -0,0 +1,63 @@
+"""
+Roster read benchmark - full payload, conditional revalidation and one page
+
+Uploads a synthetic league and times GET /api/csv/{league_id}/roster:
+a full read, the same read revalidated with If-None-Match (304), and a
+50-row page sorted by HR, plus response sizes with and without gzip.
+
+Usage (from backend/):
+    python -m benchmarks.bench_roster_read --rows 5000 --repeat 20
+"""
+import argparse
+import os
+import statistics
+import time
+
+from benchmarks import synthetic
+
+
+def timed_get(client, path: str, repeat: int, **kwargs):
+    """(median seconds, last response) over `repeat` GETs"""
+    times, response = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(path, **kwargs)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), response
+
+
+def run(rows: int, repeat: int) -> None:
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as client:
+        league_id = client.post(
+            "/api/csv/upload",
+            files={"file": ("bench.csv", synthetic.fantrax_csv(rows), "text/csv")}
+        ).json()["id"]
+        path = f"/api/csv/{league_id}/roster"
+
+        full, response = timed_get(client, path, repeat, headers={"Accept-Encoding": "identity"})
+        etag = response.headers["etag"]
+        print(f"full roster        {full * 1000:7.1f} ms  {len(response.content) / 1024:7.0f} KiB ({rows} players)")
+
+        gzipped, response = timed_get(client, path, repeat, headers={"Accept-Encoding": "gzip"})
+        wire = int(response.headers.get("content-length", len(response.content)))
+        print(f"full roster, gzip  {gzipped * 1000:7.1f} ms  {wire / 1024:7.0f} KiB on the wire")
+
+        revalidated, response = timed_get(client, path, repeat, headers={"If-None-Match": etag})
+        print(f"If-None-Match      {revalidated * 1000:7.1f} ms  status {response.status_code}")
+
+        page, response = timed_get(client, path, repeat, params={"limit": 50, "sort": "hr"})
+        print(f"50-row page by HR  {page * 1000:7.1f} ms  {len(response.content) / 1024:7.1f} KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if os.path.exists("benchmark.db"):
+        os.remove("benchmark.db")
+    run(args.rows, args.repeat)
@@ -0,0 +1,86 @@
+"""
+Upload benchmark - latency and peak memory of POST /api/csv/upload
+
+Usage (from backend/):
+    python -m benchmarks.bench_upload --rows 10000
+    python -m benchmarks.bench_upload --rows 2000 --format cbs
+"""
+import argparse
+import os
+import time
+import tracemalloc
+
+from benchmarks import synthetic
+
+
+class QueryCounter:
+    """Counts SQL statements and commits issued on an engine"""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.statements = 0
+        self.commits = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine, "commit", self._on_commit)
+
+    def _on_execute(self, *args):
+        self.statements += 1
+
+    def _on_commit(self, *args):
+        self.commits += 1
+
+    def reset(self):
+        self.statements = 0
+        self.commits = 0
+
+
+GENERATORS = synthetic.LEAGUE_FILES
+
+
+def run(rows: int, league_type: str = "fantrax") -> None:
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.database import engine
+
+    counter = QueryCounter(engine)
+
+    payload = GENERATORS[league_type](rows)
+    print(f"Synthetic {league_type} file: {rows} rows, {len(payload) / 1024:.0f} KB")
+
+    with TestClient(app) as client:
+        # Latency (first upload creates players, second one matches them)
+        # Each pass appends blank lines (ignored by the parser) so it isn't deduplicated
+        for passes, label in enumerate(("cold", "warm")):
+            counter.reset()
+            start = time.perf_counter()
+            response = client.post(
+                "/api/csv/upload",
+                files={"file": ("league.csv", payload + b"\n" * passes, "text/csv")},
+            )
+            elapsed = time.perf_counter() - start
+            response.raise_for_status()
+            print(f"[{label}] upload latency: {elapsed:.2f}s ({rows / elapsed:.0f} rows/s), "
+                  f"{counter.statements} SQL statements, {counter.commits} commits")
+
+        # Peak Python heap during one upload (separate pass, tracemalloc adds overhead)
+        tracemalloc.start()
+        response = client.post(
+            "/api/csv/upload",
+            files={"file": ("league.csv", payload + b"\n" * 2, "text/csv")},
+        )
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        response.raise_for_status()
+        print(f"peak memory during upload: {peak / (1024 * 1024):.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--format", choices=sorted(GENERATORS), default="fantrax")
+    args = parser.parse_args()
+
+    if os.path.exists("benchmark.db"):
+        os.remove("benchmark.db")
+    run(args.rows, args.format)
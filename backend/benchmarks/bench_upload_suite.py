@@ -0,0 +1,271 @@
+"""
+Upload benchmark suite - upload_csv throughput, stage times and peak memory across formats, sizes and name noise
+
+For every (format, rows, noise) case, on a freshly migrated local SQLite
+database seeded with the matching synthetic Razzball projections (so
+league rows have real players to be matched against), as medians of
+--repeat runs:
+
+  e2e     POST /api/csv/upload latency and rows/s, cold (league IDs never
+          seen, every row name-matched) and warm (same file again)
+  stages  parse / match / store split of a cold ingest_league run, timed
+          from its progress callbacks, plus the share of rows matched to
+          existing players (drops as noise goes up)
+  memory  peak Python heap (tracemalloc) during one cold upload
+
+Results are saved as JSON under benchmarks/results/ (gitignored), tagged
+with the git commit, so runs can be compared across commits.
+
+Usage (from backend/):
+    python -m benchmarks.bench_upload_suite --formats fantrax,cbs --rows 1000,10000 --noise 0,0.3
+    python -m benchmarks.bench_upload_suite --compare benchmarks/results/upload-<commit>-<time>.json
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from benchmarks import synthetic
+from benchmarks.bench_upload import QueryCounter
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# Metrics compared between runs (lower is better for all of them)
+COMPARED = ("cold_s", "warm_s", "parse_s", "match_s", "store_s", "peak_mb")
+
+
+def git_commit() -> Dict[str, object]:
+    """Short HEAD hash and whether the tree has uncommitted changes"""
+    def git(*args: str) -> str:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+
+    try:
+        return {"commit": git("rev-parse", "--short", "HEAD"), "dirty": bool(git("status", "--porcelain", "--", "."))}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": "unknown", "dirty": None}
+
+
+def fresh_database(rows: int, seed: int) -> None:
+    """Recreate the SQLite file at the migration head and load `rows` synthetic ROS projections"""
+    import pandas as pd
+    from sqlalchemy.engine import make_url
+    from app.config import get_settings
+    from app.database import SessionLocal, engine, upgrade_schema
+    from app.services.projection_fetcher import ProjectionFetcher
+
+    engine.dispose()
+    path = make_url(get_settings().DATABASE_URL).database
+    if path and os.path.exists(path):
+        os.remove(path)
+    upgrade_schema()
+
+    frame = pd.DataFrame(json.loads(synthetic.razzball_json(rows, seed=seed))["players"])
+    db = SessionLocal()
+    try:
+        ProjectionFetcher(db).store_frame("ros", frame, date.today())
+    finally:
+        db.close()
+
+
+def player_count() -> int:
+    from sqlalchemy import func, select
+    from app.database import engine
+    from app.models import Player
+
+    with engine.connect() as conn:
+        return conn.execute(select(func.count(Player.id))).scalar()
+
+
+def time_e2e(client, counter: QueryCounter, payload: bytes, rows: int) -> Dict[str, float]:
+    """Cold then warm POST /api/csv/upload (the warm file gets a blank line so it isn't deduplicated)"""
+    result = {}
+    for passes, label in enumerate(("cold", "warm")):
+        counter.reset()
+        before = player_count()
+        start = time.perf_counter()
+        response = client.post(
+            "/api/csv/upload",
+            files={"file": ("league.csv", payload + b"\n" * passes, "text/csv")},
+        )
+        elapsed = time.perf_counter() - start
+        response.raise_for_status()
+        result.update({
+            f"{label}_s": elapsed,
+            f"{label}_rows_per_s": rows / elapsed,
+            f"{label}_statements": counter.statements,
+            f"{label}_players_created": player_count() - before,
+        })
+    return result
+
+
+def time_stages(payload: bytes, rows: int) -> Dict[str, float]:
+    """Parse / match / store seconds of one cold ingest_league run, from its progress callbacks"""
+    from app.database import SessionLocal
+    from app.services.league_ingest import ingest_league
+
+    marks: Dict[str, float] = {}
+    counts: Dict[str, int] = {}
+
+    def progress(**reported):
+        now = time.perf_counter()
+        for key, value in reported.items():
+            marks[key] = now
+            counts[key] = value
+
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        ingest_league(db, io.BytesIO(payload), "league.csv", progress=progress)
+    finally:
+        db.close()
+
+    return {
+        "parse_s": marks["rows_parsed"] - start,
+        "match_s": marks["rows_matched"] - marks["rows_parsed"],
+        "store_s": marks["rows_inserted"] - marks["rows_matched"],
+        "matched_ratio": counts["rows_matched"] / rows,
+    }
+
+
+def peak_memory(client, payload: bytes) -> float:
+    """Peak traced Python heap (MB) during one cold upload - own pass, tracemalloc slows everything down"""
+    tracemalloc.start()
+    try:
+        response = client.post("/api/csv/upload", files={"file": ("league.csv", payload, "text/csv")})
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    response.raise_for_status()
+    return peak / (1024 * 1024)
+
+
+def median_of(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    """Per-metric median over repeated runs"""
+    return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+
+def run_case(league_type: str, rows: int, noise: float, seed: int, repeat: int) -> Dict[str, object]:
+    from fastapi.testclient import TestClient
+    from app.database import engine
+    from app.main import app
+
+    payload = synthetic.LEAGUE_FILES[league_type](rows, seed=seed, noise=noise)
+    case: Dict[str, object] = {
+        "format": league_type, "rows": rows, "noise": noise, "file_kb": round(len(payload) / 1024, 1)
+    }
+    counter = QueryCounter(engine)
+
+    e2e, stages = [], []
+    for _ in range(repeat):
+        fresh_database(rows, seed)
+        with TestClient(app) as client:
+            e2e.append(time_e2e(client, counter, payload, rows))
+
+        fresh_database(rows, seed)
+        stages.append(time_stages(payload, rows))
+    case.update(median_of(e2e))
+    case.update(median_of(stages))
+
+    fresh_database(rows, seed)
+    with TestClient(app) as client:
+        case["peak_mb"] = peak_memory(client, payload)
+
+    return case
+
+
+def print_case(case: Dict[str, object]) -> None:
+    print(
+        f"{case['format']:8} {case['rows']:>7} rows  noise {case['noise']:<4}  "
+        f"cold {case['cold_s']:6.2f}s ({case['cold_rows_per_s']:7.0f} rows/s)  "
+        f"warm {case['warm_s']:6.2f}s ({case['warm_rows_per_s']:7.0f} rows/s)  "
+        f"parse {case['parse_s']:5.2f}s  match {case['match_s']:5.2f}s  store {case['store_s']:5.2f}s  "
+        f"matched {case['matched_ratio']:4.0%}  peak {case['peak_mb']:6.1f} MB"
+    )
+
+
+def save(results: Dict[str, object], output_dir: str) -> str:
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(output_dir, f"upload-{results['commit']}-{stamp}.json")
+    with open(path, "w") as handle:
+        json.dump(results, handle, indent=2)
+    return path
+
+
+def compare(current: Dict[str, object], baseline_path: str) -> None:
+    """Per-case change of each COMPARED metric against an earlier results file"""
+    with open(baseline_path) as handle:
+        baseline = json.load(handle)
+
+    previous = {(c["format"], c["rows"], c["noise"]): c for c in baseline["cases"]}
+    print(f"\nvs. {baseline['commit']}{' (dirty)' if baseline.get('dirty') else ''} ({os.path.basename(baseline_path)})")
+    for case in current["cases"]:
+        before: Optional[Dict] = previous.get((case["format"], case["rows"], case["noise"]))
+        if before is None:
+            continue
+        changes = "  ".join(
+            f"{metric} {(case[metric] - before[metric]) / before[metric]:+6.1%}"
+            for metric in COMPARED if before.get(metric)
+        )
+        print(f"{case['format']:8} {case['rows']:>7} rows  noise {case['noise']:<4}  {changes}")
+
+
+def parse_noise(value: str) -> float:
+    """Noise share from a number or a named level"""
+    value = value.strip()
+    return synthetic.NOISE_LEVELS[value] if value in synthetic.NOISE_LEVELS else float(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--formats", default="fantrax,cbs,nfbc", help="Comma-separated league formats")
+    parser.add_argument("--rows", default="1000,5000", help="Comma-separated file sizes")
+    parser.add_argument(
+        "--noise", default="0,0.3",
+        help=f"Comma-separated name-noise shares (0-1) or levels ({', '.join(synthetic.NOISE_LEVELS)})"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (medians are reported)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=RESULTS_DIR, help="Directory for the results JSON")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    from app.database import engine
+    if engine.dialect.name != "sqlite":
+        raise SystemExit("The upload suite recreates its database file - point DATABASE_URL at a local SQLite file")
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    sizes = [int(r) for r in args.rows.split(",")]
+    noises = [parse_noise(n) for n in args.noise.split(",")]
+
+    cases: List[Dict[str, object]] = []
+    for league_type in formats:
+        for rows in sizes:
+            for noise in noises:
+                cases.append(run_case(league_type, rows, noise, args.seed, args.repeat))
+                print_case(cases[-1])
+
+    results = {
+        **git_commit(),
+        "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "cases": cases,
+    }
+    print(f"\nSaved {save(results, args.output)}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Concurrent parallel-matching check - PlayerIndex.match_many_parallel from several threads at once
+
+Builds one index per simulated league, each with its own player IDs, and
+runs match_many_parallel on all of them from threads released together
+(as the ingest queue and the request threadpool would). Every result must
+equal that index's own serial match_many, so no call can pick up another
+call's index. Exits 1 on failure.
+
+Usage (from backend/):
+    python -m benchmarks.check_parallel_match --leagues 2 --players 3000 --names 600 --workers 2
+"""
+import argparse
+import io
+import random
+import sys
+import threading
+
+from benchmarks import synthetic
+
+
+def build_index(league: int, players: int):
+    """Index whose player IDs are offset per league, so a cross-league match is detectable"""
+    from app.services.player_index import PlayerIndex
+
+    rng = random.Random(league)
+    offset = league * 1_000_000
+    return PlayerIndex(
+        (offset + i + 1, name, rng.choice(synthetic.MLB_TEAMS), rng.choice(synthetic.POSITIONS))
+        for i, name in enumerate(synthetic.player_names(players, seed=7))
+    )
+
+
+def run(leagues: int, players: int, names: int, workers: int) -> bool:
+    from app.services.csv_parser import CSVParser
+
+    batch, _ = CSVParser.parse_csv(io.BytesIO(synthetic.cbs_csv(names, seed=11)))
+    queries = [(p['name'], p['mlb_team'], None) for p in batch]
+
+    indexes = [build_index(league, players) for league in range(leagues)]
+    expected = [index.match_many(queries) for index in indexes]
+
+    barrier = threading.Barrier(leagues, timeout=60)
+    results = [None] * leagues
+    errors = [None] * leagues
+
+    def match(slot: int) -> None:
+        barrier.wait()
+        try:
+            results[slot] = indexes[slot].match_many_parallel(queries, workers)
+        except Exception as exc:
+            errors[slot] = exc
+
+    threads = [threading.Thread(target=match, args=(i,)) for i in range(leagues)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ok = True
+    for league in range(leagues):
+        matched = sum(1 for player_id in expected[league] if player_id is not None)
+        if errors[league] is not None:
+            print(f"[FAIL] league {league}: {errors[league]!r}")
+            ok = False
+        elif results[league] != expected[league]:
+            wrong = sum(1 for got, want in zip(results[league], expected[league]) if got != want)
+            print(f"[FAIL] league {league}: {wrong} of {len(queries)} names differ from the serial match")
+            ok = False
+        else:
+            print(f"league {league}: {len(queries)} names, {matched} matched, same as serial")
+
+    print("OK" if ok else "FAILED")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leagues", type=int, default=2, help="Concurrent match_many_parallel calls")
+    parser.add_argument("--players", type=int, default=3000, help="Players per index")
+    parser.add_argument("--names", type=int, default=600, help="Names matched per call")
+    parser.add_argument("--workers", type=int, default=2, help="Pool size per call")
+    args = parser.parse_args()
+
+    sys.exit(0 if run(args.leagues, args.players, args.names, args.workers) else 1)
+
+
+if __name__ == "__main__":
+    main()
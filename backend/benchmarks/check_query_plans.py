@@ -0,0 +1,205 @@
+"""
+Query plan check - hot roster and projection reads must use their indexes
+
+Migrates a fresh database with `alembic upgrade head` (so the migration
+path is what gets checked, not create_all), seeds synthetic leagues and
+daily projections, runs ANALYZE and then EXPLAINs the queries behind the
+roster endpoints, the free-agent list, per-player projection history and
+retention. Each plan must read its table through the expected index;
+exits 1 otherwise.
+
+Runs on SQLite by default (EXPLAIN QUERY PLAN). Point DATABASE_URL at an
+empty PostgreSQL database to check there (EXPLAIN (FORMAT JSON), with
+sequential scans disabled so small tables still show which index the
+planner can use).
+
+Usage (from backend/):
+    python -m benchmarks.check_query_plans --leagues 20 --rows 300
+"""
+import argparse
+import json
+import os
+import sys
+import uuid
+from datetime import date, datetime, timedelta
+from typing import List, Sequence, Tuple
+
+# Plans for the (player_id, date) unique constraint name its index differently per backend
+DAILY_UNIQUE = ('unique_daily_projection', 'sqlite_autoindex_projections_daily_1')
+
+
+def migrate() -> None:
+    """Bring the configured database to the Alembic head"""
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config("alembic.ini"), "head")
+
+
+def seed(leagues: int, rows: int, days: int) -> Tuple[uuid.UUID, int, date]:
+    """
+    Synthetic leagues (rows players each, mostly owned) and `days` of daily projections
+
+    Returns:
+        (one league id, one player id, the middle projection day)
+    """
+    from app.database import SessionLocal
+    from app.models import User, League, Player, Roster, ProjectionDaily
+
+    now = datetime.utcnow()
+    first_day = date(2025, 4, 1)
+    db = SessionLocal()
+    try:
+        user = User()
+        db.add(user)
+        db.flush()
+
+        db.execute(Player.__table__.insert(), [
+            {'name': f"Player {i}", 'razzball_id': i, 'created_at': now} for i in range(1, rows + 1)
+        ])
+        player_ids = [pid for (pid,) in db.query(Player.id).order_by(Player.id)]
+
+        league_ids = [uuid.uuid4() for _ in range(leagues)]
+        db.add_all(League(id=lid, user_id=user.id, league_type='fantrax', uploaded_at=now) for lid in league_ids)
+        db.flush()
+
+        db.execute(Roster.__table__.insert(), [
+            {
+                'league_id': lid,
+                'player_id': pid,
+                'team_owner': 'Free Agent' if i % 4 == 0 else f"Team {i % 12}",
+                'created_at': now,
+            }
+            for lid in league_ids
+            for i, pid in enumerate(player_ids)
+        ])
+        db.execute(ProjectionDaily.__table__.insert(), [
+            {'player_id': pid, 'date': first_day + timedelta(days=d), 'hr': 0.25, 'fetched_at': now}
+            for d in range(days)
+            for pid in player_ids
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+    return league_ids[0], player_ids[0], first_day + timedelta(days=days // 2)
+
+
+def queries(league_id: uuid.UUID, player_id: int, day: date) -> List[Tuple[str, object, str, Sequence[str]]]:
+    """(label, statement, table, acceptable index names) for every checked access path"""
+    from sqlalchemy import select
+    from app.models import Roster, Player, ProjectionDaily, ProjectionLatest
+
+    roster = (
+        select(Roster.team_owner, Player, ProjectionLatest)
+        .join(Player, Roster.player_id == Player.id)
+        .outerjoin(ProjectionLatest, ProjectionLatest.player_id == Player.id)
+        .where(Roster.league_id == league_id)
+    )
+    roster_index = ('ix_rosters_league_owner_player',)
+
+    return [
+        ("roster by league", roster.order_by(Roster.id), 'rosters', roster_index),
+        ("roster by owner", roster.where(Roster.team_owner == 'Team 1').order_by(Roster.id), 'rosters', roster_index),
+        ("free agents", roster.where(Roster.team_owner == 'Free Agent').order_by(Roster.id), 'rosters', roster_index),
+        (
+            "player daily history",
+            select(ProjectionDaily)
+            .where(ProjectionDaily.player_id == player_id)
+            .order_by(ProjectionDaily.date.desc())
+            .limit(14),
+            'projections_daily',
+            DAILY_UNIQUE,
+        ),
+        (
+            "retention window",
+            select(ProjectionDaily.player_id, ProjectionDaily.hr).where(ProjectionDaily.date < day - timedelta(days=10)),
+            'projections_daily',
+            ('ix_projections_daily_date',),
+        ),
+    ]
+
+
+def sqlite_plan(conn, sql: str) -> Tuple[List[str], bool]:
+    """(plan lines, whether a temp sort was needed)"""
+    lines = [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+    return lines, any('TEMP B-TREE FOR ORDER BY' in line for line in lines)
+
+
+def sqlite_uses(lines: List[str], table: str, indexes: Sequence[str]) -> bool:
+    return any(
+        line.split()[1:2] == [table] and any(f"INDEX {name}" in line for name in indexes)
+        for line in lines if line.startswith('SEARCH') or line.startswith('SCAN')
+    )
+
+
+def postgres_plan(conn, sql: str) -> Tuple[List[dict], bool]:
+    """(flattened plan nodes, whether a Sort node was needed)"""
+    plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    nodes, stack = [], [plan[0]['Plan']]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.get('Plans', []))
+    return nodes, any(node['Node Type'] == 'Sort' for node in nodes)
+
+
+def postgres_uses(nodes: List[dict], indexes: Sequence[str]) -> bool:
+    # Index names are per table already; Bitmap Index Scan nodes carry no Relation Name
+    return any(node.get('Index Name') in indexes for node in nodes)
+
+
+def run(leagues: int, rows: int, days: int) -> bool:
+    from app.database import engine
+
+    migrate()
+    league_id, player_id, day = seed(leagues, rows, days)
+
+    ok = True
+    with engine.connect() as conn:
+        dialect = conn.dialect
+        conn.exec_driver_sql("ANALYZE")
+        if dialect.name == 'postgresql':
+            conn.exec_driver_sql("SET enable_seqscan = off")
+
+        for label, stmt, table, indexes in queries(league_id, player_id, day):
+            sql = str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+            if dialect.name == 'postgresql':
+                plan, sorted_ = postgres_plan(conn, sql)
+                uses = postgres_uses(plan, indexes)
+                shown = [f"{n['Node Type']} {n.get('Relation Name', '')} {n.get('Index Name', '')}".strip() for n in plan]
+            else:
+                plan, sorted_ = sqlite_plan(conn, sql)
+                uses = sqlite_uses(plan, table, indexes)
+                shown = plan
+
+            # History reads the index backwards - a separate sort means it didn't
+            passed = uses and not (label == "player daily history" and sorted_)
+            ok = ok and passed
+            print(f"[{'ok' if passed else 'FAIL'}] {label}: {table} via {' / '.join(indexes)}")
+            for line in shown:
+                print(f"       {line}")
+
+    print("OK" if ok else "FAILED")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leagues", type=int, default=20, help="Synthetic leagues")
+    parser.add_argument("--rows", type=int, default=300, help="Players per league")
+    parser.add_argument("--days", type=int, default=30, help="Days of daily projections per player")
+    args = parser.parse_args()
+
+    # Fresh database so the plans come from the migrated schema alone
+    if os.path.exists("benchmark.db"):
+        os.remove("benchmark.db")
+
+    sys.exit(0 if run(args.leagues, args.rows, args.days) else 1)
+
+
+if __name__ == "__main__":
+    main()
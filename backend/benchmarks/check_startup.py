@@ -0,0 +1,102 @@
+"""
+Cold-start check - import-to-ready time for app.main must stay within budget
+
+Migrates the database first (as a deploy's release step would), then
+starts a fresh interpreter per run (nothing cached in sys.modules), times
+`import app.main` plus the startup handlers (the schema version check,
+no auto-migrate), and records which heavy
+dependencies got imported along the way. pandas, NumPy, fuzzywuzzy,
+cloudscraper, requests and the OpenAI SDK should only load on the first
+upload, sync or chat request, so any of them showing up at startup is a
+failure too. The median over the runs is compared against --budget;
+exits 1 if it's over, or if a lazy dependency was imported eagerly.
+
+Serverless (Vercel) and scale-to-zero (Fly) deploys pay this on every
+cold start.
+
+Usage (from backend/):
+    python -m benchmarks.check_startup --runs 5 --budget 1.5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Imported on first use only - never by `import app.main` or startup
+LAZY_MODULES = ('pandas', 'numpy', 'fuzzywuzzy', 'cloudscraper', 'requests', 'openai')
+
+CHILD = """
+import asyncio, json, sys, time
+
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+async def lifecycle():
+    await app.router.startup()
+    ready = time.perf_counter()
+    await app.router.shutdown()
+    return ready
+
+ready = asyncio.run(lifecycle())
+print(json.dumps({
+    'import_s': imported - start,
+    'ready_s': ready - start,
+    'eager': [name for name in %r if name in sys.modules],
+}))
+""" % (LAZY_MODULES,)
+
+
+def measure() -> dict:
+    """One cold start in a new interpreter"""
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD], env={**os.environ, 'DB_AUTO_MIGRATE': 'false'},
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def run(runs: int, budget: float) -> bool:
+    from app.database import upgrade_schema
+    upgrade_schema()
+
+    results = [measure() for _ in range(runs)]
+    imports = [r['import_s'] for r in results]
+    readies = [r['ready_s'] for r in results]
+    eager = sorted({name for r in results for name in r['eager']})
+
+    median = statistics.median(readies)
+    print(
+        f"import app.main  median {statistics.median(imports) * 1000:7.1f} ms  "
+        f"(min {min(imports) * 1000:.1f} / max {max(imports) * 1000:.1f})"
+    )
+    print(
+        f"import-to-ready  median {median * 1000:7.1f} ms  "
+        f"(min {min(readies) * 1000:.1f} / max {max(readies) * 1000:.1f}), budget {budget * 1000:.0f} ms"
+    )
+
+    ok = True
+    if eager:
+        print(f"[FAIL] imported at startup, should be lazy: {', '.join(eager)}")
+        ok = False
+    if median > budget:
+        print(f"[FAIL] startup is over budget by {(median - budget) * 1000:.0f} ms")
+        ok = False
+
+    print("OK" if ok else "FAILED")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time")
+    parser.add_argument("--budget", type=float, default=1.5, help="Max median import-to-ready seconds")
+    args = parser.parse_args()
+
+    sys.exit(0 if run(args.runs, args.budget) else 1)
+
+
+if __name__ == "__main__":
+    main()
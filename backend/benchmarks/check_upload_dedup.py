@@ -0,0 +1,88 @@
+"""
+Duplicate-upload check - identical files racing each other on POST /api/csv/upload
+
+Fires the same synthetic file from several threads at once and checks that
+exactly one league is stored, every response points at it, and all but one
+response are flagged as deduplicated. Exits 1 on failure.
+
+Usage (from backend/):
+    python -m benchmarks.check_upload_dedup --clients 8 --rows 500
+"""
+import argparse
+import os
+import sys
+import threading
+
+from benchmarks import synthetic
+
+
+def run(clients: int, rows: int) -> bool:
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.database import SessionLocal
+    from app.models import League, Roster
+
+    payload = synthetic.fantrax_csv(rows)
+    barrier = threading.Barrier(clients, timeout=60)
+    responses = [None] * clients
+
+    def upload(slot: int) -> None:
+        with TestClient(app) as client:
+            barrier.wait()
+            responses[slot] = client.post(
+                "/api/csv/upload",
+                files={"file": ("race.csv", payload, "text/csv")}
+            )
+
+    threads = [threading.Thread(target=upload, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    statuses = [r.status_code for r in responses]
+    bodies = [r.json() for r in responses if r.status_code == 200]
+    league_ids = {body["id"] for body in bodies}
+    fresh = sum(1 for body in bodies if not body["deduplicated"])
+
+    db = SessionLocal()
+    try:
+        stored = db.query(League).count()
+        roster_rows = db.query(Roster).count()
+    finally:
+        db.close()
+
+    print(f"Statuses:        {statuses}")
+    print(f"Distinct leagues in responses: {len(league_ids)}, non-deduplicated: {fresh}")
+    print(f"Leagues stored:  {stored}, roster rows: {roster_rows} (file has {rows})")
+
+    ok = (
+        all(status == 200 for status in statuses)
+        and len(league_ids) == 1
+        and fresh == 1
+        and stored == 1
+        and roster_rows == rows
+    )
+    print("OK" if ok else "FAILED")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent identical uploads")
+    parser.add_argument("--rows", type=int, default=500, help="Rows in the synthetic file")
+    args = parser.parse_args()
+
+    # Fresh database so the counts only reflect this run
+    if os.path.exists("benchmark.db"):
+        os.remove("benchmark.db")
+
+    # Create tables up front - app startup would otherwise run it once per client thread
+    from app.database import init_db
+    init_db()
+
+    sys.exit(0 if run(args.clients, args.rows) else 1)
+
+
+if __name__ == "__main__":
+    main()
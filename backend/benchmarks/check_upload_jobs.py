@@ -0,0 +1,118 @@
+"""
+Background upload job check - POST /api/csv/jobs status codes and stale jobs
+
+Queues a synthetic file and polls it to success (202), uploads it again and
+expects an already-succeeded job with 200, then plants queued and running
+jobs that stopped updating and checks that startup and polling mark them
+failed while a fresh job is left alone and a failed one is never run.
+Exits 1 on failure.
+
+Usage (from backend/):
+    python -m benchmarks.check_upload_jobs --rows 500
+"""
+import argparse
+import io
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from benchmarks import synthetic
+
+
+def plant_job(status: str, age_seconds: int):
+    """Insert a job last updated age_seconds ago, returning its ID"""
+    from app.database import SessionLocal
+    from app.models import IngestJob
+
+    updated = datetime.utcnow() - timedelta(seconds=age_seconds)
+    db = SessionLocal()
+    try:
+        job = IngestJob(csv_filename="planted.csv", status=status, created_at=updated, updated_at=updated)
+        db.add(job)
+        db.commit()
+        return job.id
+    finally:
+        db.close()
+
+
+def job_status(job_id) -> str:
+    from app.database import SessionLocal
+    from app.models import IngestJob
+
+    db = SessionLocal()
+    try:
+        return db.get(IngestJob, job_id).status
+    finally:
+        db.close()
+
+
+def run(rows: int) -> bool:
+    from fastapi.testclient import TestClient
+    from app.config import get_settings
+    from app.main import app
+    from app.services.ingest_queue import fail_stale_jobs, run_job
+
+    payload = synthetic.fantrax_csv(rows)
+    stale_age = get_settings().INGEST_JOB_TIMEOUT_SECONDS + 60
+    checks = []
+
+    with TestClient(app) as client:
+        first = client.post("/api/csv/jobs", files={"file": ("jobs.csv", payload, "text/csv")})
+        job = first.json()
+        deadline = time.monotonic() + 60
+        while job["status"] in ("queued", "running") and time.monotonic() < deadline:
+            time.sleep(0.1)
+            job = client.get(f"/api/csv/jobs/{job['id']}").json()
+        checks.append(("new upload queued with 202", first.status_code == 202))
+        checks.append(("new upload succeeded", job["status"] == "succeeded"))
+
+        again = client.post("/api/csv/jobs", files={"file": ("jobs.csv", payload, "text/csv")})
+        body = again.json()
+        checks.append(("duplicate upload answered with 200", again.status_code == 200))
+        checks.append((
+            "duplicate job points at the existing league",
+            body["status"] == "succeeded" and body["league"]["deduplicated"]
+            and body["league"]["id"] == job["league"]["id"]
+        ))
+
+        stale_queued = plant_job("queued", stale_age)
+        stale_running = plant_job("running", stale_age)
+        fresh_queued = plant_job("queued", 0)
+        failed = fail_stale_jobs()
+        checks.append(("startup sweep failed both stale jobs", failed == 2))
+        checks.append(("fresh queued job left alone", job_status(fresh_queued) == "queued"))
+        checks.append((
+            "stale jobs failed", job_status(stale_queued) == job_status(stale_running) == "failed"
+        ))
+
+        run_job(stale_queued, io.BytesIO(payload), "planted.csv")
+        checks.append(("failed job not run by a late worker", job_status(stale_queued) == "failed"))
+
+        polled = plant_job("running", stale_age)
+        body = client.get(f"/api/csv/jobs/{polled}").json()
+        checks.append(("poll fails a stale job", body["status"] == "failed" and bool(body["error"])))
+        checks.append(("poll failure is stored", job_status(polled) == "failed"))
+
+    for name, passed in checks:
+        print(f"{'ok  ' if passed else 'FAIL'} {name}")
+
+    ok = all(passed for _, passed in checks)
+    print("OK" if ok else "FAILED")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500, help="Rows in the synthetic file")
+    args = parser.parse_args()
+
+    # Fresh database so the planted jobs are the only stale ones
+    if os.path.exists("benchmark.db"):
+        os.remove("benchmark.db")
+
+    sys.exit(0 if run(args.rows) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Local stand-ins for the Razzball projections API and the OpenAI / Anthropic chat APIs
+
+Each fake is a small FastAPI app run by uvicorn on a background thread,
+so benchmarks can drive the real chat path (ProjectionService, the OpenAI
+SDK) offline. Latency and payload size are configurable; both chat APIs
+also stream (SSE) when the request asks for it.
+
+  Razzball   GET  /mlb/projections/{botros,botweekly,botdaily,daily/<date>}
+             {"players": [...]} with `players` synthetic rows after `latency` s
+  OpenAI     POST /v1/chat/completions
+  Anthropic  POST /v1/messages
+             `tokens` words of reply; first token after `ttft` s, then
+             one every `token_interval` s (all at once when not streaming)
+
+Point the app at them with RAZZBALL_API_BASE_URL=<razzball>/mlb,
+OPENAI_BASE_URL=<llm>/v1 and ANTHROPIC_BASE_URL=<llm>, set before the
+app is imported.
+
+Usage (from backend/), to run them standalone:
+    python -m benchmarks.fake_servers --razzball-port 8101 --llm-port 8102 --ttft 0.4 --tokens 200
+"""
+import argparse
+import asyncio
+import json
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List
+
+from benchmarks import synthetic
+
+# Every fake reply starts with this, so a benchmark can tell it from the app's own fallback text
+REPLY_MARKER = "[fake-llm]"
+
+WORDS = ["target", "Soto", "for", "power", "and", "stream", "pitchers", "with", "good", "matchups", "this", "week"]
+
+
+@dataclass
+class RazzballConfig:
+    latency: float = 0.2  # Seconds before the response
+    players: int = 1500  # Rows per projections response
+    seed: int = 42
+
+
+@dataclass
+class LLMConfig:
+    ttft: float = 0.5  # Seconds to the first token
+    token_interval: float = 0.01  # Seconds between tokens
+    tokens: int = 150  # Reply length in words
+
+
+def razzball_app(config: RazzballConfig):
+    """Razzball projections endpoints (the body is built once and reused)"""
+    from fastapi import FastAPI, Response
+
+    app = FastAPI()
+    body = synthetic.razzball_json(config.players, seed=config.seed)
+
+    @app.get("/mlb/projections/{path:path}")
+    async def projections(path: str):
+        await asyncio.sleep(config.latency)
+        return Response(body, media_type="application/json")
+
+    return app
+
+
+def reply_words(tokens: int) -> List[str]:
+    return [REPLY_MARKER] + [WORDS[i % len(WORDS)] for i in range(max(tokens - 1, 0))]
+
+
+def llm_app(config: LLMConfig):
+    """OpenAI chat completions and Anthropic messages, plain or streamed"""
+    from fastapi import FastAPI, Request
+    from fastapi.responses import StreamingResponse
+
+    app = FastAPI()
+
+    async def tokens() -> AsyncIterator[str]:
+        await asyncio.sleep(config.ttft)
+        for i, word in enumerate(reply_words(config.tokens)):
+            if i:
+                await asyncio.sleep(config.token_interval)
+            yield word if i == 0 else f" {word}"
+
+    async def full_reply() -> str:
+        await asyncio.sleep(config.ttft + config.token_interval * max(config.tokens - 1, 0))
+        return " ".join(reply_words(config.tokens))
+
+    def sse(events: AsyncIterator[str]) -> StreamingResponse:
+        return StreamingResponse(events, media_type="text/event-stream")
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        payload = await request.json()
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        model = payload.get("model", "gpt-4")
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in payload.get("messages", []))
+
+        if payload.get("stream"):
+            async def events():
+                async for token in tokens():
+                    chunk = {
+                        "id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+                    }
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                done = {
+                    "id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                    "model": model, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                }
+                yield f"data: {json.dumps(done)}\n\ndata: [DONE]\n\n"
+            return sse(events())
+
+        return {
+            "id": completion_id, "object": "chat.completion", "created": int(time.time()), "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": await full_reply()},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": config.tokens,
+                "total_tokens": prompt_tokens + config.tokens,
+            },
+        }
+
+    @app.post("/v1/messages")
+    async def messages(request: Request):
+        payload = await request.json()
+        message_id = f"msg_{uuid.uuid4().hex[:12]}"
+        model = payload.get("model", "claude-3-sonnet-20240229")
+        usage = {"input_tokens": sum(len(str(m.get("content", "")).split()) for m in payload.get("messages", []))}
+
+        if payload.get("stream"):
+            def event(name: str, data: Dict) -> str:
+                return f"event: {name}\ndata: {json.dumps({'type': name, **data})}\n\n"
+
+            async def events():
+                yield event("message_start", {"message": {
+                    "id": message_id, "type": "message", "role": "assistant", "content": [], "model": model,
+                    "stop_reason": None, "stop_sequence": None, "usage": {**usage, "output_tokens": 0},
+                }})
+                yield event("content_block_start", {"index": 0, "content_block": {"type": "text", "text": ""}})
+                async for token in tokens():
+                    yield event("content_block_delta", {"index": 0, "delta": {"type": "text_delta", "text": token}})
+                yield event("content_block_stop", {"index": 0})
+                yield event("message_delta", {
+                    "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                    "usage": {"output_tokens": config.tokens},
+                })
+                yield event("message_stop", {})
+            return sse(events())
+
+        return {
+            "id": message_id, "type": "message", "role": "assistant", "model": model,
+            "content": [{"type": "text", "text": await full_reply()}],
+            "stop_reason": "end_turn", "stop_sequence": None,
+            "usage": {**usage, "output_tokens": config.tokens},
+        }
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class BackgroundServer:
+    """uvicorn serving an app on a daemon thread, for use in-process"""
+
+    def __init__(self, app, port: int = 0):
+        import uvicorn
+
+        self.port = port or free_port()
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning"))
+        self._thread = threading.Thread(target=self.server.run, name=f"fake-server-{self.port}", daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "BackgroundServer":
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError(f"Fake server on port {self.port} did not start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.server.should_exit = True
+        self._thread.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--razzball-port", type=int, default=8101)
+    parser.add_argument("--llm-port", type=int, default=8102)
+    parser.add_argument("--razzball-latency", type=float, default=RazzballConfig.latency)
+    parser.add_argument("--players", type=int, default=RazzballConfig.players)
+    parser.add_argument("--ttft", type=float, default=LLMConfig.ttft)
+    parser.add_argument("--token-interval", type=float, default=LLMConfig.token_interval)
+    parser.add_argument("--tokens", type=int, default=LLMConfig.tokens)
+    args = parser.parse_args()
+
+    razzball = RazzballConfig(latency=args.razzball_latency, players=args.players)
+    llm = LLMConfig(ttft=args.ttft, token_interval=args.token_interval, tokens=args.tokens)
+    with BackgroundServer(razzball_app(razzball), args.razzball_port) as razz, \
+            BackgroundServer(llm_app(llm), args.llm_port) as fake_llm:
+        print(f"Razzball:  RAZZBALL_API_BASE_URL={razz.url}/mlb")
+        print(f"OpenAI:    OPENAI_BASE_URL={fake_llm.url}/v1")
+        print(f"Anthropic: ANTHROPIC_BASE_URL={fake_llm.url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,299 @@
+"""
+Deterministic synthetic league files and Razzball projections for benchmarks
+
+League files share their player pool with the projections generated from
+the same seed. `noise` (0-1) is the share of league-file names spelled the
+way other sites do (initials, accents, suffixes, typos, case), which is
+what the fuzzy matcher has to absorb.
+
+Usage (from backend/):
+    python -m benchmarks.synthetic cbs --rows 500 --noise 0.3 > league.csv
+    python -m benchmarks.synthetic razzball-json --rows 500 > projections.json
+"""
+import argparse
+import csv
+import io
+import json
+import random
+import sys
+from typing import Dict, List, Tuple
+
+FIRST_NAMES = [
+    "Aaron", "Andrew", "Bobby", "Bryce", "Carlos", "Corey", "Dylan", "Eli", "Francisco",
+    "Freddie", "Gavin", "Gerrit", "Jose", "Juan", "Julio", "Kyle", "Logan", "Luis",
+    "Manny", "Matt", "Max", "Mookie", "Nolan", "Pete", "Rafael", "Ronald", "Shohei",
+    "Spencer", "Trea", "Tyler", "Vladimir", "Will", "Yordan", "Zack",
+]
+LAST_NAMES = [
+    "Abbott", "Acuna", "Alvarez", "Arenado", "Betts", "Bichette", "Cole", "Correa",
+    "Crochet", "Devers", "Freeman", "Guerrero", "Harper", "Judge", "Lindor", "Machado",
+    "Ohtani", "Ramirez", "Rodriguez", "Schwarber", "Seager", "Skenes", "Soto", "Strider",
+    "Tatis", "Tucker", "Turner", "Wheeler", "Witt", "Yelich",
+]
+MLB_TEAMS = [
+    "ARI", "ATL", "BAL", "BOS", "CHC", "CHW", "CIN", "CLE", "COL", "DET", "HOU", "KC",
+    "LAA", "LAD", "MIA", "MIL", "MIN", "NYM", "NYY", "OAK", "PHI", "PIT", "SD", "SEA",
+    "SF", "STL", "TB", "TEX", "TOR", "WSH",
+]
+POSITIONS = ["C", "1B", "2B", "3B", "SS", "OF", "SP", "RP", "UT"]
+OWNERS = ["AA", "MG", "Doc", "TB", "JR", "KC", "Sal", "Woz", "Pit", "Lou", "Ace", "Moe"]
+
+
+def player_names(rows: int, seed: int = 42) -> list:
+    """Unique, reproducible player names (suffixes keep large pools distinct)"""
+    rng = random.Random(seed)
+    names = []
+    for i in range(rows):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        if i >= len(FIRST_NAMES) * len(LAST_NAMES) // 2:
+            name = f"{name} {i}"
+        names.append(name)
+    return names
+
+
+ACCENTS = {'a': 'á', 'e': 'é', 'i': 'í', 'o': 'ó', 'u': 'ú', 'n': 'ñ'}
+
+# Named noise levels for benchmark runs (share of names respelled)
+NOISE_LEVELS = {'none': 0.0, 'low': 0.1, 'medium': 0.3, 'high': 0.6}
+
+
+def noisy_name(name: str, rng: random.Random) -> str:
+    """One respelling of `name` - the kind of difference seen between league sites"""
+    first, last = name.split(" ", 1)
+    surname, _, rest = last.partition(" ")
+    rest = f" {rest}" if rest else ""
+    variant = rng.randrange(6)
+
+    if variant == 0:
+        return f"{first[0]}. {last}"
+    if variant == 1:
+        spots = [i for i, ch in enumerate(surname) if ch in ACCENTS]
+        if spots:
+            i = rng.choice(spots)
+            return f"{first} {surname[:i]}{ACCENTS[surname[i]]}{surname[i + 1:]}{rest}"
+        return f"{first} {surname}{rest} Jr."
+    if variant == 2:
+        return f"{name} Jr."
+    if variant == 3 and len(surname) > 3:
+        i = rng.randrange(1, len(surname) - 2)
+        return f"{first} {surname[:i]}{surname[i + 1]}{surname[i]}{surname[i + 2:]}{rest}"
+    if variant == 4 and len(surname) > 4:
+        i = rng.randrange(1, len(surname) - 1)
+        return f"{first} {surname[:i]}{surname[i + 1:]}{rest}"
+    return name.upper()
+
+
+def player_profiles(rows: int, seed: int = 42) -> List[Tuple[str, str, str]]:
+    """(name, MLB team, position) per player - the same in every file generated from `seed`"""
+    rng = random.Random(f"{seed}:profile")
+    return [(name, rng.choice(MLB_TEAMS), rng.choice(POSITIONS)) for name in player_names(rows, seed)]
+
+
+def league_players(rows: int, noise: float = 0.0, seed: int = 42) -> List[Tuple[str, str, str]]:
+    """player_profiles() with a `noise` share of names respelled (own RNG, so the rest of a file is unchanged)"""
+    rng = random.Random(f"{seed}:noise")
+    return [
+        (noisy_name(name, rng) if noise and rng.random() < noise else name, team, position)
+        for name, team, position in player_profiles(rows, seed)
+    ]
+
+
+def fantrax_csv(rows: int, owned_ratio: float = 0.3, seed: int = 42, noise: float = 0.0) -> bytes:
+    """
+    Fantrax league export
+    Format: ID,Player,Team,Position,RkOv,Status,Score,Ros
+    """
+    rng = random.Random(seed)
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["ID", "Player", "Team", "Position", "RkOv", "Status", "Score", "Ros"])
+
+    for i, (name, team, position) in enumerate(league_players(rows, noise, seed)):
+        status = rng.choice(OWNERS) if rng.random() < owned_ratio else "FA"
+        writer.writerow([
+            f"*{i:05x}*",
+            name,
+            team,
+            position,
+            i + 1,
+            status,
+            round(rng.uniform(0, 100), 1),
+            "-",
+        ])
+
+    return out.getvalue().encode("utf-8")
+
+
+def cbs_csv(rows: int, owned_ratio: float = 0.3, seed: int = 42, noise: float = 0.0) -> bytes:
+    """
+    CBS Sports league export (title row, then header; no player IDs)
+    Format: Avail,Player,AB,R,H,1B,2B,3B,HR,RBI,BB,K,SB,CS,AVG,OBP,SLG,Rank
+    """
+    rng = random.Random(seed)
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["Batters"])
+    writer.writerow([
+        "Avail", "Player", "AB", "R", "H", "1B", "2B", "3B", "HR", "RBI",
+        "BB", "K", "SB", "CS", "AVG", "OBP", "SLG", "Rank",
+    ])
+
+    for i, (name, team, _) in enumerate(league_players(rows, noise, seed)):
+        owner = f"The {rng.choice(OWNERS)}" if rng.random() < owned_ratio else ""
+        positions = ",".join(rng.sample(["C", "1B", "2B", "3B", "SS", "OF", "P", "U"], 2))
+        ab = rng.randint(0, 650)
+        hits = rng.randint(0, ab // 3 + 1)
+        writer.writerow([
+            owner,
+            f"{name} {positions} | {team} ",
+            ab, rng.randint(0, 130), hits, hits // 2, hits // 5, hits // 40,
+            rng.randint(0, 50), rng.randint(0, 130), rng.randint(0, 100),
+            rng.randint(0, 200), rng.randint(0, 40), rng.randint(0, 10),
+            f"{hits / ab:.3f}" if ab else ".000", ".330", ".450", i + 1,
+        ])
+
+    return out.getvalue().encode("utf-8")
+
+
+def nfbc_csv(rows: int, owned_ratio: float = 0.3, seed: int = 42, noise: float = 0.0) -> bytes:
+    """
+    NFBC league export
+    Format: id,Players,Owner,Injury,Pos,Team,Own %,Start %
+    """
+    rng = random.Random(seed)
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["id", "Players", "Owner", "Injury", "Pos", "Team", "Own %", "Start %"])
+
+    for i, (name, team, position) in enumerate(league_players(rows, noise, seed)):
+        first, last = name.split(" ", 1)
+        owner = f"{rng.choice(OWNERS)} Owner - T{rng.randint(1, 15)}" if rng.random() < owned_ratio else ""
+        writer.writerow([
+            10000 + i,
+            f"{last}, {first}",
+            owner,
+            "IL10" if rng.random() < 0.05 else "",
+            position,
+            team,
+            rng.randint(0, 100),
+            rng.randint(0, 100),
+        ])
+
+    return out.getvalue().encode("utf-8")
+
+
+def razzball_projections(rows: int, seed: int = 42) -> list:
+    """
+    Razzball daily hitter projections, as returned by the API / parse_daily_csv
+    Keys: razzball_id, name, mlb_team, position, pa ... slg
+    """
+    rng = random.Random(seed)
+    projections = []
+
+    for i, (name, team, position) in enumerate(player_profiles(rows, seed)):
+        pa = round(rng.uniform(3.0, 4.8), 2)
+        ab = round(pa * 0.9, 2)
+        h = round(ab * rng.uniform(0.2, 0.32), 2)
+        projections.append({
+            'razzball_id': 10000 + i,
+            'name': name,
+            'mlb_team': team,
+            'position': position,
+            'pa': pa,
+            'ab': ab,
+            'h': h,
+            'r': round(rng.uniform(0.3, 0.8), 2),
+            'hr': round(rng.uniform(0.0, 0.3), 2),
+            'rbi': round(rng.uniform(0.3, 0.8), 2),
+            'sb': round(rng.uniform(0.0, 0.2), 2),
+            'bb': round(pa * 0.09, 2),
+            'so': round(pa * 0.22, 2),
+            'avg': round(h / ab, 3),
+            'obp': round(rng.uniform(0.28, 0.4), 3),
+            'slg': round(rng.uniform(0.35, 0.55), 3),
+        })
+
+    return projections
+
+
+RAZZBALL_HITTER_COLUMNS = [
+    "#", "Name", "Team", "ESPN", "Y!", "RazzID", "G", "PA", "AB", "H", "1B", "2B", "3B",
+    "HR", "R", "RBI", "SB", "CS", "BB", "SO", "AVG", "OBP", "SLG", "wOBA", "$",
+]
+RAZZBALL_PITCHER_COLUMNS = [
+    "#", "Name", "Team", "ESPN", "Y!", "RazzID", "G", "GS", "IP", "W", "L", "QS", "SV",
+    "HLD", "K", "BB", "H", "HR", "ERA", "WHIP", "K/9", "BB/9", "$",
+]
+
+
+def razzball_records(rows: int, player_type: str = "hitter", seed: int = 42) -> List[Dict]:
+    """
+    Razzball projection rows keyed by export column (hitters or pitchers),
+    with the columns the parser doesn't use and the occasional blank (None)
+    """
+    rng = random.Random(seed)
+    hitters = player_type == "hitter"
+    columns = RAZZBALL_HITTER_COLUMNS if hitters else RAZZBALL_PITCHER_COLUMNS
+    records = []
+
+    for i, (name, team, position) in enumerate(player_profiles(rows, seed)):
+        def stat(low, high, digits=2):
+            return None if rng.random() < 0.01 else round(rng.uniform(low, high), digits)
+
+        head = [i + 1, name, team, position, position, 10000 + i]
+        if hitters:
+            values = head + [
+                1, stat(3, 4.8), stat(2.7, 4.3), stat(0.6, 1.4), stat(0.4, 1), stat(0, 0.3), stat(0, 0.05),
+                stat(0, 0.3), stat(0.3, 0.8), stat(0.3, 0.8), stat(0, 0.2), stat(0, 0.05), stat(0.2, 0.5),
+                stat(0.6, 1.2), stat(0.2, 0.32, 3), stat(0.28, 0.4, 3), stat(0.35, 0.55, 3),
+                stat(0.28, 0.4, 3), stat(-5, 30, 1),
+            ]
+        else:
+            values = head + [
+                1, rng.choice([0, 1]), stat(1, 7), stat(0, 0.6), stat(0, 0.5), stat(0, 0.6), stat(0, 0.3),
+                stat(0, 0.2), stat(1, 9), stat(0.5, 3), stat(1, 7), stat(0, 1.2), stat(2, 5.5),
+                stat(0.9, 1.5), stat(6, 13, 1), stat(2, 4.5, 1), stat(-5, 30, 1),
+            ]
+        records.append(dict(zip(columns, values)))
+
+    return records
+
+
+def razzball_csv(rows: int, player_type: str = "hitter", seed: int = 42) -> bytes:
+    """Razzball projections CSV export, blanks written as '-'"""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(RAZZBALL_HITTER_COLUMNS if player_type == "hitter" else RAZZBALL_PITCHER_COLUMNS)
+    for record in razzball_records(rows, player_type, seed):
+        writer.writerow(["-" if value is None else value for value in record.values()])
+    return out.getvalue().encode("utf-8")
+
+
+def razzball_json(rows: int, player_type: str = "hitter", seed: int = 42) -> bytes:
+    """Razzball projections API body: {"players": [...]} keyed by export column, blanks as null"""
+    return json.dumps({"players": razzball_records(rows, player_type, seed)}).encode("utf-8")
+
+
+LEAGUE_FILES = {
+    "fantrax": fantrax_csv,
+    "cbs": cbs_csv,
+    "nfbc": nfbc_csv,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("kind", choices=[*LEAGUE_FILES, "razzball-csv", "razzball-json"])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--noise", type=float, default=0.0, help="Share of league-file names respelled (0-1)")
+    parser.add_argument("--player-type", choices=["hitter", "pitcher"], default="hitter")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.kind in LEAGUE_FILES:
+        body = LEAGUE_FILES[args.kind](args.rows, seed=args.seed, noise=args.noise)
+    elif args.kind == "razzball-csv":
+        body = razzball_csv(args.rows, args.player_type, args.seed)
+    else:
+        body = razzball_json(args.rows, args.player_type, args.seed)
+    sys.stdout.buffer.write(body)
@@ -0,0 +1,118 @@
+"""Baseline schema (the tables init_db() created before migrations existed)
+
+Databases created by init_db() already have these tables, so each one is
+only created when missing - `alembic upgrade head` works on both empty
+and pre-existing databases without a manual `alembic stamp`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# GUID column type as app.database.GUID stores it at this revision
+GUID = sa.String(36).with_variant(postgresql.UUID(as_uuid=True), 'postgresql')
+
+
+def stat_columns(counting: int):
+    """Projection stat columns: counting stats DECIMAL(counting, 2), rates DECIMAL(5, 3)"""
+    return [
+        *[sa.Column(name, sa.DECIMAL(counting, 2)) for name in ('pa', 'ab', 'h', 'r', 'hr', 'rbi', 'sb', 'bb', 'so')],
+        *[sa.Column(name, sa.DECIMAL(5, 3)) for name in ('avg', 'obp', 'slg')],
+        sa.Column('ip', sa.DECIMAL(counting, 2)),
+        sa.Column('k', sa.DECIMAL(counting, 2)),
+        *[sa.Column(name, sa.DECIMAL(5, 2)) for name in ('w', 'l', 'sv', 'era', 'whip')],
+    ]
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    def create(name, *columns, **kw):
+        if name not in existing:
+            op.create_table(name, *columns, **kw)
+            return True
+        return False
+
+    create(
+        'users',
+        sa.Column('id', GUID, primary_key=True),
+        sa.Column('created_at', sa.DateTime, nullable=False),
+    )
+
+    create(
+        'leagues',
+        sa.Column('id', GUID, primary_key=True),
+        sa.Column('user_id', GUID, sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('league_type', sa.String(20), nullable=False),
+        sa.Column('csv_filename', sa.String(255)),
+        sa.Column('uploaded_at', sa.DateTime, nullable=False),
+    )
+
+    if create(
+        'players',
+        sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column('razzball_id', sa.Integer),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('team', sa.String(10)),
+        sa.Column('position', sa.String(20)),
+        sa.Column('fantrax_id', sa.String(50)),
+        sa.Column('nfbc_id', sa.Integer),
+        sa.Column('created_at', sa.DateTime, nullable=False),
+    ):
+        op.create_index('ix_players_razzball_id', 'players', ['razzball_id'], unique=True)
+        op.create_index('ix_players_name', 'players', ['name'])
+        op.create_index('ix_players_fantrax_id', 'players', ['fantrax_id'])
+        op.create_index('ix_players_nfbc_id', 'players', ['nfbc_id'])
+
+    create(
+        'rosters',
+        sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column('league_id', GUID, sa.ForeignKey('leagues.id'), nullable=False),
+        sa.Column('player_id', sa.Integer, sa.ForeignKey('players.id'), nullable=False),
+        sa.Column('team_owner', sa.String(255), nullable=False),
+        sa.Column('status', sa.String(50)),
+        sa.Column('created_at', sa.DateTime, nullable=False),
+    )
+
+    for name, period, counting in (
+        ('projections_daily', sa.Column('date', sa.Date, nullable=False), 5),
+        ('projections_weekly', sa.Column('week_start', sa.Date, nullable=False), 6),
+        ('projections_ros', sa.Column('season', sa.Integer, nullable=False), 7),
+    ):
+        create(
+            name,
+            sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column('player_id', sa.Integer, sa.ForeignKey('players.id'), nullable=False),
+            period,
+            *stat_columns(counting),
+            sa.Column('fetched_at', sa.DateTime, nullable=False),
+            sa.UniqueConstraint(
+                'player_id', period.name,
+                name='unique_{}_projection'.format(name.split('_')[1])
+            ),
+        )
+
+    create(
+        'api_keys',
+        sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column('user_id', GUID, sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('provider', sa.String(20), nullable=False),
+        sa.Column('encrypted_key', sa.Text, nullable=False),
+        sa.Column('created_at', sa.DateTime, nullable=False),
+    )
+
+
+def downgrade() -> None:
+    for name in (
+        'api_keys', 'projections_ros', 'projections_weekly', 'projections_daily',
+        'rosters', 'players', 'leagues', 'users',
+    ):
+        op.drop_table(name)
@@ -0,0 +1,99 @@
+"""Ingest jobs, upload dedup hash, sync lease/snapshots and projections_latest
+
+Brings databases from the baseline up to the schema init_db() has been
+creating since: ingest_jobs, leagues.content_hash, sync_locks,
+projection_snapshots and projections_latest (backfilled from the newest
+projections_daily row per player). Skips whatever already exists.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+GUID = sa.String(36).with_variant(postgresql.UUID(as_uuid=True), 'postgresql')
+
+STAT_COLUMNS = (
+    'pa', 'ab', 'h', 'r', 'hr', 'rbi', 'sb', 'bb', 'so', 'avg', 'obp', 'slg',
+    'ip', 'k', 'w', 'l', 'sv', 'era', 'whip',
+)
+RATE_COLUMNS = ('avg', 'obp', 'slg')
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+
+    if 'ingest_jobs' not in existing:
+        op.create_table(
+            'ingest_jobs',
+            sa.Column('id', GUID, primary_key=True),
+            sa.Column('status', sa.String(20), nullable=False),
+            sa.Column('csv_filename', sa.String(255)),
+            sa.Column('rows_parsed', sa.Integer, nullable=False),
+            sa.Column('rows_matched', sa.Integer, nullable=False),
+            sa.Column('rows_inserted', sa.Integer, nullable=False),
+            sa.Column('league_id', GUID, sa.ForeignKey('leagues.id')),
+            sa.Column('result', sa.Text),
+            sa.Column('error', sa.Text),
+            sa.Column('created_at', sa.DateTime, nullable=False),
+            sa.Column('updated_at', sa.DateTime, nullable=False),
+        )
+
+    if 'content_hash' not in {c['name'] for c in inspector.get_columns('leagues')}:
+        op.add_column('leagues', sa.Column('content_hash', sa.String(64)))
+        op.create_index('ix_leagues_content_hash', 'leagues', ['content_hash'], unique=True)
+
+    if 'sync_locks' not in existing:
+        op.create_table(
+            'sync_locks',
+            sa.Column('name', sa.String(50), primary_key=True),
+            sa.Column('owner', sa.String(255), nullable=False),
+            sa.Column('expires_at', sa.DateTime, nullable=False),
+        )
+
+    if 'projection_snapshots' not in existing:
+        op.create_table(
+            'projection_snapshots',
+            sa.Column('horizon', sa.String(10), primary_key=True),
+            sa.Column('version', sa.Integer, nullable=False),
+            sa.Column('payload', sa.Text, nullable=False),
+            sa.Column('fetched_at', sa.DateTime, nullable=False),
+        )
+
+    if 'projections_latest' not in existing:
+        op.create_table(
+            'projections_latest',
+            sa.Column('player_id', sa.Integer, sa.ForeignKey('players.id'), primary_key=True),
+            sa.Column('date', sa.Date, nullable=False),
+            *[
+                sa.Column(name, sa.DECIMAL(5, 3) if name in RATE_COLUMNS else sa.DECIMAL(5, 2))
+                for name in STAT_COLUMNS
+            ],
+            sa.Column('fetched_at', sa.DateTime, nullable=False),
+        )
+
+        # Backfill: newest daily row per player
+        columns = ', '.join(('player_id', 'date', 'fetched_at') + STAT_COLUMNS)
+        op.execute(
+            f"INSERT INTO projections_latest ({columns}) "
+            f"SELECT {', '.join('d.' + c for c in columns.split(', '))} FROM projections_daily d "
+            "JOIN (SELECT player_id, MAX(date) AS date FROM projections_daily GROUP BY player_id) newest "
+            "ON d.player_id = newest.player_id AND d.date = newest.date"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('projections_latest')
+    op.drop_table('projection_snapshots')
+    op.drop_table('sync_locks')
+    op.drop_index('ix_leagues_content_hash', table_name='leagues')
+    op.drop_column('leagues', 'content_hash')
+    op.drop_table('ingest_jobs')
@@ -0,0 +1,39 @@
+"""Composite indexes for roster reads and daily projection retention
+
+- rosters (league_id, team_owner, player_id): GET /{league_id}/roster, the
+  free-agent list and the chat context filter by league (and often owner)
+  and join players; the index answers the filter and the join key
+  without touching the table. Before this, every roster read was a full
+  scan of rosters.
+- projections_daily (date): retention rollups and pruning select by date
+  across all players. Per-player history reads already have the
+  (player_id, date) unique constraint, which serves date DESC too.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_rosters_league_owner_player', 'rosters', ['league_id', 'team_owner', 'player_id']),
+    ('ix_projections_daily_date', 'projections_daily', ['date']),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        if name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
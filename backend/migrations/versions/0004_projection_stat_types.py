@@ -0,0 +1,66 @@
+"""Projection stat columns at their DECIMAL types
+
+Applies to projections_daily, projections_weekly, projections_ros and
+projections_latest. Any stat column stored as a float (databases that
+init_db() created while the models used floats) goes back to the
+DECIMAL type of revision 0003; DECIMAL columns are left alone. The
+table, column and type lists are frozen here, so the result does not
+depend on settings or later model changes.
+
+Native float storage is opt-in (PROJECTION_FLOAT_STATS) and applied
+outside the migrations with `python -m app.services.projection_storage`.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+TABLES = ('projections_daily', 'projections_weekly', 'projections_ros', 'projections_latest')
+
+STAT_COLUMNS = (
+    'pa', 'ab', 'h', 'r', 'hr', 'rbi', 'sb', 'bb', 'so', 'avg', 'obp', 'slg',
+    'ip', 'k', 'w', 'l', 'sv', 'era', 'whip',
+)
+
+# DECIMAL precision per table (as in 0001/0002): counting stats, then the rest
+RATE_COLUMNS = ('avg', 'obp', 'slg')
+SMALL_COLUMNS = ('w', 'l', 'sv', 'era', 'whip')
+COUNTING_PRECISION = {
+    'projections_daily': 5,
+    'projections_weekly': 6,
+    'projections_ros': 7,
+    'projections_latest': 5,
+}
+
+
+def decimal_type(table: str, column: str) -> sa.DECIMAL:
+    if column in RATE_COLUMNS:
+        return sa.DECIMAL(5, 3)
+    if column in SMALL_COLUMNS:
+        return sa.DECIMAL(5, 2)
+    return sa.DECIMAL(COUNTING_PRECISION[table], 2)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table in TABLES:
+        types = {c['name']: c['type'] for c in inspector.get_columns(table)}
+        floats = [col for col in STAT_COLUMNS if isinstance(types[col], sa.Float)]
+        if not floats:
+            continue
+
+        with op.batch_alter_table(table) as batch:
+            for col in floats:
+                batch.alter_column(col, type_=decimal_type(table, col), existing_type=types[col], existing_nullable=True)
+
+
+def downgrade() -> None:
+    # Revision 0003 had the same DECIMAL types
+    pass
@@ -0,0 +1,83 @@
+"""GUID columns as 16-byte binary on non-PostgreSQL databases
+
+GUID used to store UUIDs as 36-character strings outside PostgreSQL.
+This rewrites every GUID column as BLOB and converts the stored values
+to their 16 raw bytes. PostgreSQL already uses its native uuid type and
+is left alone.
+
+The conversion runs in Python (SQLite only gained unhex() in 3.41), one
+executemany per table. Tables whose column is already binary are skipped.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+import uuid
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+GUID_COLUMNS = {
+    'users': ('id',),
+    'leagues': ('id', 'user_id'),
+    'rosters': ('league_id',),
+    'api_keys': ('user_id',),
+    'ingest_jobs': ('id', 'league_id'),
+}
+
+
+def _convert(table: str, columns, to_value) -> None:
+    """Rewrite each column's non-NULL values with to_value(stored value), keyed by rowid"""
+    bind = op.get_bind()
+    for column in columns:
+        rows = bind.exec_driver_sql(f"SELECT rowid, {column} FROM {table} WHERE {column} IS NOT NULL").fetchall()
+        params = [{'rowid': rowid, 'value': to_value(value)} for rowid, value in rows]
+        if params:
+            bind.execute(sa.text(f"UPDATE {table} SET {column} = :value WHERE rowid = :rowid"), params)
+
+
+def _to_bytes(value) -> bytes:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        value = bytes(value)
+        if len(value) == 16:
+            return value
+        value = value.decode()
+    return uuid.UUID(value).bytes
+
+
+def _to_text(value) -> str:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return str(uuid.UUID(bytes=bytes(value)))
+    return str(uuid.UUID(value))
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        return
+
+    inspector = sa.inspect(op.get_bind())
+    for table, columns in GUID_COLUMNS.items():
+        types = {c['name']: c['type'] for c in inspector.get_columns(table)}
+        pending = [col for col in columns if not isinstance(types[col], sa.LargeBinary)]
+        if not pending:
+            continue
+
+        _convert(table, pending, _to_bytes)
+        with op.batch_alter_table(table) as batch:
+            for col in pending:
+                batch.alter_column(col, type_=sa.LargeBinary(16), existing_type=types[col])
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        return
+
+    for table, columns in GUID_COLUMNS.items():
+        _convert(table, columns, _to_text)
+        with op.batch_alter_table(table) as batch:
+            for col in columns:
+                batch.alter_column(col, type_=sa.String(36), existing_type=sa.LargeBinary(16))
@@ -0,0 +1,24 @@
+"""leagues.roster_version - bumped on every roster change, feeds roster ETags
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    columns = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('leagues')}
+    if 'roster_version' not in columns:
+        op.add_column('leagues', sa.Column('roster_version', sa.Integer, nullable=False, server_default='1'))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('leagues') as batch:
+        batch.drop_column('roster_version')
@@ -0,0 +1,29 @@
+"""data_versions - change counters for derived tables, feeds roster ETags
+
+Seeds the projections_latest counter at 1.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if 'data_versions' not in sa.inspect(op.get_bind()).get_table_names():
+        table = op.create_table(
+            'data_versions',
+            sa.Column('name', sa.String(50), primary_key=True),
+            sa.Column('version', sa.Integer, nullable=False),
+        )
+        op.bulk_insert(table, [{'name': 'projections_latest', 'version': 1}])
+
+
+def downgrade() -> None:
+    op.drop_table('data_versions')